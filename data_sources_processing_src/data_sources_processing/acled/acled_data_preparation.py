@@ -40,6 +40,20 @@ countries_list = pd.read_csv(os.path.join("/data", "report_countries.csv"), head
 # start_date = "2017-01-01"
 end_date = "2030-01-01"
 
+# Individual events are also saved per country with compact dtypes, read by the dashboard events map
+events_by_country_folder_name = "events_by_country"
+# Events counts and fatalities per country, admin1, event type and month, used for the events map tooltips
+events_admin1_monthly_file_name = "events_admin1_monthly.parquet"
+events_by_country_columns = [
+    "country",
+    "admin1",
+    "event_date",
+    "latitude",
+    "longitude",
+    "event_type",
+    "fatalities",
+]
+
 mapping_countries = {
     "Congo DRC": "Democratic Republic of Congo",
     "Türkiye": "Turkey",
@@ -155,6 +169,98 @@ def _get_individual_events_targetting_civilians_df(
     number_of_fatalities_df_grp = df_clean.groupby(["country", "admin1", "event_date", "latitude", "longitude", "event_type"], as_index=False).agg({"fatalities": "sum"})
     number_of_fatalities_df_grp.to_csv(save_path, index=False)
 
+    _save_events_by_country(
+        number_of_fatalities_df_grp,
+        os.path.join(os.path.dirname(save_path), events_by_country_folder_name),
+    )
+    _save_events_admin1_monthly_cube(
+        number_of_fatalities_df_grp,
+        os.path.join(os.path.dirname(save_path), events_admin1_monthly_file_name),
+    )
+
+
+def _save_events_by_country(events_df: pd.DataFrame, save_folder_path: os.PathLike):
+    """
+    Inputs:
+    - events_df (pd.DataFrame): Individual events targetting civilians of all countries.
+    - save_folder_path (os.PathLike): Folder where one Parquet file per country is saved.
+
+    Outputs:
+    - None (Saves one '<country>.parquet' file per country.)
+
+    Operation:
+    1. Converts the events to compact dtypes: datetime64 dates, float32 coordinates, int32 fatalities and
+       categorical country, admin1 and event_type, with the dashboard country names.
+    2. Sorts the events by date, so that a date window is found with a binary search when reading them.
+    3. Saves the events of each country in its own file, written to a temporary file first and then renamed.
+    4. Removes the files of the countries without events anymore, so that their old events are not served.
+    """
+    os.makedirs(save_folder_path, exist_ok=True)
+
+    events_df = events_df[events_by_country_columns].copy()
+    events_df["country"] = events_df["country"].apply(lambda x: reversed_mapping_countries.get(x, x))
+    events_df["event_date"] = pd.to_datetime(events_df["event_date"])
+    events_df["latitude"] = events_df["latitude"].astype("float32")
+    events_df["longitude"] = events_df["longitude"].astype("float32")
+    events_df["fatalities"] = events_df["fatalities"].fillna(0).astype("int32")
+    events_df = events_df.sort_values("event_date", kind="stable")
+
+    saved_file_names = set()
+    for one_country, one_country_df in events_df.groupby("country", sort=False):
+        one_country_df = one_country_df.reset_index(drop=True)
+        for col in ["country", "admin1", "event_type"]:
+            # The missing values stay missing, not a "nan" category
+            one_country_df[col] = (
+                one_country_df[col].where(one_country_df[col].isna(), one_country_df[col].astype(str)).astype("category")
+            )
+
+        country_file_name = f"{one_country}.parquet"
+        country_file_path = os.path.join(save_folder_path, country_file_name)
+        one_country_df.to_parquet(f"{country_file_path}.tmp", engine="pyarrow", compression="zstd", index=False)
+        os.replace(f"{country_file_path}.tmp", country_file_path)
+        saved_file_names.add(country_file_name)
+
+    for file_name in os.listdir(save_folder_path):
+        if file_name.endswith(".parquet") and file_name not in saved_file_names:
+            os.remove(os.path.join(save_folder_path, file_name))
+            logger.info(f"Removed the ACLED events of {file_name[: -len('.parquet')]}, without events anymore")
+
+
+def _save_events_admin1_monthly_cube(events_df: pd.DataFrame, save_path: os.PathLike):
+    """
+    Inputs:
+    - events_df (pd.DataFrame): Individual events targetting civilians of all countries.
+    - save_path (os.PathLike): Path of the Parquet file to save.
+
+    Outputs:
+    - None (Saves the cube to 'save_path'.)
+
+    Operation:
+    1. Assigns each event to the first day of its month.
+    2. Counts the events and sums the fatalities per country, admin1, event type and month,
+       with the dashboard country names.
+    3. Saves the cube sorted by country and month, written to a temporary file first and then renamed.
+    """
+    events_df = events_df[["country", "admin1", "event_type", "event_date", "fatalities"]].copy()
+    events_df["country"] = events_df["country"].apply(lambda x: reversed_mapping_countries.get(x, x))
+    events_df["month"] = pd.to_datetime(events_df["event_date"]).dt.to_period("M").dt.to_timestamp()
+    events_df["fatalities"] = events_df["fatalities"].fillna(0)
+
+    cube_df = (
+        events_df.dropna(subset=["month"])
+        .groupby(["country", "admin1", "event_type", "month"], as_index=False)
+        .agg(events_count=("event_date", "count"), fatalities=("fatalities", "sum"))
+        .sort_values(["country", "month"], kind="stable")
+        .reset_index(drop=True)
+    )
+    cube_df["events_count"] = cube_df["events_count"].astype("int32")
+    cube_df["fatalities"] = cube_df["fatalities"].astype("int64")
+    for col in ["country", "admin1", "event_type"]:
+        cube_df[col] = cube_df[col].astype(str).astype("category")
+
+    cube_df.to_parquet(f"{save_path}.tmp", engine="pyarrow", compression="zstd", index=False)
+    os.replace(f"{save_path}.tmp", save_path)
+
 
 def get_acled_token(timeout: int = 60):
     """Fetch the ACLED auth token"""
@@ -296,7 +402,8 @@ def _get_acled_data(datasets_metadata: Dict[str, Any], data_output_path: os.Path
     3. Convert the 'all_data' list to a DataFrame, keeping only the 'needed_columns'.
     4. Ensure the 'year' column in the DataFrame is of integer type.
     5. Generate a CSV file of the number of events evolution and save it to the specified path.
-    6. Generate a CSV file of individual events targeting civilians and save it to the specified path.
+    6. Generate a CSV file of individual events targeting civilians and save it to the specified path,
+       along with one Parquet file of events per country and the monthly admin1 events cube.
     7. Return the input 'datasets_metadata'.
     """
 
@@ -40,9 +40,112 @@ def _get_ocha_hpc_data(datasets_metadata: Dict[str, Any], data_output_path: os.P
     )
     global_funding.to_csv(os.path.join(data_output_path, "ocha_hpc", datasets_metadata["global_funding"]), index=False)
     country_funding.to_csv(os.path.join(data_output_path, "ocha_hpc", datasets_metadata["country_funding"]), index=False)
+    global_kpis = _get_global_kpis(caseload_data, global_funding)
+    # Metadata files stored before the key indicators have no entry for them
+    global_kpis_file_name = datasets_metadata.get("global_kpis", "global_kpis.csv")
+    global_kpis.to_csv(os.path.join(data_output_path, "ocha_hpc", global_kpis_file_name), index=False)
     return datasets_metadata
 
 
+def _get_global_kpis(caseload_data: pd.DataFrame, global_funding: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes the key indicators of the dashboard Global Overview for every year, so that the page only looks up a row.
+
+    Args:
+    - caseload_data (pd.DataFrame): Caseloads of the plans, as returned by '_get_key_pin_informations_all_years'.
+    - global_funding (pd.DataFrame): Global funding of each year, as returned by '_get_key_pin_informations_all_years'.
+
+    Returns:
+    - pd.DataFrame: One row per year with the columns:
+    - 'children_in_need' and 'n_countries_children_in_need': Total CP caseload in need and number of countries.
+    - 'ratio_children_in_need_to_pop_in_need' and 'n_countries_children_in_need_to_pop_in_need':
+      CP caseload in need vs total population in need, over the plans reporting both.
+    - 'ratio_children_targeted_to_children_in_need' and 'n_countries_children_targeted_to_children_in_need':
+      Targeted children vs CP caseload in need, over the plans reporting both.
+    - 'cp_beneficiaries', 'ratio_global_funding' and 'total_countries': Reached beneficiaries, received vs requested
+      funding and number of countries of the global funding.
+
+    Operation:
+    1. Sums the caseloads of every plan of the year, the ratios only summing the plans reporting both of their values.
+    2. Divides the sums, a ratio being 0 when its denominator is.
+    3. Adds the global funding figures of the year, the years without caseloads having 0 children in need.
+    """
+    kpis_columns = [
+        "year",
+        "children_in_need",
+        "n_countries_children_in_need",
+        "ratio_children_in_need_to_pop_in_need",
+        "n_countries_children_in_need_to_pop_in_need",
+        "ratio_children_targeted_to_children_in_need",
+        "n_countries_children_targeted_to_children_in_need",
+        "cp_beneficiaries",
+        "ratio_global_funding",
+        "total_countries",
+    ]
+    pin_kpis_columns = kpis_columns[1:7]
+    funding_kpis_columns = kpis_columns[7:]
+
+    pin_kpis = pd.DataFrame(columns=pin_kpis_columns, index=pd.Index([], name="year"))
+    if len(caseload_data):
+        df = caseload_data[
+            (~caseload_data["children_in_need"].isna())
+            | (~caseload_data["targeted_children"].isna())
+            | (~caseload_data["tot_pop_in_need"].isna())
+        ]
+        has_pop_in_need = df["children_in_need"].notna() & df["tot_pop_in_need"].notna()
+        has_targeted = df["children_in_need"].notna() & df["targeted_children"].notna()
+        sums = (
+            pd.DataFrame(
+                {
+                    "year": df["year"],
+                    "country": df["country"],
+                    "children_in_need": df["children_in_need"],
+                    "pop_in_need_country": df["country"].where(has_pop_in_need),
+                    "pop_in_need_children": df["children_in_need"].where(has_pop_in_need),
+                    "pop_in_need": df["tot_pop_in_need"].where(has_pop_in_need),
+                    "targeted_country": df["country"].where(has_targeted),
+                    "targeted_children_in_need": df["children_in_need"].where(has_targeted),
+                    "targeted_children": df["targeted_children"].where(has_targeted),
+                }
+            )
+            .groupby("year")
+            .agg(
+                children_in_need=("children_in_need", "sum"),
+                n_countries_children_in_need=("country", "nunique"),
+                pop_in_need_children=("pop_in_need_children", "sum"),
+                pop_in_need=("pop_in_need", "sum"),
+                n_countries_children_in_need_to_pop_in_need=("pop_in_need_country", "nunique"),
+                targeted_children_in_need=("targeted_children_in_need", "sum"),
+                targeted_children=("targeted_children", "sum"),
+                n_countries_children_targeted_to_children_in_need=("targeted_country", "nunique"),
+            )
+        )
+        sums["ratio_children_in_need_to_pop_in_need"] = _get_ratio(sums["pop_in_need_children"], sums["pop_in_need"])
+        sums["ratio_children_targeted_to_children_in_need"] = _get_ratio(
+            sums["targeted_children"], sums["targeted_children_in_need"]
+        )
+        pin_kpis = sums[pin_kpis_columns]
+
+    funding_kpis = pd.DataFrame(columns=funding_kpis_columns, index=pd.Index([], name="year"))
+    if len(global_funding):
+        funding_kpis = global_funding.set_index("year")
+        funding_kpis["ratio_global_funding"] = _get_ratio(
+            funding_kpis["funding_received"], funding_kpis["funding_requested"]
+        )
+        funding_kpis = funding_kpis[funding_kpis_columns]
+
+    global_kpis = pin_kpis.join(funding_kpis, how="outer")
+    # Years without caseloads are shown with no children in need, like the per-visit computation did
+    global_kpis[pin_kpis_columns] = global_kpis[pin_kpis_columns].fillna(0)
+
+    return global_kpis.reset_index()[kpis_columns]
+
+
+def _get_ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """Divide two series, the ratio being 0 where the denominator is not positive"""
+    return (numerator / denominator.where(denominator > 0)).fillna(0)
+
+
 def _get_key_pin_informations_all_years():
     """
     Retrieves key PIN (People in Need) information aggregated across multiple years.
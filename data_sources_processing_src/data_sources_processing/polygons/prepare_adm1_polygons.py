@@ -0,0 +1,184 @@
+"""
+Splits the ADM1 GeoPackage into the simplified GeoJSON file of each report country, read by the dashboard maps.
+
+The GeoPackage is streamed a single time and the countries are simplified in parallel.
+It runs with the datasets update when `adm1_polygons.gpkg` or the countries list changed, or by hand:
+
+    python -m data_sources_processing.polygons.prepare_adm1_polygons --data_folder /data
+"""
+
+import argparse
+import json
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import fiona
+import pandas as pd
+from shapely.geometry import mapping, shape
+
+logging.basicConfig(
+    level=logging.DEBUG,  # Set the logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log message format
+)
+logger = logging.getLogger(__name__)
+
+# GeoPackage country names -> dashboard country names, the same as the dashboard's `load_geodata.countries_mapping`
+countries_mapping = {
+    "Venezuela (Bolivarian Republic of)": "Venezuela",
+    "Syrian Arab Republic": "Syria",
+    "Iran (Islamic Republic of)": "Iran",
+}
+
+# Simplification tolerance (in degrees) of the regions, the same as the dashboard's `load_geodata.adm1_tolerance`
+adm1_tolerance = 0.05
+
+
+def _get_adm1_polygons_file_path(geolocation_processed_data_path: os.PathLike, country: str) -> str:
+    return os.path.join(geolocation_processed_data_path, "adm1_polygons", f"{country.replace('/', '-')}.geojson")
+
+
+def _split_adm1_features_by_country(
+    gpkg_file_path: os.PathLike, countries: List[str]
+) -> Dict[str, List[Tuple[Any, str, Dict[str, Any]]]]:
+    """
+    Reads the GeoPackage once and groups the (feature id, adm1 name, geometry) of the regions by report country.
+    The geometries are converted to plain GeoJSON mappings, sent as they are to the simplification processes.
+    """
+    countries = set(countries)
+    adm1_features = defaultdict(list)
+    with fiona.open(gpkg_file_path, vfs="{}".format(gpkg_file_path), enabled_drivers="GeoJSON") as src:
+        for feature in src:
+            country_name = feature["properties"]["adm0_name"]
+            country_name = countries_mapping.get(country_name, country_name)
+
+            if country_name in countries:
+                adm1_features[country_name].append(
+                    (feature["id"], feature["properties"]["adm1_name"], dict(feature["geometry"]))
+                )
+
+    return adm1_features
+
+
+def _build_adm1_geojson_data(adm1_features: List[Tuple[Any, str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Simplifies the regions of a country into the GeoJSON data read by the dashboard.
+
+    Parameters:
+    adm1_features (List[Tuple[Any, str, Dict[str, Any]]]): The (feature id, adm1 name, GeoJSON geometry) of each region.
+
+    Returns:
+    dict: The feature collection of the regions simplified with `adm1_tolerance` under "geojson",
+    and the bounds of the country under "extreme_points".
+    """
+    features = []
+    extreme_points = {"minx": None, "miny": None, "maxx": None, "maxy": None}
+    for feature_id, adm1_name, geometry in adm1_features:
+        polygon = shape(geometry)
+        features.append(
+            {
+                "type": feature_id,
+                "properties": {"name": adm1_name},
+                "geometry": mapping(polygon.simplify(tolerance=adm1_tolerance, preserve_topology=True)),
+            }
+        )
+
+        minx, miny, maxx, maxy = polygon.bounds
+        if extreme_points["minx"] is None:
+            extreme_points = {"minx": minx, "miny": miny, "maxx": maxx, "maxy": maxy}
+        else:
+            extreme_points = {
+                "minx": min(extreme_points["minx"], minx),
+                "miny": min(extreme_points["miny"], miny),
+                "maxx": max(extreme_points["maxx"], maxx),
+                "maxy": max(extreme_points["maxy"], maxy),
+            }
+
+    return {"geojson": {"type": "FeatureCollection", "features": features}, "extreme_points": extreme_points}
+
+
+def _write_country_adm1_polygons(
+    country: str, adm1_features: List[Tuple[Any, str, Dict[str, Any]]], geolocation_processed_data_path: os.PathLike
+) -> Tuple[str, int]:
+    """
+    Simplifies the regions of a country and saves them with the extreme points of the country,
+    written to a temporary file first so that the dashboard never reads a partial file.
+    """
+    file_path = _get_adm1_polygons_file_path(geolocation_processed_data_path, country)
+    with open(f"{file_path}.tmp", "w") as f:
+        json.dump(_build_adm1_geojson_data(adm1_features), f)
+    os.replace(f"{file_path}.tmp", file_path)
+    return country, len(adm1_features)
+
+
+def _are_adm1_polygons_up_to_date(
+    countries: List[str], input_file_paths: List[os.PathLike], geolocation_processed_data_path: os.PathLike
+) -> bool:
+    """
+    Checks that the file of every country exists and is more recent than the GeoPackage and the countries list.
+    """
+    inputs_time = max(os.path.getmtime(file_path) for file_path in input_file_paths)
+    for country in countries:
+        file_path = _get_adm1_polygons_file_path(geolocation_processed_data_path, country)
+        if not os.path.exists(file_path) or os.path.getmtime(file_path) < inputs_time:
+            return False
+    return True
+
+
+def _prepare_adm1_polygons(data_folder: os.PathLike, n_workers: int, force: bool = False):
+    """
+    Writes the simplified ADM1 GeoJSON file of every report country.
+
+    Parameters:
+    data_folder (os.PathLike): The data folder, containing 'report_countries.csv' and 'polygons_data'.
+    n_workers (int): Number of processes simplifying the countries in parallel.
+    force (bool): Whether to write the files even if they are more recent than the GeoPackage and the countries list.
+
+    Operation:
+    1. Reads the list of report countries, stops if the files of all of them are up to date.
+    2. Streams the ADM1 GeoPackage once, keeping the regions of the report countries.
+    3. Simplifies and saves the regions of each country in a pool of processes.
+       Countries without regions get an empty file, like when the dashboard extracts them itself.
+    """
+    countries_path = os.path.join(data_folder, "report_countries.csv")
+    polygons_data_path = os.path.join(data_folder, "polygons_data")
+    gpkg_file_path = os.path.join(polygons_data_path, "adm1_polygons.gpkg")
+    geolocation_processed_data_path = os.path.join(polygons_data_path, "processed_data")
+
+    if not os.path.exists(gpkg_file_path):
+        logger.warning(f"ADM1 GeoPackage not found at {gpkg_file_path}, the ADM1 polygons are not prepared.")
+        return
+
+    countries = pd.read_csv(countries_path, header=None, names=["country"]).country.tolist()
+    if not force and _are_adm1_polygons_up_to_date(
+        countries, [gpkg_file_path, countries_path], geolocation_processed_data_path
+    ):
+        logger.info("ADM1 polygons are already up to date.")
+        return
+
+    os.makedirs(os.path.dirname(_get_adm1_polygons_file_path(geolocation_processed_data_path, "")), exist_ok=True)
+
+    adm1_features = _split_adm1_features_by_country(gpkg_file_path, countries)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(
+                _write_country_adm1_polygons, country, adm1_features.get(country, []), geolocation_processed_data_path
+            )
+            for country in countries
+        ]
+        for future in futures:
+            country, n_regions = future.result()
+            logger.info(f"ADM1 polygons of {country} saved ({n_regions} regions)")
+
+
+if __name__ == "__main__":
+    args = argparse.ArgumentParser()
+    args.add_argument("--data_folder", type=str, default="/data")
+    args.add_argument("--n_workers", type=int, default=os.cpu_count())
+
+    parsed_args = args.parse_args()
+
+    _prepare_adm1_polygons(parsed_args.data_folder, parsed_args.n_workers, force=True)
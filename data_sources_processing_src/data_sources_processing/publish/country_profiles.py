@@ -0,0 +1,136 @@
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from data_sources_processing.publish.store_files import _write_mapped_store_file
+
+logging.basicConfig(
+    level=logging.DEBUG,  # Set the logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log message format
+)
+logger = logging.getLogger(__name__)
+
+country_profiles_folder_name = "country_profiles"
+
+
+def _get_protection_panel(tables: Dict[str, pd.DataFrame], country: str) -> Optional[pd.DataFrame]:
+    df = tables.get("acaps_protection_indicators")
+    if df is None:
+        return None
+    return df[df["Country"] == country].drop(columns="Country").reset_index(drop=True)
+
+
+def _get_legal_framework_panel(tables: Dict[str, pd.DataFrame], country: str) -> Optional[pd.DataFrame]:
+    df = tables.get("ohchr_legal_framework")
+    if df is None:
+        return None
+    return df[df["Country"] == country].reset_index(drop=True)
+
+
+def _get_unicef_indicators_panel(tables: Dict[str, pd.DataFrame], country: str) -> Optional[pd.DataFrame]:
+    df = tables.get("unicef_indicators")
+    if df is None:
+        return None
+    return df[df["Geographic area"] == country].reset_index(drop=True)
+
+
+def _get_ipc_panel(tables: Dict[str, pd.DataFrame], country: str) -> Optional[pd.DataFrame]:
+    """
+    Current Phase 3+ food insecurity numbers of the country, with the column names shown by the dashboard.
+    """
+    df = tables.get("ipc")
+    if df is None:
+        return None
+    df = df[(df["Country"] == country) & (df["Validity period"] == "current") & (df["Phase"] == "3+")]
+    df = df[["Date of analysis", "Country abrv", "Level 1", "Validity period", "Phase", "Number", "Country"]].rename(
+        columns={
+            "Level 1": "Region Name",
+            "Number": "Number of Food Insecure People",
+        }
+    )
+    df["Number of Food Insecure People"] = df["Number of Food Insecure People"].astype(int)
+    return df.reset_index(drop=True)
+
+
+def _get_idmc_panel(tables: Dict[str, pd.DataFrame], country: str) -> Optional[pd.DataFrame]:
+    df = tables.get("idmc")
+    if df is None:
+        return None
+    return df[df["Country"] == country].reset_index(drop=True)
+
+
+def _get_acled_number_events_panel(tables: Dict[str, pd.DataFrame], country: str) -> Optional[pd.DataFrame]:
+    df = tables.get("acled_number_events_evolution")
+    if df is None:
+        return None
+    return df[df["country"] == country].reset_index(drop=True)
+
+
+# Panel name -> function building the frame of one country from the published tables, None if its table is missing
+country_profile_panels: Dict[str, Callable[[Dict[str, pd.DataFrame], str], Optional[pd.DataFrame]]] = {
+    "protection": _get_protection_panel,
+    "legal_framework": _get_legal_framework_panel,
+    "unicef_indicators": _get_unicef_indicators_panel,
+    "ipc": _get_ipc_panel,
+    "idmc": _get_idmc_panel,
+    "acled_number_events_evolution": _get_acled_number_events_panel,
+}
+
+
+def _get_country_profile_scalars(panels: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+    """
+    Returns the last update dates shown in the panel titles, computed the same way as by the dashboard.
+    """
+    scalars = {}
+    if "protection" in panels:
+        max_date = panels["protection"]["Source Date"].max()
+        scalars["protection_last_update"] = "-" if pd.isna(max_date) else max_date.strftime("%m-%Y")
+    if "legal_framework" in panels:
+        max_date = panels["legal_framework"]["Formatted Submitted Date"].max()
+        scalars["legal_framework_last_update"] = "-" if pd.isna(max_date) else max_date.strftime("%b %Y")
+    return scalars
+
+
+def _publish_country_profile_bundles(
+    tables: Dict[str, pd.DataFrame], countries: List[str], snapshot_path: os.PathLike
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Inputs:
+    - tables (Dict[str, pd.DataFrame]): Tables of the snapshot, as written to its Arrow IPC files.
+    - countries (List[str]): Countries of the report.
+    - snapshot_path (os.PathLike): Path to the snapshot folder being written.
+
+    Outputs:
+    - Dict[str, Dict[str, Any]]: Profile of each country, with the Arrow IPC file of each of its panels under 'panels',
+      relative to the snapshot folder, and the values shown in the panel titles under 'scalars'.
+
+    Operation:
+    1. Builds the frames of every panel of `country_profile_panels` for each country, already filtered and renamed.
+    2. Computes the last update dates shown in the panel titles.
+    3. Writes each panel as an Arrow IPC file in the folder of the country, memory-mapped by the dashboard like the
+       tables, so that the Country Profile only reads the rows of the selected country.
+    """
+    bundles_infos = {}
+    for country in countries:
+        country_folder_name = os.path.join(country_profiles_folder_name, country)
+        os.makedirs(os.path.join(snapshot_path, country_folder_name), exist_ok=True)
+
+        panels = {}
+        panels_files = {}
+        for panel_name, panel_function in country_profile_panels.items():
+            try:
+                df = panel_function(tables, country)
+            except Exception as e:
+                logger.error(f"Error preparing the {panel_name} panel of {country}: {e}")
+                continue
+            if df is not None:
+                panels[panel_name] = df
+                panels_files[panel_name] = os.path.join(country_folder_name, f"{panel_name}.arrow")
+                _write_mapped_store_file(df, os.path.join(snapshot_path, panels_files[panel_name]))
+
+        bundles_infos[country] = {"panels": panels_files, "scalars": _get_country_profile_scalars(panels)}
+
+    logger.info(f"Published the profile bundles of {len(bundles_infos)} countries")
+    return bundles_infos
@@ -0,0 +1,439 @@
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from data_sources_processing.ocha_hpc.ocha_hpc_data_preparation import _get_global_kpis
+from data_sources_processing.publish.country_profiles import _publish_country_profile_bundles
+from data_sources_processing.publish.store_files import _write_mapped_store_file
+
+logging.basicConfig(
+    level=logging.DEBUG,  # Set the logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log message format
+)
+logger = logging.getLogger(__name__)
+
+published_folder_name = "published"
+latest_snapshot_file_name = "latest.json"
+# Microseconds and the process id keep the names of snapshots published in the same second apart, in time order
+snapshot_time_format = "%Y%m%d-%H%M%S-%f"
+
+# Older snapshots are kept so that app replicas still reading them are not broken by the next publish
+n_kept_snapshots = 2
+
+# Version of the snapshot layout, a snapshot of an older layout is published again even if the sources did not change
+published_format_version = 2
+
+# Same country renames as the ones the dashboard applies when reading the raw files
+inform_severity_countries_mapping = {"DRC": "Congo DRC", "CAR": "Central African Republic"}
+idmc_countries_mapping = {"Dem. Rep. Congo": "Congo DRC"}
+acled_countries_mapping = {
+    "Democratic Republic of Congo": "Congo DRC",
+    "eSwatini": "Eswatini",
+    "Turkey": "Türkiye",
+}
+
+# IPC country abbreviations -> dashboard country names, the dashboard only reading the IPC countries from the snapshot
+ipc_countries_mapping = {
+    "AFG": "Afghanistan",
+    "BAN": "Bangladesh",
+    "BFA": "Burkina Faso",
+    "BDI": "Burundi",
+    "CMR": "Cameroon",
+    "CAR": "Central African Republic",
+    "CHA": "Chad",
+    "COL": "Colombia",
+    "COD": "Congo DRC",
+    "ECU": "Ecuador",
+    "SLV": "El Salvador",
+    "ETH": "Ethiopia",
+    "GTM": "Guatemala",
+    "HTI": "Haiti",
+    "HON": "Honduras",
+    "IRN": "Iran",
+    "IRQ": "Iraq",
+    "JOR": "Jordan",
+    "KEN": "Kenya",
+    "LBN": "Lebanon",
+    "LBY": "Libya",
+    "MAD": "Madagascar",
+    "MWI": "Malawi",
+    "MLI": "Mali",
+    "MEX": "Mexico",
+    "MOZ": "Mozambique",
+    "MMR": "Myanmar",
+    "NEP": "Nepal",
+    "NIC": "Nicaragua",
+    "NIG": "Niger",
+    "NGA": "Nigeria",
+    "PAK": "Pakistan",
+    "PAL": "Palestine",
+    "PER": "Peru",
+    "PHI": "Philippines",
+    "SOM": "Somalia",
+    "SSD": "South Sudan",
+    "SUD": "Sudan",
+    "SYR": "Syria",
+    "TUR": "Türkiye",
+    "UKR": "Ukraine",
+    "VEN": "Venezuela",
+    "YEM": "Yemen",
+    "ZIM": "Zimbabwe",
+}
+
+# Published table name -> (sheet name, header row, initial row number, sheet layout)
+inform_severity_sheets = {
+    "inform_severity_country": ("INFORM Severity - country", 1, 2, "country"),
+    "inform_severity_all_crises": ("INFORM Severity - all crises", 1, 2, "many_empty_rows"),
+    "inform_severity_impact": ("Impact of the crisis", 1, 3, "many_empty_rows"),
+    "inform_severity_complexity": ("Complexity of the crisis", 1, 3, "many_empty_rows"),
+    "inform_severity_conditions": ("Conditions of people affected", 1, 3, "many_empty_rows"),
+    "inform_severity_crisis_indicators": ("Crisis Indicator Data", 0, 1, "few_empty_rows"),
+}
+
+
+def _to_columnar_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Makes a DataFrame writable as a typed columnar table.
+
+    Operation:
+    1. Converts the column names to strings.
+    2. Leaves untouched the object columns that Arrow can type on its own.
+    3. Converts the mixed object columns to numbers when every value is numeric, otherwise to strings.
+    """
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+
+    for col in df.select_dtypes(include="object").columns:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            numeric_values = pd.to_numeric(df[col], errors="coerce")
+            if numeric_values.notna().sum() == df[col].notna().sum():
+                df[col] = numeric_values
+            else:
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+
+    return df
+
+
+def _prepare_inform_severity_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """
+    Inputs:
+    - datasources_path (os.PathLike): Path to the processed data sources folder.
+
+    Outputs:
+    - Dict[str, pd.DataFrame]: One table per INFORM Severity sheet used by the dashboard, empty if the file is missing.
+
+    Operation:
+    1. Opens the INFORM Severity workbook a single time.
+    2. Applies the header offsets, column renames, country renames and 'x' replacements of each sheet.
+    3. Parses the 'Last updated' column of the country sheet.
+    """
+    file_path = os.path.join(datasources_path, "acaps_inform_severity", "INFORM Severity latest.xlsx")
+    if not os.path.exists(file_path):
+        return {}
+
+    tables = {}
+    with pd.ExcelFile(file_path) as workbook:
+        for table_name, (sheet_name, header, initial_row_number, sheet_layout) in inform_severity_sheets.items():
+            df = workbook.parse(sheet_name=sheet_name, header=header).iloc[initial_row_number:]
+            if sheet_layout == "many_empty_rows":
+                df = df.rename(
+                    columns={
+                        "Unnamed: 0": "CRISIS",
+                        "Unnamed: 1": "DRIVERS",
+                        "Unnamed: 2": "CRISIS ID",
+                        "Unnamed: 3": "COUNTRY",
+                        "Unnamed: 4": "Iso3",
+                    }
+                ).replace("x", 0)
+            elif sheet_layout == "few_empty_rows":
+                df = df.rename(columns={"Crisis": "CRISIS"})
+
+            df = df.rename(columns={col: col.strip() for col in df.columns if isinstance(col, str)})
+            if "COUNTRY" in df.columns:
+                df["COUNTRY"] = df["COUNTRY"].apply(lambda x: inform_severity_countries_mapping.get(x, x))
+
+            tables[table_name] = df
+
+    df_countries = tables["inform_severity_country"]
+    df_countries["Last updated"] = pd.to_datetime(df_countries["Last updated"])
+    tables["inform_severity_country"] = df_countries.rename(
+        columns={"INFORM Severity category.1": "INFORM Severity category name"}
+    )
+
+    return tables
+
+
+def _prepare_idmc_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """IDMC displacement estimates, with the dashboard country names."""
+    file_path = os.path.join(datasources_path, "idmc", "IDMC_Internal_Displacement_Conflict-Violence_Disasters.xlsx")
+    if not os.path.exists(file_path):
+        return {}
+
+    df = pd.read_excel(file_path, sheet_name="3_IDPs_SADD_estimates")
+    df["Country"] = df["Country"].apply(lambda x: idmc_countries_mapping.get(x, x))
+    return {"idmc": df}
+
+
+def _prepare_ipc_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """IPC food insecurity numbers, without the HXL tags row, with the country names next to their abbreviations."""
+    file_path = os.path.join(datasources_path, "ipc", "ipc_global_level1_long.csv")
+    if not os.path.exists(file_path):
+        return {}
+
+    df = pd.read_csv(file_path, skiprows=[1]).rename(columns={"Country": "Country abrv"})
+    df["Country"] = df["Country abrv"].apply(lambda x: ipc_countries_mapping.get(x, x))
+    return {"ipc": df}
+
+
+def _prepare_ocha_hpc_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """
+    OCHA HPC people in need, funding and Global Overview key indicators tables, the key indicators being computed
+    from the two others when their file is missing.
+    """
+    file_names = {
+        "ocha_hpc_pin": "OCHA PIN.csv",
+        "ocha_hpc_global_funding": "global_funding.csv",
+        "ocha_hpc_country_funding": "country_funding.csv",
+        "ocha_hpc_global_kpis": "global_kpis.csv",
+    }
+
+    tables = {}
+    for table_name, file_name in file_names.items():
+        file_path = os.path.join(datasources_path, "ocha_hpc", file_name)
+        if os.path.exists(file_path):
+            tables[table_name] = pd.read_csv(file_path)
+
+    if "ocha_hpc_global_kpis" not in tables and {"ocha_hpc_pin", "ocha_hpc_global_funding"} <= tables.keys():
+        # Not written by the OCHA HPC step before it computed the key indicators, or if it failed since
+        tables["ocha_hpc_global_kpis"] = _get_global_kpis(tables["ocha_hpc_pin"], tables["ocha_hpc_global_funding"])
+    return tables
+
+
+def _prepare_acled_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """ACLED events tables, with the dashboard country names and parsed event dates."""
+    file_names = {
+        "acled_number_events_evolution": "number_events_evolution.csv",
+        "acled_individual_events_targetting_civilians": "individual_events_targetting_civilians_new.csv",
+    }
+
+    tables = {}
+    for table_name, file_name in file_names.items():
+        file_path = os.path.join(datasources_path, "acled", file_name)
+        if not os.path.exists(file_path):
+            continue
+
+        df = pd.read_csv(file_path)
+        df["country"] = df["country"].replace(acled_countries_mapping)
+        if "event_date" in df.columns:
+            df["event_date"] = pd.to_datetime(df["event_date"])
+        tables[table_name] = df
+    return tables
+
+
+def _prepare_protection_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """
+    Inputs:
+    - datasources_path (os.PathLike): Path to the processed data sources folder.
+
+    Outputs:
+    - Dict[str, pd.DataFrame]: The protection summaries of all countries in one table, with a 'Country' column.
+
+    Operation:
+    1. Reads the summaries CSV of each country.
+    2. Parses the 'Source Date' column.
+    3. Concatenates the countries into a single table.
+    """
+    folder_path = os.path.join(datasources_path, "acaps_protection_indicators", "processed_data")
+    if not os.path.isdir(folder_path):
+        return {}
+
+    country_dfs = []
+    for file_name in sorted(os.listdir(folder_path)):
+        if not file_name.endswith(".csv"):
+            continue
+        df = pd.read_csv(os.path.join(folder_path, file_name))
+        df["Source Date"] = pd.to_datetime(df["Source Date"], format="mixed")
+        df["Country"] = file_name.replace(".csv", "")
+        country_dfs.append(df)
+
+    if len(country_dfs) == 0:
+        return {}
+
+    return {"acaps_protection_indicators": pd.concat(country_dfs, ignore_index=True)}
+
+
+def _prepare_ohchr_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """
+    Inputs:
+    - datasources_path (os.PathLike): Path to the processed data sources folder.
+
+    Outputs:
+    - Dict[str, pd.DataFrame]: The legal framework summaries of all countries in one table, with a 'Country' column.
+
+    Operation:
+    1. Reads the results workbook of each country and forward fills its merged cells.
+    2. Parses the 'Submitted Date' column into 'Formatted Submitted Date', '-' dates being left empty.
+    3. Concatenates the countries into a single table.
+    """
+    folder_path = os.path.join(datasources_path, "ohchr", "results")
+    if not os.path.isdir(folder_path):
+        return {}
+
+    country_dfs = []
+    for file_name in sorted(os.listdir(folder_path)):
+        if not file_name.endswith(".xlsx"):
+            continue
+        df = pd.read_excel(os.path.join(folder_path, file_name)).ffill()
+        df["Formatted Submitted Date"] = pd.to_datetime(
+            df["Submitted Date"].where(df["Submitted Date"] != "-"), format="%d %b %Y"
+        )
+        df["Country"] = file_name.replace(".xlsx", "")
+        country_dfs.append(df)
+
+    if len(country_dfs) == 0:
+        return {}
+
+    return {"ohchr_legal_framework": pd.concat(country_dfs, ignore_index=True)}
+
+
+def _prepare_unicef_tables(datasources_path: os.PathLike) -> Dict[str, pd.DataFrame]:
+    """UNICEF indicator store, already normalised by the UNICEF processing step."""
+    file_path = os.path.join(datasources_path, "unicef", "unicef_indicators.csv")
+    if not os.path.exists(file_path):
+        return {}
+
+    return {"unicef_indicators": pd.read_csv(file_path)}
+
+
+tables_preparation_functions: List[Callable[[os.PathLike], Dict[str, pd.DataFrame]]] = [
+    _prepare_inform_severity_tables,
+    _prepare_idmc_tables,
+    _prepare_ipc_tables,
+    _prepare_ocha_hpc_tables,
+    _prepare_acled_tables,
+    _prepare_protection_tables,
+    _prepare_ohchr_tables,
+    _prepare_unicef_tables,
+]
+
+
+def _get_sources_signature(datasources_path: os.PathLike) -> Dict[str, List[int]]:
+    """
+    Returns the modification time and size of every file under the data sources folder, published snapshots excluded.
+    """
+    signature = {}
+    for root, dirs, files in os.walk(datasources_path):
+        if root == str(datasources_path):
+            dirs[:] = [d for d in dirs if d != published_folder_name]
+        for file_name in files:
+            file_path = os.path.join(root, file_name)
+            file_stats = os.stat(file_path)
+            signature[os.path.relpath(file_path, datasources_path)] = [file_stats.st_mtime_ns, file_stats.st_size]
+    return signature
+
+
+def _read_latest_snapshot_infos(published_path: os.PathLike) -> Optional[Dict[str, Any]]:
+    latest_snapshot_path = os.path.join(published_path, latest_snapshot_file_name)
+    if not os.path.exists(latest_snapshot_path):
+        return None
+    with open(latest_snapshot_path, "r") as file:
+        return json.load(file)
+
+
+def _remove_old_snapshots(published_path: os.PathLike, latest_snapshot_name: str):
+    """
+    Removes the snapshots older than the `n_kept_snapshots` most recent ones, never the latest one.
+    """
+    snapshot_names = sorted(
+        name
+        for name in os.listdir(published_path)
+        if os.path.isdir(os.path.join(published_path, name)) and not name.startswith(".")
+    )
+    for snapshot_name in snapshot_names[:-n_kept_snapshots]:
+        if snapshot_name != latest_snapshot_name:
+            shutil.rmtree(os.path.join(published_path, snapshot_name), ignore_errors=True)
+            logger.info(f"Removed old published snapshot {snapshot_name}")
+
+
+def _publish_datasets(datasources_path: os.PathLike) -> Optional[str]:
+    """
+    Inputs:
+    - datasources_path (os.PathLike): Path to the processed data sources folder.
+
+    Outputs:
+    - Optional[str]: Name of the published snapshot, None if the sources did not change since the last one.
+
+    Operation:
+    1. Compares the sources files and the layout version with the ones of the latest snapshot, stops if nothing changed.
+    2. Builds every table with the renames, country mappings and date parsing done by the dashboard at read time.
+    3. Writes the tables as uncompressed Arrow IPC files, memory-mapped by the dashboard, into a new snapshot folder,
+       which is only renamed to its final name once complete.
+    4. Writes the profile bundle of each report country into the same folder, see `_publish_country_profile_bundles`.
+    5. Atomically points 'latest.json' to the new snapshot, so readers always see a complete snapshot.
+    6. Removes the oldest snapshots.
+    """
+    published_path = os.path.join(datasources_path, published_folder_name)
+    os.makedirs(published_path, exist_ok=True)
+
+    sources_signature = _get_sources_signature(datasources_path)
+    latest_snapshot_infos = _read_latest_snapshot_infos(published_path)
+    if (
+        latest_snapshot_infos is not None
+        and latest_snapshot_infos.get("format") == published_format_version
+        and latest_snapshot_infos.get("sources") == sources_signature
+    ):
+        logger.info("Published snapshot is already up to date.")
+        return None
+
+    snapshot_name = f"{datetime.now().strftime(snapshot_time_format)}-{os.getpid()}"
+    tmp_snapshot_path = os.path.join(published_path, f".{snapshot_name}.tmp")
+    os.makedirs(tmp_snapshot_path)
+
+    tables_infos = {}
+    published_tables = {}
+    for preparation_function in tables_preparation_functions:
+        try:
+            tables = preparation_function(datasources_path)
+        except Exception as e:
+            logger.error(f"Error preparing tables with {preparation_function.__name__}: {e}")
+            continue
+
+        for table_name, df in tables.items():
+            published_tables[table_name] = _to_columnar_compatible(df)
+            store_file_name = f"{table_name}.arrow"
+            _write_mapped_store_file(published_tables[table_name], os.path.join(tmp_snapshot_path, store_file_name))
+            tables_infos[table_name] = {"store_file": store_file_name, "rows": len(df)}
+            logger.info(f"Published table {table_name} ({len(df)} rows)")
+
+    country_profiles_infos = {}
+    countries_path = os.path.join(datasources_path, "..", "report_countries.csv")
+    if os.path.exists(countries_path):
+        countries = pd.read_csv(countries_path, header=None)[0].tolist()
+        country_profiles_infos = _publish_country_profile_bundles(published_tables, countries, tmp_snapshot_path)
+
+    os.replace(tmp_snapshot_path, os.path.join(published_path, snapshot_name))
+
+    snapshot_infos = {
+        "snapshot": snapshot_name,
+        "format": published_format_version,
+        "published_time": datetime.now().isoformat(timespec="seconds"),
+        "tables": tables_infos,
+        "country_profiles": country_profiles_infos,
+        "sources": sources_signature,
+    }
+    tmp_latest_snapshot_path = os.path.join(published_path, f".{latest_snapshot_file_name}.tmp")
+    with open(tmp_latest_snapshot_path, "w") as file:
+        json.dump(snapshot_infos, file, indent=4)
+    os.replace(tmp_latest_snapshot_path, os.path.join(published_path, latest_snapshot_file_name))
+
+    _remove_old_snapshots(published_path, snapshot_name)
+
+    return snapshot_name
@@ -0,0 +1,26 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+
+def _write_mapped_store_file(df: pd.DataFrame, file_path: os.PathLike):
+    """
+    Writes a table as an uncompressed Arrow IPC file. The dashboard replicas memory-map it instead of reading it,
+    so that the replicas of a node share the same pages of the page cache.
+
+    The strings are written with 64-bit offsets, the layout of the pandas 'string[pyarrow]' columns, so that the
+    dashboard frames reference the mapped buffers instead of converting them.
+
+    The file is not compressed: the buffers of a compressed IPC file are decompressed into the memory of each
+    replica, which would lose both the sharing and the zero-copy reads.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.cast(
+        pa.schema(
+            [field.with_type(pa.large_string()) if field.type == pa.string() else field for field in table.schema],
+            metadata=table.schema.metadata,
+        )
+    )
+    with pa.OSFile(str(file_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
@@ -0,0 +1,175 @@
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import requests
+
+logging.basicConfig(
+    level=logging.DEBUG,  # Set the logging level
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",  # Log message format
+)
+logger = logging.getLogger(__name__)
+
+sdmx_data_url = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.{indicator_codes}._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
+
+# Indicator codes of the UNICEF Global Database fetched for each dataset of the indicator store
+unicef_datasets_indicators = {
+    "out_of_school_rate": ["ED_ROFST_L3", "ED_ROFST_L1_ADM", "ED_ROFST_L2"],
+    "nb_deprivations": ["PV_CHLD_DPRV-AVG-S-HS"],
+    "refugee_host_per_country": ["MG_RFGS_CNTRY_ASYLM_PER1000"],
+    "children_detention_rate": ["PT_CHLD_DN"],
+    "children_residential_care_rate": ["PT_CHLD_RES-CARE"],
+    "percentage_adults_think_physical_punishement_good": ["PT_ADLT_PS_NEC"],
+    "percentage_sexual_violence": ["PT_F_18-29_SX-V_AGE-18", "PT_M_18-29_SX-V_AGE-18"],
+    "young_women_married": ["PT_F_20-24_MRD_U18_TND"],
+    "mortality_rate": ["CME_MRY15T19+CME_MRY1T4+CME_MRY5T24"],
+}
+
+# Global Database estimates of the mortality rate among children aged 5-14, added to the store when it is downloaded
+mortality_rate_5_14_file_name = "Mortality-rate-among-children-and-youth-age-5-to-24_2023-1.xlsx"
+
+countries_mapping = {
+    "Democratic Republic of the Congo": "Congo DRC",
+    "Iran (Islamic Republic of)": "Iran",
+    "State of Palestine": "Palestine",
+    "Syrian Arab Republic": "Syria",
+    "Venezuela (Bolivarian Republic of)": "Venezuela",
+}
+
+kept_columns = ["Geographic area", "Indicator", "TIME_PERIOD", "OBS_VALUE", "SEX"]
+store_columns = ["dataset"] + kept_columns
+
+# Number of dataflows downloaded at the same time
+n_download_workers = 8
+
+
+def _fetch_dataflow(dataset_name: str, indicator_codes: str, timeout: int = 300) -> Tuple[str, Optional[pd.DataFrame]]:
+    """
+    Downloads the CSV export of one dataflow of the UNICEF Global Database.
+
+    Returns the dataset name with the downloaded rows, or None if the download or the parsing failed.
+    """
+    url = sdmx_data_url.format(indicator_codes=indicator_codes)
+    try:
+        response = requests.get(url, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"UNICEF dataflow {indicator_codes} could not be downloaded: {e}")
+        return dataset_name, None
+    if response.status_code != 200:
+        logger.error(f"UNICEF dataflow {indicator_codes} not received as status code is {response.status_code}")
+        return dataset_name, None
+
+    try:
+        df = pd.read_csv(io.StringIO(response.text), usecols=kept_columns)
+    except ValueError as e:
+        # Parsing errors and missing columns, e.g. an HTML error page served with a 200 status code
+        logger.error(f"UNICEF dataflow {indicator_codes} could not be parsed: {e}")
+        return dataset_name, None
+    return dataset_name, df
+
+
+def _get_mortality_rate_5_14_df(unicef_data_path: os.PathLike) -> pd.DataFrame:
+    """
+    Reads the median mortality rate among children aged 5-14 of each country and year from the Global Database workbook,
+    an empty DataFrame if it was not downloaded.
+    """
+    file_path = os.path.join(unicef_data_path, mortality_rate_5_14_file_name)
+    if not os.path.exists(file_path):
+        return pd.DataFrame(columns=kept_columns)
+
+    df = pd.read_excel(file_path, sheet_name="Age 5to14 Country estimates", header=14).iloc[:-2]
+    df = df[df["Uncertainty.Bounds*"] == "Median"]
+    year_columns = [col for col in df.columns if any(char.isdigit() for char in str(col))]
+    df = df.melt(id_vars=["Country.Name"], value_vars=year_columns, var_name="TIME_PERIOD", value_name="OBS_VALUE")
+    df["TIME_PERIOD"] = df["TIME_PERIOD"].astype(str).str.split(".").str[0]
+    df = df.rename(columns={"Country.Name": "Geographic area"})
+    df["Indicator"] = "Mortality rate age 5-14"
+    df["SEX"] = "_T"
+    return df[kept_columns]
+
+
+def _normalise_dataset(dataset_name: str, df: pd.DataFrame, countries: List[str]) -> pd.DataFrame:
+    """
+    Keeps the rows of the report countries, with the dashboard country names, and the dataset specific filters.
+    """
+    df = df.copy()
+    df["Geographic area"] = df["Geographic area"].replace(countries_mapping)
+    df = df[df["Geographic area"].isin(countries)]
+
+    if dataset_name == "mortality_rate":
+        # The dashboard shows the 1-4, 5-14 and 15-19 age groups, for both sexes together
+        df = df[(df["SEX"] == "_T") & (df["Indicator"] != "Mortality rate age 5-24")]
+        df["TIME_PERIOD"] = df["TIME_PERIOD"].astype(int)
+        df = df[df["TIME_PERIOD"] >= 1990]
+
+    df.insert(0, "dataset", dataset_name)
+    return df[store_columns]
+
+
+def _get_unicef_data(original_datasets_metadata: Dict[str, Any], data_output_path: os.PathLike) -> Optional[Dict[str, Any]]:
+    """
+    Inputs:
+    - original_datasets_metadata (Dict[str, Any]): Metadata of the dataset.
+    - data_output_path (os.PathLike): Path to the directory where the data will be saved.
+
+    Outputs:
+    - Optional[Dict[str, Any]]: Updated dataset metadata, None if no dataflow could be downloaded.
+
+    Operation:
+    1. Downloads every dataflow of 'unicef_datasets_indicators' concurrently, in one batch.
+    2. Normalises them into a single indicator store with a 'dataset' column, keeping the report countries only.
+    3. Keeps the previous rows of the datasets whose download failed, so that a partial outage does not empty them.
+    4. Writes the store next to its previous version and renames it, so that the dashboard never reads a partial file.
+    """
+    datasets_metadata = copy(original_datasets_metadata)
+    unicef_data_path = os.path.join(data_output_path, "unicef")
+    os.makedirs(unicef_data_path, exist_ok=True)
+    store_path = os.path.join(unicef_data_path, datasets_metadata["saved_file_name"])
+
+    countries = pd.read_csv(os.path.join(data_output_path, "..", "report_countries.csv"), header=None)[0].tolist()
+
+    dataflows = [
+        (dataset_name, indicator_codes)
+        for dataset_name, datasets_indicator_codes in unicef_datasets_indicators.items()
+        for indicator_codes in datasets_indicator_codes
+    ]
+    with ThreadPoolExecutor(max_workers=n_download_workers) as executor:
+        results = list(executor.map(lambda dataflow: _fetch_dataflow(*dataflow), dataflows))
+
+    downloaded_dfs = {}
+    failed_datasets = set()
+    for dataset_name, df in results:
+        if df is None:
+            failed_datasets.add(dataset_name)
+        else:
+            downloaded_dfs.setdefault(dataset_name, []).append(df)
+
+    if len(downloaded_dfs) == 0:
+        logger.error("No UNICEF dataflow could be downloaded, the indicator store is left unchanged.")
+        return None
+
+    mortality_rate_5_14_df = _get_mortality_rate_5_14_df(unicef_data_path)
+    if "mortality_rate" in downloaded_dfs and len(mortality_rate_5_14_df):
+        downloaded_dfs["mortality_rate"].append(mortality_rate_5_14_df)
+    store_dfs = [
+        _normalise_dataset(dataset_name, pd.concat(dfs, ignore_index=True), countries)
+        for dataset_name, dfs in downloaded_dfs.items()
+        if dataset_name not in failed_datasets
+    ]
+
+    if len(failed_datasets) and os.path.exists(store_path):
+        previous_store = pd.read_csv(store_path)
+        store_dfs.append(previous_store[previous_store["dataset"].isin(failed_datasets)])
+        logger.warning(f"Kept the previous UNICEF rows of {sorted(failed_datasets)}")
+
+    tmp_store_path = f"{store_path}.tmp"
+    pd.concat(store_dfs, ignore_index=True).to_csv(tmp_store_path, index=False)
+    os.replace(tmp_store_path, store_path)
+
+    datasets_metadata["latest_file_info"] = {"file_time": datetime.now().strftime("%d-%m-%Y")}
+    return datasets_metadata
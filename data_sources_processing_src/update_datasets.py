@@ -4,6 +4,7 @@ import logging
 import os
 import subprocess
 from datetime import datetime
+from typing import Any, Dict
 
 from data_sources_processing.acaps_inform_severity.acaps_inform_severity_data_preparation import \
     _get_acaps_inform_severity_data
@@ -15,6 +16,12 @@ from data_sources_processing.idmc.idmc_data_preparation import _get_idmc_data
 from data_sources_processing.ipc.ipc_data_preparation import _get_ipc_data
 from data_sources_processing.ocha_hpc.ocha_hpc_data_preparation import \
     _get_ocha_hpc_data
+from data_sources_processing.polygons.prepare_adm1_polygons import \
+    _prepare_adm1_polygons
+from data_sources_processing.publish.publish_datasets import \
+    _publish_datasets
+from data_sources_processing.unicef.unicef_data_preparation import \
+    _get_unicef_data
 
 logging.basicConfig(
     level=logging.DEBUG,  # Set the logging level
@@ -26,6 +33,11 @@ datasets_metadata_path = os.path.join(
     "/data", "datasets_metadata.json"
 )
 
+# Metadata shipped with the code, copied to the data volume when it is created only
+default_datasets_metadata_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data_sources_processing", "datasets_metadata.json"
+)
+
 time_format = "%d-%m-%Y"
 today_date = datetime.today()
 
@@ -36,10 +48,36 @@ datasets_processing_functions = {
     "idmc": _get_idmc_data,
     "ocha_hpc": _get_ocha_hpc_data,
     "acled": _get_acled_data,
+    "unicef": _get_unicef_data,
 }
 
 output_datasets_path = os.path.join("/data", "datasources")
 
+
+def _bump_data_version(datasets_metadata: Dict[str, Any], dataset_name: str):
+    """
+    Increments the data version read by the dashboard caches and stamps it as the version of the updated dataset,
+    so that both the overall and the per-dataset versions only ever increase.
+    """
+    datasets_metadata["data_version"] = datasets_metadata.get("data_version", 0) + 1
+    datasets_metadata.setdefault(dataset_name, {})["data_version"] = datasets_metadata["data_version"]
+
+
+def _add_missing_datasets_metadata(datasets_metadata: Dict[str, Any]):
+    """
+    Completes the metadata stored on the data volume with the datasets and the keys added to the code since it was
+    created, from the metadata shipped with the code, so that they are processed at the next run.
+    """
+    with open(default_datasets_metadata_path, "r") as file:
+        default_datasets_metadata = json.load(file)
+
+    for dataset_name in datasets_processing_functions:
+        dataset_metadata = datasets_metadata.setdefault(dataset_name, {})
+        for key, default_value in default_datasets_metadata.get(dataset_name, {}).items():
+            if key not in dataset_metadata:
+                logger.info(f"Adding the missing '{key}' metadata of {dataset_name}")
+                dataset_metadata[key] = default_value
+
 if __name__ == "__main__":
 
     """
@@ -52,16 +90,23 @@ if __name__ == "__main__":
 
     Outputs:
     - Updates the 'last_update_time' field in datasets_metadata for datasets that have been processed.
+    - Increments the 'data_version' of datasets_metadata, and stamps it on each dataset with new data,
+      so that the dashboard drops its cached copies without a restart.
     - Executes specified dataset processing functions and updates metadata if new data is processed.
     - Runs specific scripts to process the 'ohchr' dataset if not already processed.
+    - Prepares the ADM1 polygons of the dashboard maps.
+    - Publishes the typed columnar snapshot read by the dashboard.
 
     Operation:
-    1. Reads the datasets metadata from a JSON file.
+    1. Reads the datasets metadata from a JSON file, adding the datasets and keys it misses from the shipped one.
     2. Iterates through each dataset and its processing function.
     3. Checks if the dataset needs to be updated based on its last update time and update frequency.
-    4. If an update is required, it processes the dataset using its corresponding function and updates the metadata.
+    4. If an update is required, it processes the dataset using its corresponding function and updates the metadata,
+       bumping the data version when new data was processed.
     5. Saves the updated metadata back to the JSON file.
     6. Specifically checks if the 'ohchr' dataset is processed, and if not, runs two scripts to process it.
+    7. Splits the ADM1 polygons into one simplified file per report country, if they are outdated.
+    8. Publishes the processed datasets as Arrow IPC files under '/data/datasources/published'.
     """
 
     args = argparse.ArgumentParser()
@@ -71,6 +116,7 @@ if __name__ == "__main__":
 
     with open(datasets_metadata_path, "r") as file:
         datasets_metadata = json.load(file)
+    _add_missing_datasets_metadata(datasets_metadata)
 
     for (
         dataset_name,
@@ -98,6 +144,7 @@ if __name__ == "__main__":
             if new_latest_file_infos is not None:
 
                 datasets_metadata[dataset_name] = new_latest_file_infos
+                _bump_data_version(datasets_metadata, dataset_name)
                 logger.info(f"{dataset_name} file updated successfully.")
 
             if not sample_bool:
@@ -125,3 +172,15 @@ if __name__ == "__main__":
 
         # Run the second script
         subprocess.run(["python", "prepare_final_results.py", "--use_sample=false"])
+
+        _bump_data_version(datasets_metadata, "ohchr")
+        with open(datasets_metadata_path, "w") as file:
+            json.dump(datasets_metadata, file, indent=4)
+
+    # split the ADM1 polygons per report country if the GeoPackage or the countries list changed
+    logger.info("---------------- Preparing ADM1 polygons ----------------")
+    _prepare_adm1_polygons("/data", os.cpu_count())
+
+    # publish the serving snapshot read by the dashboard
+    logger.info("---------------- Publishing datasets ----------------")
+    _publish_datasets(output_datasets_path)
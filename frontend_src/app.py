@@ -1,9 +1,7 @@
-import json
 import os
 from time import sleep
 
 import dotenv
-import pandas as pd
 import streamlit as st
 from streamlit_local_storage import LocalStorage
 
@@ -28,10 +26,12 @@ if APP_ENVIRONMENT == "production" and GA_TRACKING_ID is not None:
     print("Google Analytics Tracking is enabled.")
 # Google Analytics script ends
 
-st.session_state["base_data_folder"] = "/data"
+st.session_state["base_data_folder"] = os.getenv("CPAOR_DATA_FOLDER", "/data")
 
 st.session_state["tabular_data_data_path"] = os.path.join(st.session_state["base_data_folder"], "datasources")
 
+st.session_state["countries_list_path"] = os.path.join(st.session_state["base_data_folder"], "report_countries.csv")
+
 sleep(0.3)  # To allow local storage to laod the data
 local_storage = LocalStorage()
 
@@ -49,6 +49,8 @@ else:
     # Setting the default Year
     st.session_state["selected-year"] = OCHA_HPC_DEFAULT_YEAR
 
+    from frontend.src.utils.published_data import _pin_published_snapshot
+    from frontend.src.utils.session_memory import _report_session_memory
     from frontend.src.utils.utils_functions import (
         _country_selection_filter,
         _load_countries_list,
@@ -57,6 +59,9 @@ else:
 
     ######### LOAD SESSION STATE VARIABLES #########
 
+    # The published snapshot is pinned for the whole run, a newer one swapped in meanwhile being used by the next run
+    _pin_published_snapshot()
+
     countries_list = _load_countries_list()
     st.session_state["countries"] = {country: i for i, country in enumerate(countries_list)}
     st.session_state["country_index"] = 0
@@ -66,29 +71,15 @@ else:
     from frontend.custom_pages.crisis_wise_analysis import _display_crisis_wise_analysis
     from frontend.custom_pages.methodology import _show_methodological_details
     from frontend.custom_pages.worldwide_analysis import main_page
-    from frontend.src.specific_datasets_scripts.acaps_inform_severity import (
-        _load_information_severity_index_data,
-    )
     from frontend.src.specific_datasets_scripts.acaps_protection_indicators import (
         _display_protection_data,
     )
-    from frontend.src.specific_datasets_scripts.acled import _load_acled_data
-    from frontend.src.specific_datasets_scripts.idmc import _load_idmc_data
-    from frontend.src.specific_datasets_scripts.ipc import _load_preprocess_ipc_data
-    from frontend.src.specific_datasets_scripts.ocha_hpc import (
-        _get_country_wise_children_in_need_data,
-        _get_country_wise_pin_data,
-    )
     from frontend.src.specific_datasets_scripts.ohchr import (
         country_wise_legal_framework,
     )
+    from frontend.src.utils.tabs_datasets import _load_tab_datasets
 
     # from src.utils.pop_up import _show_pop_up
-    from frontend.src.utils.load_geodata import _load_polygons_adm0
-    from frontend.src.visualizations.maps_creation import (
-        default_filling_color,
-        severity_mapping_tag_name_to_color_main_countries,
-    )
 
     st.session_state["title_size"] = 24
     st.session_state["subtitle_size"] = 20
@@ -134,38 +125,23 @@ else:
         "acaps_inform_severity",
         "INFORM Severity latest.xlsx",
     )
-    st.session_state["inform_severity_df"] = _load_information_severity_index_data()
 
     st.session_state["selected_tags"] = list(st.session_state["tag_name_to_indicators"].keys()) + ["Legal Framework"]
 
     st.session_state["pin_df_path"] = os.path.join(st.session_state["tabular_data_data_path"], "ocha_hpc", "OCHA PIN.csv")
-    st.session_state["all_pin_data"] = pd.read_csv(st.session_state["pin_df_path"])
-    st.session_state["country_wise_pin_data"] = _get_country_wise_pin_data(st.session_state["all_pin_data"])
-    st.session_state["ocha_hpc_min_year"] = st.session_state["all_pin_data"]["year"].min()
-    st.session_state["ocha_hpc_max_year"] = st.session_state["all_pin_data"]["year"].max()
 
     st.session_state["global_funding_file_path"] = os.path.join(
         st.session_state["tabular_data_data_path"], "ocha_hpc", "global_funding.csv"
     )
-    if os.path.exists(st.session_state["global_funding_file_path"]):
-        st.session_state["ocha_hpc_global_funding_df"] = pd.read_csv(st.session_state["global_funding_file_path"])
-    else:
-        st.session_state["ocha_hpc_global_funding_df"] = pd.DataFrame()
 
     st.session_state["ocha_hpc_country_funding_file_path"] = os.path.join(
         st.session_state["tabular_data_data_path"], "ocha_hpc", "country_funding.csv"
     )
-    if os.path.exists(st.session_state["ocha_hpc_country_funding_file_path"]):
-        st.session_state["ocha_hpc_country_funding_df"] = pd.read_csv(st.session_state["ocha_hpc_country_funding_file_path"])
-    else:
-        st.session_state["ocha_hpc_country_funding_df"] = pd.DataFrame()
 
-    st.session_state["country_wise_children_in_need_data"] = _get_country_wise_children_in_need_data(
-        st.session_state["all_pin_data"]
+    st.session_state["global_kpis_file_path"] = os.path.join(
+        st.session_state["tabular_data_data_path"], "ocha_hpc", "global_kpis.csv"
     )
 
-    _load_acled_data()
-
     st.session_state["protection_data_path"] = os.path.join(
         st.session_state["tabular_data_data_path"],
         "acaps_protection_indicators",
@@ -179,17 +155,6 @@ else:
         # "20240120111155_ipc_global_level1_long.csv",
     )
 
-    with open(
-        os.path.join(
-            st.session_state["protection_data_path"],
-            "..",
-            "acaps_protection_indicators_tags.json",
-        ),
-        "r",
-        encoding="utf-8",
-    ) as f:
-        st.session_state["acaps_protection_indicators_child_related_tags"] = json.load(f)
-
     st.session_state["original_polygons_data_path"] = os.path.join(st.session_state["base_data_folder"], "polygons_data")
     # os.makedirs(original_data_path, exist_ok=True)
 
@@ -197,9 +162,9 @@ else:
         st.session_state["original_polygons_data_path"], "processed_data"
     )
 
-    st.session_state["unicef_data_folder_path"] = os.path.join(st.session_state["tabular_data_data_path"], "unicef")
-
-    st.session_state["ipc_df"] = _load_preprocess_ipc_data()
+    st.session_state["unicef_indicators_file_path"] = os.path.join(
+        st.session_state["tabular_data_data_path"], "unicef", "unicef_indicators.csv"
+    )
 
     st.session_state["idmc_data_path"] = os.path.join(
         st.session_state["tabular_data_data_path"],
@@ -207,8 +172,6 @@ else:
         "IDMC_Internal_Displacement_Conflict-Violence_Disasters.xlsx",
     )
 
-    st.session_state["idmc_df"] = _load_idmc_data()
-
     st.session_state["legal_framework_summaries_data_path"] = os.path.join(
         st.session_state["base_data_folder"],
         "datasources",
@@ -219,53 +182,6 @@ else:
         st.session_state["tabular_data_data_path"], "ohchr", "results"
     )
 
-    with open(
-        os.path.join(
-            st.session_state["legal_framework_summaries_data_path"],
-            "..",
-            "grouped_legal_framework_indicators.json",
-        ),
-        "r",
-        encoding="utf-8",
-    ) as f:
-        st.session_state["legal_framework_indicators"] = json.load(f)
-
-    if "geojson_country_polygons" not in st.session_state:
-        geojson_country_polygons = _load_polygons_adm0()
-
-        inform_severity_values = {
-            row["COUNTRY"]: {
-                "Situation Severity": row["INFORM Severity category name"],
-                "Drivers": row["DRIVERS"],
-                "Trend (last 3 months)": row["Trend (last 3 months)"],
-                "Last updated": row["Last updated"],
-            }
-            for i, row in st.session_state["inform_severity_df"].iterrows()
-        }
-
-        for feature in geojson_country_polygons["features"]:
-            country_name = feature["properties"]["name"]
-            if country_name in inform_severity_values:
-                one_country_values = inform_severity_values[country_name]
-                inform_index_properties = one_country_values["Situation Severity"]
-                if inform_index_properties != "x":
-                    feature["properties"]["fill_color"] = severity_mapping_tag_name_to_color_main_countries[
-                        inform_index_properties
-                    ]
-                else:
-                    feature["properties"]["fill_color"] = default_filling_color
-                legend = f" -- {country_name} --"
-                for key, value in one_country_values.items():
-                    final_value = value if value != "x" else "UNKNOWN"
-                    legend += f"\n{key}: {final_value}"
-
-            else:
-                feature["properties"]["fill_color"] = [255, 255, 255]
-                legend = f"Country: {country_name}"
-            feature["legend"] = legend
-
-        st.session_state["geojson_country_polygons"] = geojson_country_polygons
-
     main_font_css = """
     <style>
         .block-container {
@@ -374,6 +290,9 @@ else:
                 with empty_div:
                     st.empty()
 
+        # Only the datasets of the selected tab are loaded
+        _load_tab_datasets(st.session_state["tabs"])
+
         if st.session_state["tabs"] == "Global Overview":
             with st.container():
                 main_page()
@@ -419,3 +338,5 @@ else:
                 </div>
             """
             st.markdown(footer_styles, unsafe_allow_html=True)
+
+    _report_session_memory()
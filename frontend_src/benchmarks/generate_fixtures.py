@@ -0,0 +1,575 @@
+"""
+Generates a synthetic data folder with the layout of `/data`, used to benchmark the dashboard without the real datasets.
+
+The files follow the schemas of the processing pipeline outputs, with sizes close to the production ones:
+
+    python -m benchmarks.generate_fixtures --data_folder /tmp/cpaor_benchmark_data
+"""
+
+import argparse
+import json
+import math
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from frontend.src.specific_datasets_scripts.ocha_hpc import global_kpis_columns
+from frontend.src.utils.load_geodata import (
+    _build_adm1_geojson_data,
+    _build_lod_levels,
+    _convert_geometries_to_geojson,
+    _get_adm0_polygons_file_path,
+    _get_adm1_polygons_file_path,
+    _save_adm1_geojson_data,
+    adm0_lod_tolerances,
+)
+
+# Report countries of the fixtures, with their IPC abbreviation and the centre of their synthetic polygon
+fixture_countries = {
+    "Afghanistan": ("AFG", (66.0, 34.0)),
+    "Chad": ("CHA", (18.7, 15.4)),
+    "Congo DRC": ("COD", (23.6, -2.9)),
+    "Haiti": ("HTI", (-72.7, 19.0)),
+    "Mali": ("MLI", (-2.0, 17.5)),
+    "Myanmar": ("MMR", (96.0, 21.0)),
+    "Somalia": ("SOM", (46.0, 6.0)),
+    "Sudan": ("SUD", (30.0, 15.0)),
+    "Syria": ("SYR", (38.5, 35.0)),
+    "Yemen": ("YEM", (47.5, 15.5)),
+}
+
+severity_categories = ["Very Low", "Low", "Medium", "High", "Very High"]
+event_types = ["Violence against civilians", "Explosions/Remote violence", "Battles", "Riots"]
+plan_types = ["Humanitarian response plan", "Humanitarian needs and response plan", "Flash appeal"]
+protection_tags = [
+    "Child labour",
+    "Child trafficking, abduction or sale",
+    "Children being associated with armed forces or armed groups",
+    "Constraints on children’s education",
+    "Forced and/or early marriage",
+    "Forced family separation",
+]
+legal_framework_indicators = {
+    "Child Marriage": ["Minimum age of marriage", "Forced marriage"],
+    "Sexual Violence": ["Sexual exploitation of children", "Chid sexual abuse"],
+    "Armed Forces": ["Use / recruitment of children by armed forces"],
+}
+laws_summaries = [
+    "Law Available Within the Legal Framework",
+    "Law Not Available Within the Legal Framework",
+    "No Information Available",
+]
+unicef_datasets_indicators = {
+    "out_of_school_rate": [
+        "Out-of-school rate for adolescents of lower secondary school age",
+        "Out-of-school rate for children of primary school age",
+        "Out-of-school rate for youth of upper secondary school age",
+    ],
+    "nb_deprivations": ["Average number of deprivations suffered per child"],
+    "refugee_host_per_country": ["Refugees by host country (per 1000 population)"],
+    "children_detention_rate": ["Rate of children in detention"],
+    "children_residential_care_rate": ["Rate of children in residential care"],
+    "percentage_adults_think_physical_punishement_good": [
+        "Percentage of adults who think that physical punishment is necessary to raise/educate children"
+    ],
+    "percentage_sexual_violence": ["Percentage of women (aged 18-29) who experienced sexual violence"],
+    "young_women_married": ["Women (aged 20-24 years) married or in union before age 18"],
+    "mortality_rate": [
+        "Child mortality rate (aged 1-4 years)",
+        "Mortality rate age 5-14",
+        "Mortality rate age 15-19",
+    ],
+}
+years = [2020, 2021, 2022, 2023, 2024, 2025]
+
+
+def _get_polygon(center: tuple, radius: float, n_vertices: int, rng: np.random.Generator) -> Dict:
+    """
+    Returns a GeoJSON polygon with a jagged outline around `center`, to give the simplification some work.
+    """
+    angles = np.linspace(0, 2 * math.pi, n_vertices, endpoint=False)
+    radii = radius * (1 + 0.15 * rng.standard_normal(n_vertices).cumsum() / math.sqrt(n_vertices))
+    radii = np.clip(radii, radius * 0.5, radius * 1.5)
+    coordinates = [[float(center[0] + r * math.cos(a)), float(center[1] + r * math.sin(a))] for r, a in zip(radii, angles)]
+    return {"type": "Polygon", "coordinates": [coordinates + [coordinates[0]]]}
+
+
+def _get_admin1_names(country: str, n_regions: int) -> List[str]:
+    return [f"{country} Region {region_id + 1}" for region_id in range(n_regions)]
+
+
+def _write_polygons(data_folder: os.PathLike, countries: List[str], n_regions: int, rng: np.random.Generator):
+    """
+    Writes the processed ADM0 level-of-detail and ADM1 files read by the maps, so no GeoPackage is needed.
+    """
+    geolocation_processed_data_path = os.path.join(data_folder, "polygons_data", "processed_data")
+    os.makedirs(os.path.join(geolocation_processed_data_path, "adm0_polygons"), exist_ok=True)
+
+    adm0_features = []
+    for feature_id, country in enumerate(countries):
+        geometry = _get_polygon(fixture_countries[country][1], 5, 4000, rng)
+        geometries = _convert_geometries_to_geojson(geometry, adm0_lod_tolerances, return_extreme_points=False)
+        adm0_features.append((feature_id, {"name": country}, geometries["geometries"]))
+    with open(_get_adm0_polygons_file_path(geolocation_processed_data_path), "w") as f:
+        json.dump(_build_lod_levels(adm0_features, adm0_lod_tolerances), f)
+
+    for country in countries:
+        lon, lat = fixture_countries[country][1]
+        n_columns = math.ceil(math.sqrt(n_regions))
+        adm1_features = [
+            (
+                region_id,
+                admin1,
+                _get_polygon(
+                    (lon - 4 + 8 * (region_id % n_columns) / n_columns, lat - 4 + 8 * (region_id // n_columns) / n_columns),
+                    4 / n_columns,
+                    800,
+                    rng,
+                ),
+            )
+            for region_id, admin1 in enumerate(_get_admin1_names(country, n_regions))
+        ]
+        adm1_file_path = _get_adm1_polygons_file_path(geolocation_processed_data_path, country)
+        os.makedirs(os.path.dirname(adm1_file_path), exist_ok=True)
+        _save_adm1_geojson_data(adm1_file_path, _build_adm1_geojson_data(adm1_features))
+
+
+def _write_inform_severity(datasources_path: os.PathLike, countries: List[str], rng: np.random.Generator):
+    """
+    Writes the INFORM Severity workbook, with the title and empty rows the dashboard skips when parsing each sheet.
+    """
+    last_updated = pd.Timestamp.now().normalize() - pd.Timedelta(days=20)
+    # The workbook names Congo DRC "DRC"
+    workbook_countries = ["DRC" if country == "Congo DRC" else country for country in countries]
+
+    countries_sheet = pd.DataFrame(
+        {
+            "COUNTRY": workbook_countries,
+            "Last updated": [last_updated.strftime("%Y-%m-%d")] * len(countries),
+            "INFORM Severity Index": rng.uniform(1, 5, len(countries)).round(1),
+            "INFORM Severity category": rng.integers(1, 6, len(countries)),
+            "INFORM Severity category name": rng.choice(severity_categories, len(countries)),
+            "DRIVERS": ["Conflict, Displacement"] * len(countries),
+            "Trend (last 3 months)": rng.choice(["Increasing", "Stable", "Decreasing", "x"], len(countries)),
+        }
+    )
+
+    crises = [
+        (f"{country} crisis {crisis_id + 1}", workbook_country)
+        for country, workbook_country in zip(countries, workbook_countries)
+        for crisis_id in range(3)
+    ]
+    n_crises = len(crises)
+
+    def _crisis_columns() -> Dict[str, list]:
+        return {
+            "CRISIS": [crisis for crisis, _ in crises],
+            "DRIVERS": ["Conflict"] * n_crises,
+            "CRISIS ID": [f"C{crisis_id:04d}" for crisis_id in range(n_crises)],
+            "COUNTRY": [country for _, country in crises],
+            "Iso3": ["XXX"] * n_crises,
+        }
+
+    def _scores(columns: List[str], low: float, high: float) -> Dict[str, np.ndarray]:
+        return {column: rng.uniform(low, high, n_crises).round(2) for column in columns}
+
+    all_crises_sheet = pd.DataFrame(
+        {
+            **_crisis_columns(),
+            **_scores(["Impact of the crisis", "Conditions of people affected", "Complexity of the crisis"], 0, 5),
+        }
+    )
+    impact_sheet = pd.DataFrame(
+        {
+            **_crisis_columns(),
+            **_scores(
+                [
+                    "% of total area affected",
+                    "% of total population living in the affected area",
+                    "% of people affected on the total population exposed",
+                    "% of total population displaced on the total population affected",
+                    "% of fatalities on the total population affected",
+                ],
+                0,
+                1,
+            ),
+        }
+    )
+    complexity_sheet = pd.DataFrame(
+        {
+            **_crisis_columns(),
+            **_scores(
+                [
+                    "Safety and security",
+                    "Humanitarian access",
+                    "size of excluded ethnic groups",
+                    "Trust in society",
+                    "Conflict Intensity",
+                    "Ongoing insecurity/hostilities affecting humanitarian assistance",
+                    "Physical constraints in the environment (obstacles related to terrain, climate, lack of infrastructure, etc.)",  # noqa
+                    "Violence against personnel, facilities and assets",
+                    "Denial of existence of humanitarian needs or entitlements to assistance",
+                    "Presence of mines and improvised explosive devices",
+                ],
+                0,
+                5,
+            ),
+        }
+    )
+    conditions_sheet = pd.DataFrame(
+        {
+            **_crisis_columns(),
+            **_scores(
+                [
+                    "% of people in none/minimal conditions - Level 1",
+                    "% of people in stressed conditions - level 2",
+                    "% of people in moderate conditions - level 3",
+                    "% of people severe conditions - level 4",
+                    "% of people extreme conditions - level 5",
+                ],
+                0,
+                1,
+            ),
+        }
+    )
+    indicators_sheet = pd.DataFrame(
+        {
+            "Crisis": [crisis for crisis, _ in crises],
+            "COUNTRY": [country for _, country in crises],
+            **_scores(
+                [
+                    "Restriction of movement (impediments to freedom of movement and/or administrative restrictions)",
+                    "Violence against personnel, facilities and assets",
+                    "Denial of existence of humanitarian needs or entitlements to assistance",
+                    "Physical constraints in the environment (obstacles related to terrain, climate, lack of infrastructure, etc.)",  # noqa
+                    "Ongoing insecurity/hostilities affecting humanitarian assistance",
+                    "Restriction and obstruction of access to services and assistance",
+                    "Presence of mines and improvised explosive devices",
+                ],
+                0,
+                5,
+            ),
+        }
+    )
+
+    # Number of empty rows between the header and the data of each sheet, and whether the header is preceded by a title
+    sheets = {
+        "INFORM Severity - country": (countries_sheet, 2, True),
+        "INFORM Severity - all crises": (all_crises_sheet, 2, True),
+        "Impact of the crisis": (impact_sheet, 3, True),
+        "Complexity of the crisis": (complexity_sheet, 3, True),
+        "Conditions of people affected": (conditions_sheet, 3, True),
+        "Crisis Indicator Data": (indicators_sheet, 1, False),
+    }
+
+    # The crisis identification columns have no header in these sheets
+    crisis_sheets_names = [
+        "INFORM Severity - all crises",
+        "Impact of the crisis",
+        "Complexity of the crisis",
+        "Conditions of people affected",
+    ]
+
+    inform_severity_path = os.path.join(datasources_path, "acaps_inform_severity")
+    os.makedirs(inform_severity_path, exist_ok=True)
+    with pd.ExcelWriter(os.path.join(inform_severity_path, "INFORM Severity latest.xlsx")) as writer:
+        for sheet_name, (sheet_df, n_empty_rows, has_title) in sheets.items():
+            header = list(sheet_df.columns)
+            if sheet_name == "INFORM Severity - country":
+                # Both category columns share the same header in the workbook
+                header = [
+                    "INFORM Severity category" if column == "INFORM Severity category name" else column for column in header
+                ]
+            if sheet_name in crisis_sheets_names:
+                header = ["", "", "", "", ""] + header[5:]
+            rows = ([["title"] + [None] * (len(header) - 1)] if has_title else []) + [header]
+            rows += [[None] * len(header)] * n_empty_rows + sheet_df.values.tolist()
+            pd.DataFrame(rows).to_excel(writer, sheet_name=sheet_name, header=False, index=False)
+
+
+def _write_ocha_hpc(datasources_path: os.PathLike, countries: List[str], rng: np.random.Generator):
+    ocha_hpc_path = os.path.join(datasources_path, "ocha_hpc")
+    os.makedirs(ocha_hpc_path, exist_ok=True)
+
+    pin_rows, country_funding_rows = [], []
+    for year in years:
+        for country in countries:
+            for plan_type in rng.choice(plan_types, 2, replace=False):
+                name = f"{country} {plan_type} {year}"
+                tot_pop_in_need = int(rng.integers(1_000_000, 20_000_000))
+                children_in_need = int(tot_pop_in_need * rng.uniform(0.2, 0.6))
+                targeted_children = int(children_in_need * rng.uniform(0.3, 0.8))
+                pin_rows.append(
+                    {
+                        "name": name,
+                        "plan_id": len(pin_rows),
+                        "country": country,
+                        "children_in_need": children_in_need,
+                        "targeted_children": targeted_children,
+                        "tot_pop_in_need": tot_pop_in_need,
+                        "cp_targeted": targeted_children,
+                        "cp_beneficiaries": int(targeted_children * rng.uniform(0.2, 0.9)),
+                        "year": year,
+                        "plan_type": plan_type,
+                    }
+                )
+                funding_requested = float(rng.uniform(1e7, 1e9))
+                country_funding_rows.append(
+                    {
+                        "name": name,
+                        "country": country,
+                        "funding_requested": funding_requested,
+                        "funding_received": funding_requested * rng.uniform(0.2, 0.8),
+                        "year": year,
+                        "plan_type": plan_type,
+                    }
+                )
+
+    pin_df = pd.DataFrame(pin_rows)
+    pin_df.to_csv(os.path.join(ocha_hpc_path, "OCHA PIN.csv"), index=False)
+    pd.DataFrame(country_funding_rows).to_csv(os.path.join(ocha_hpc_path, "country_funding.csv"), index=False)
+
+    global_funding_df = (
+        pd.DataFrame(country_funding_rows).groupby("year", as_index=False)[["funding_requested", "funding_received"]].sum()
+    )
+    global_funding_df = global_funding_df.merge(
+        pin_df.groupby("year", as_index=False)[["cp_targeted", "cp_beneficiaries"]].sum(), on="year"
+    )
+    global_funding_df["total_countries"] = len(countries)
+    global_funding_df.to_csv(os.path.join(ocha_hpc_path, "global_funding.csv"), index=False)
+
+    # Written by the OCHA HPC processing step, every fixture plan reports all of its caseloads
+    global_kpis_df = pin_df.groupby("year").agg(
+        children_in_need=("children_in_need", "sum"),
+        n_countries_children_in_need=("country", "nunique"),
+        targeted_children=("targeted_children", "sum"),
+        tot_pop_in_need=("tot_pop_in_need", "sum"),
+    )
+    global_kpis_df["n_countries_children_in_need_to_pop_in_need"] = global_kpis_df["n_countries_children_in_need"]
+    global_kpis_df["n_countries_children_targeted_to_children_in_need"] = global_kpis_df["n_countries_children_in_need"]
+    global_kpis_df["ratio_children_in_need_to_pop_in_need"] = (
+        global_kpis_df["children_in_need"] / global_kpis_df["tot_pop_in_need"]
+    )
+    global_kpis_df["ratio_children_targeted_to_children_in_need"] = (
+        global_kpis_df["targeted_children"] / global_kpis_df["children_in_need"]
+    )
+    global_kpis_df = global_kpis_df.reset_index().merge(global_funding_df, on="year")
+    global_kpis_df["ratio_global_funding"] = global_kpis_df["funding_received"] / global_kpis_df["funding_requested"]
+    global_kpis_df[global_kpis_columns].to_csv(os.path.join(ocha_hpc_path, "global_kpis.csv"), index=False)
+
+
+def _write_acled(
+    datasources_path: os.PathLike, countries: List[str], n_regions: int, n_events: int, rng: np.random.Generator
+):
+    acled_path = os.path.join(datasources_path, "acled")
+    os.makedirs(acled_path, exist_ok=True)
+
+    end_date = pd.Timestamp.now().normalize()
+    events_dfs = []
+    for country in countries:
+        lon, lat = fixture_countries[country][1]
+        events_dfs.append(
+            pd.DataFrame(
+                {
+                    "event_date": (end_date - pd.to_timedelta(rng.integers(0, 5 * 365, n_events), unit="D")).strftime(
+                        "%Y-%m-%d"
+                    ),
+                    "country": country,
+                    "admin1": rng.choice(_get_admin1_names(country, n_regions), n_events),
+                    "latitude": (lat + rng.uniform(-4, 4, n_events)).round(4),
+                    "longitude": (lon + rng.uniform(-4, 4, n_events)).round(4),
+                    "event_type": rng.choice(event_types, n_events, p=[0.5, 0.2, 0.2, 0.1]),
+                    "fatalities": rng.poisson(1.5, n_events),
+                    "notes": "Synthetic event targeting civilians.",
+                }
+            )
+        )
+    events_df = pd.concat(events_dfs, ignore_index=True)
+    events_df["year"] = events_df["event_date"].str[:4].astype(int)
+    events_df.to_csv(os.path.join(acled_path, "individual_events_targetting_civilians_new.csv"), index=False)
+
+    number_events_df = events_df.groupby(["country", "year"], as_index=False).agg(
+        fatalities=("fatalities", "sum"), **{"Number of Events": ("fatalities", "size")}
+    )
+    number_events_df.to_csv(os.path.join(acled_path, "number_events_evolution.csv"), index=False)
+
+
+def _write_ipc(datasources_path: os.PathLike, countries: List[str], n_regions: int, rng: np.random.Generator):
+    ipc_path = os.path.join(datasources_path, "ipc")
+    os.makedirs(ipc_path, exist_ok=True)
+
+    rows = []
+    analysis_dates = pd.date_range(end=pd.Timestamp.now(), periods=8, freq="6MS")
+    for country in countries:
+        for analysis_date in analysis_dates:
+            for admin1 in _get_admin1_names(country, n_regions):
+                for validity_period in ["current", "projected", "second projected"]:
+                    for phase in ["1", "2", "3", "4", "5", "3+", "all"]:
+                        rows.append(
+                            [
+                                fixture_countries[country][0],
+                                analysis_date.strftime("%b %Y"),
+                                admin1,
+                                validity_period,
+                                phase,
+                                int(rng.integers(1_000, 2_000_000)),
+                            ]
+                        )
+
+    ipc_df = pd.DataFrame(rows, columns=["Country", "Date of analysis", "Level 1", "Validity period", "Phase", "Number"])
+    # The HDX export has a row of HXL hashtags under the header
+    hxl_tags = ["#country+code", "#date", "#adm1+name", "#period", "#phase", "#affected"]
+    hxl_row = pd.DataFrame([hxl_tags], columns=ipc_df.columns)
+    pd.concat([hxl_row, ipc_df]).to_csv(os.path.join(ipc_path, "ipc_global_level1_long.csv"), index=False)
+
+
+def _write_idmc(datasources_path: os.PathLike, countries: List[str], rng: np.random.Generator):
+    idmc_path = os.path.join(datasources_path, "idmc")
+    os.makedirs(idmc_path, exist_ok=True)
+
+    rows = []
+    for country in countries:
+        for year in range(2008, years[-1]):
+            for cause in ["Conflict", "Disaster"]:
+                for sex in ["Both sexes", "Female", "Male"]:
+                    rows.append([country, "XXX", year, cause, sex] + rng.integers(1_000, 500_000, 5).tolist())
+    idmc_df = pd.DataFrame(rows, columns=["Country", "ISO3", "Year", "Cause", "Sex", "0-4", "5-11", "12-17", "18-59", "60+"])
+    with pd.ExcelWriter(os.path.join(idmc_path, "IDMC_Internal_Displacement_Conflict-Violence_Disasters.xlsx")) as writer:
+        idmc_df.to_excel(writer, sheet_name="3_IDPs_SADD_estimates", index=False)
+
+
+def _write_protection_indicators(datasources_path: os.PathLike, countries: List[str], rng: np.random.Generator):
+    protection_path = os.path.join(datasources_path, "acaps_protection_indicators")
+    os.makedirs(os.path.join(protection_path, "processed_data"), exist_ok=True)
+
+    breakdowns = {
+        "1 - General Summary": ["General Summary"],
+        "2 - Gender": ["Girls", "Boys"],
+        "3 - Age": ["0-5", "6-11", "12-17"],
+        "Indicator": protection_tags,
+    }
+    for country in countries:
+        rows = []
+        for breakdown, values in breakdowns.items():
+            for value in values:
+                for source_id in range(5):
+                    rows.append(
+                        {
+                            "Breakdown Column": breakdown,
+                            "Value": value,
+                            "Generated Text": f"Synthetic summary of {value.lower()} in {country}. " * 8,
+                            "Source Original Text": f"Source excerpt {source_id} about {value.lower()} in {country}. " * 4,
+                            "Source Name": f"Source {source_id}",
+                            "Source Link": f"https://example.org/{source_id}",
+                            "Source Date": (pd.Timestamp.now() - pd.Timedelta(days=int(rng.integers(1, 365)))).strftime(
+                                "%Y-%m-%d"
+                            ),
+                        }
+                    )
+        pd.DataFrame(rows).to_csv(os.path.join(protection_path, "processed_data", f"{country}.csv"), index=False)
+
+    with open(os.path.join(protection_path, "acaps_protection_indicators_tags.json"), "w") as f:
+        json.dump({"Child Protection Risks": protection_tags}, f)
+
+
+def _write_legal_framework(datasources_path: os.PathLike, countries: List[str], rng: np.random.Generator):
+    ohchr_path = os.path.join(datasources_path, "ohchr")
+    os.makedirs(os.path.join(ohchr_path, "results"), exist_ok=True)
+
+    with open(os.path.join(ohchr_path, "grouped_legal_framework_indicators.json"), "w") as f:
+        json.dump(legal_framework_indicators, f)
+
+    for country in countries:
+        rows = []
+        for tag, indicators in legal_framework_indicators.items():
+            for indicator in indicators:
+                for document_id in range(3):
+                    rows.append(
+                        {
+                            "Tag": tag,
+                            "Indicator": indicator,
+                            "Laws Summary": rng.choice(laws_summaries),
+                            "General Summary": f"Synthetic summary of {indicator.lower()} in {country}. " * 5,
+                            "Extracted Infos": f"Extracted information {document_id} about {indicator.lower()}. " * 3,
+                            "Title": f"Report {document_id} of {country}",
+                            "Submitted Date": (
+                                pd.Timestamp(year=2015 + 3 * document_id, month=6, day=1).strftime("%d %b %Y")
+                            ),
+                            "doc_link": f"https://example.org/{country}/{document_id}",
+                        }
+                    )
+        pd.DataFrame(rows).to_excel(os.path.join(ohchr_path, "results", f"{country}.xlsx"), index=False)
+
+
+def _write_unicef(datasources_path: os.PathLike, countries: List[str], rng: np.random.Generator):
+    unicef_path = os.path.join(datasources_path, "unicef")
+    os.makedirs(unicef_path, exist_ok=True)
+
+    rows = []
+    for dataset_name, indicators in unicef_datasets_indicators.items():
+        if dataset_name == "mortality_rate":
+            time_periods, sexes = range(1990, years[-1]), ["_T", "F", "M"]
+        else:
+            # The one-number indicators are published for both sexes together
+            time_periods, sexes = range(2015, years[-1]), ["_T"]
+        rows.extend(
+            [dataset_name, country, indicator, time_period, float(rng.uniform(0, 100)), sex]
+            for country in countries
+            for indicator in indicators
+            for time_period in time_periods
+            for sex in sexes
+        )
+    pd.DataFrame(rows, columns=["dataset", "Geographic area", "Indicator", "TIME_PERIOD", "OBS_VALUE", "SEX"]).to_csv(
+        os.path.join(unicef_path, "unicef_indicators.csv"), index=False
+    )
+
+
+def _generate_fixtures(data_folder: os.PathLike, n_countries: int, n_regions: int, n_events: int, seed: int):
+    """
+    Writes a synthetic data folder with the layout of `/data`.
+
+    Parameters:
+    data_folder (os.PathLike): Folder where the fixtures are written.
+    n_countries (int): Number of report countries, at most the number of `fixture_countries`.
+    n_regions (int): Number of ADM1 regions per country.
+    n_events (int): Number of ACLED events per country.
+    seed (int): Seed of the random values, so that reports built on fixtures of the same parameters are comparable.
+
+    Operation:
+    1. Writes the report countries list.
+    2. Writes the raw files of each data source, as left by the processing pipeline without published snapshot.
+    3. Writes the processed polygons files of the maps.
+    """
+    rng = np.random.default_rng(seed)
+    countries = list(fixture_countries)[:n_countries]
+    datasources_path = os.path.join(data_folder, "datasources")
+    os.makedirs(datasources_path, exist_ok=True)
+
+    pd.DataFrame({"country": countries}).to_csv(os.path.join(data_folder, "report_countries.csv"), header=False, index=False)
+
+    _write_inform_severity(datasources_path, countries, rng)
+    _write_ocha_hpc(datasources_path, countries, rng)
+    _write_acled(datasources_path, countries, n_regions, n_events, rng)
+    _write_ipc(datasources_path, countries, n_regions, rng)
+    _write_idmc(datasources_path, countries, rng)
+    _write_protection_indicators(datasources_path, countries, rng)
+    _write_legal_framework(datasources_path, countries, rng)
+    _write_unicef(datasources_path, countries, rng)
+    _write_polygons(data_folder, countries, n_regions, rng)
+
+
+if __name__ == "__main__":
+    args = argparse.ArgumentParser()
+    args.add_argument("--data_folder", type=str, required=True)
+    args.add_argument("--n_countries", type=int, default=len(fixture_countries))
+    args.add_argument("--n_regions", type=int, default=20)
+    args.add_argument("--n_events", type=int, default=20_000)
+    args.add_argument("--seed", type=int, default=0)
+
+    parsed_args = args.parse_args()
+
+    _generate_fixtures(
+        parsed_args.data_folder, parsed_args.n_countries, parsed_args.n_regions, parsed_args.n_events, parsed_args.seed
+    )
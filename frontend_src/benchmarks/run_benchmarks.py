@@ -0,0 +1,267 @@
+"""
+Measures the startup and per-tab render latency of the dashboard, running `app.py` headlessly with the streamlit AppTest.
+
+Each (tab, country) scenario runs in a fresh process, so that its first render is cold and its peak RSS is its own:
+
+    python -m benchmarks.run_benchmarks --output benchmark_report.json --baseline benchmark_baseline.json
+
+Without `--data_folder`, synthetic fixtures are generated in a temporary folder first.
+The command exits with status 1 when a metric regressed compared to the baseline.
+"""
+
+import argparse
+import functools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+frontend_src_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+tabs = [
+    "Global Overview",
+    "Country Profile",
+    "Legal Framework",
+    "Protection Concerns",
+    "Breakdown by Crisis",
+    "Methodology",
+]
+# Tabs whose content does not depend on the selected country
+countryless_tabs = ["Global Overview", "Methodology"]
+
+# Smallest increase of each metric reported as a regression, so that noise on small values is not flagged
+metrics_min_deltas = {
+    "startup_s": 0.05,
+    "cold_render_s": 0.05,
+    "warm_render_s": 0.05,
+    "peak_rss_mb": 20,
+}
+
+# Cumulated time and number of calls of each fragment, filled by the patched `st.fragment`
+fragments_timings = defaultdict(lambda: {"calls": 0, "total_s": 0.0})
+
+
+def _patch_fragments_timing():
+    """
+    Wraps the functions decorated with `st.fragment` to time each of their calls.
+
+    It has to run before the app modules are imported, as the decorator is applied at import time.
+    """
+    import streamlit as st
+
+    streamlit_fragment = st.fragment
+
+    def _timed_fragment(func=None, **kwargs):
+        if func is None:
+            return lambda f: _timed_fragment(f, **kwargs)
+
+        @functools.wraps(func)
+        def _wrapper(*args, **func_kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **func_kwargs)
+            finally:
+                fragment_timings = fragments_timings[f"{func.__module__}.{func.__qualname__}"]
+                fragment_timings["calls"] += 1
+                fragment_timings["total_s"] += time.perf_counter() - start
+
+        return streamlit_fragment(_wrapper, **kwargs)
+
+    st.fragment = _timed_fragment
+
+
+def _run_app(app_test, timeout: float) -> Dict:
+    """
+    Runs the script once and returns its wall time, the fragments timings and the exceptions it raised.
+    """
+    fragments_timings.clear()
+    start = time.perf_counter()
+    app_test.run(timeout=timeout)
+    wall_time = time.perf_counter() - start
+
+    return {
+        "wall_time_s": wall_time,
+        "fragments": {name: dict(timings) for name, timings in fragments_timings.items()},
+        "exceptions": [exception.message for exception in app_test.exception],
+    }
+
+
+def _run_scenario(data_folder: os.PathLike, tab: str, country: Optional[str], n_warm_runs: int, timeout: float) -> Dict:
+    """
+    Starts the app, displays a tab for a country and displays it again with warm caches.
+
+    Parameters:
+    data_folder (os.PathLike): Data folder read by the app.
+    tab (str): Name of the tab to display.
+    country (Optional[str]): Country to select, None to keep the default one.
+    n_warm_runs (int): Number of runs after the first display of the tab.
+    timeout (float): Maximum duration of a run, in seconds.
+
+    Returns:
+    Dict: The timings of the scenario, its peak RSS and the exceptions raised by the app.
+
+    Operation:
+    1. Points the app to the data folder and patches `st.fragment` before any app module is imported.
+    2. Runs the app with the consent already stored, like a returning user: the startup run shows the default tab.
+    3. Selects the tab and the country and times the first (cold) render, then the following (warm) renders.
+    """
+    os.environ["CPAOR_DATA_FOLDER"] = os.path.abspath(data_folder)
+    # The app reads its images with paths relative to the frontend folder
+    os.chdir(frontend_src_path)
+    _patch_fragments_timing()
+
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(os.path.join(frontend_src_path, "app.py"), default_timeout=timeout)
+    app_test.session_state["storage_init"] = {"cpaor_consent_confirm": "true"}
+
+    startup_run = _run_app(app_test, timeout)
+
+    app_test.radio[0].set_value(tab)
+    if country is not None:
+        app_test.selectbox(key="country-profile").set_value(country)
+    cold_run = _run_app(app_test, timeout)
+
+    warm_runs = [_run_app(app_test, timeout) for _ in range(n_warm_runs)]
+
+    return {
+        "tab": tab,
+        "country": country,
+        "startup_s": startup_run["wall_time_s"],
+        "cold_render_s": cold_run["wall_time_s"],
+        "warm_render_s": statistics.median([run["wall_time_s"] for run in warm_runs]) if warm_runs else None,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "fragments": {
+            "startup": startup_run["fragments"],
+            "cold_render": cold_run["fragments"],
+            "warm_render": warm_runs[-1]["fragments"] if warm_runs else {},
+        },
+        "exceptions": sorted(
+            set(startup_run["exceptions"] + cold_run["exceptions"] + sum([run["exceptions"] for run in warm_runs], []))
+        ),
+    }
+
+
+def _get_scenarios(countries: List[str], selected_tabs: List[str]) -> List[Dict]:
+    scenarios = []
+    for tab in selected_tabs:
+        if tab in countryless_tabs:
+            scenarios.append({"tab": tab, "country": None})
+        else:
+            scenarios.extend({"tab": tab, "country": country} for country in countries)
+    return scenarios
+
+
+def _get_scenario_name(tab: str, country: Optional[str]) -> str:
+    return tab if country is None else f"{tab} - {country}"
+
+
+def _compare_with_baseline(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Returns the regressions of the report, the metrics that grew by more than `tolerance` and their minimum delta.
+    """
+    regressions = []
+    for scenario_name, scenario_results in report["scenarios"].items():
+        baseline_results = baseline["scenarios"].get(scenario_name)
+        if baseline_results is None:
+            continue
+        for metric, min_delta in metrics_min_deltas.items():
+            value, baseline_value = scenario_results[metric], baseline_results.get(metric)
+            if value is None or baseline_value is None:
+                continue
+            if value > baseline_value * (1 + tolerance) and value - baseline_value > min_delta:
+                regressions.append(f"{scenario_name}: {metric} went from {baseline_value:.3f} to {value:.3f}")
+        if scenario_results["exceptions"] and not baseline_results.get("exceptions"):
+            regressions.append(f"{scenario_name}: raises {scenario_results['exceptions']}")
+    return regressions
+
+
+def _run_benchmarks(
+    data_folder: os.PathLike, countries: List[str], selected_tabs: List[str], n_warm_runs: int, timeout: float
+) -> Dict:
+    """
+    Runs every scenario in its own process and gathers their results in a report.
+    """
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "n_warm_runs": n_warm_runs,
+        "scenarios": {},
+    }
+
+    for scenario in _get_scenarios(countries, selected_tabs):
+        scenario_name = _get_scenario_name(scenario["tab"], scenario["country"])
+        # A spawned process per scenario, so that no module or cache is shared with the previous ones
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = executor.submit(
+                _run_scenario, data_folder, scenario["tab"], scenario["country"], n_warm_runs, timeout
+            ).result()
+        report["scenarios"][scenario_name] = results
+
+        warm_render = "-" if results["warm_render_s"] is None else f"{results['warm_render_s']:.2f}s"
+        print(
+            f"{scenario_name}: startup {results['startup_s']:.2f}s, cold render {results['cold_render_s']:.2f}s, "
+            f"warm render {warm_render}, peak RSS {results['peak_rss_mb']:.0f}MB"
+        )
+        for exception in results["exceptions"]:
+            print(f"    exception: {exception}")
+
+    return report
+
+
+if __name__ == "__main__":
+    args = argparse.ArgumentParser()
+    args.add_argument("--data_folder", type=str, default=None)
+    args.add_argument("--countries", type=str, nargs="+", default=None)
+    args.add_argument("--n_countries", type=int, default=2)
+    args.add_argument("--tabs", type=str, nargs="+", default=tabs, choices=tabs)
+    args.add_argument("--n_warm_runs", type=int, default=3)
+    args.add_argument("--timeout", type=float, default=300)
+    args.add_argument("--output", type=str, default="benchmark_report.json")
+    args.add_argument("--baseline", type=str, default=None)
+    args.add_argument("--tolerance", type=float, default=0.25)
+
+    parsed_args = args.parse_args()
+
+    data_folder = parsed_args.data_folder
+    if data_folder is None:
+        from benchmarks.generate_fixtures import _generate_fixtures, fixture_countries
+
+        data_folder = tempfile.mkdtemp(prefix="cpaor_benchmark_data_")
+        print(f"Generating the fixtures in {data_folder}")
+        _generate_fixtures(data_folder, len(fixture_countries), n_regions=20, n_events=20_000, seed=0)
+
+    countries = parsed_args.countries
+    if countries is None:
+        countries = pd.read_csv(os.path.join(data_folder, "report_countries.csv"), header=None)[0].tolist()
+        countries = countries[: parsed_args.n_countries]
+
+    report = _run_benchmarks(data_folder, countries, parsed_args.tabs, parsed_args.n_warm_runs, parsed_args.timeout)
+
+    with open(parsed_args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report saved to {parsed_args.output}")
+
+    if parsed_args.baseline is not None:
+        with open(parsed_args.baseline) as f:
+            baseline = json.load(f)
+        regressions = _compare_with_baseline(report, baseline, parsed_args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regression compared to the baseline")
@@ -26,7 +26,8 @@ from frontend.src.specific_datasets_scripts.unicef_data_processing import (
     _display_child_protection_risks,
     _display_tabular_mortality_rates,
 )
-from frontend.src.utils.utils_functions import _add_blank_space, _custom_title
+from frontend.src.utils.figure_cache import _deferred_figures_rendering
+from frontend.src.utils.utils_functions import _add_blank_space, _custom_title, _load_protection_indicators_data
 
 
 @st.fragment
@@ -57,59 +58,62 @@ def _display_all_data(selected_country: str):
     16. Calls `_display_child_protection_risks` to display risks related to child protection.
     17. Calls `_display_specific_protection_indicators` to display specific protection indicators.
     18. Calls `_display_tabular_mortality_rates` to display tabular data related to mortality rates.
+    19. With the chart rendering pool enabled, the matplotlib charts are rendered in parallel and shown at the end.
     """
-    cp_info, _, cp_charts = st.columns([0.47, 0.06, 0.47])
+    # The matplotlib charts are rendered in the chart rendering pool when it is enabled
+    with _deferred_figures_rendering():
+        cp_info, _, cp_charts = st.columns([0.47, 0.06, 0.47])
 
-    with cp_info:
-        _custom_title(
-            "Child Protection Situation",
-            st.session_state["subtitle_size"],
-            source="ACAPS, Protection Indicators",
-            date=st.session_state[f"protection_df_max_date_{selected_country}"],
-        )
-        _display_main_summary(selected_country, display_evidence=False)
-        _display_acled_map_data(selected_country)
+        with cp_info:
+            _custom_title(
+                "Child Protection Situation",
+                st.session_state["subtitle_size"],
+                source="ACAPS, Protection Indicators",
+                date=_load_protection_indicators_data(selected_country)["max_date"],
+            )
+            _display_main_summary(selected_country, display_evidence=False)
+            _display_acled_map_data(selected_country)
 
-    with cp_charts:
-        _display_pin_stackbar(selected_country)
-        display_cp_beneficiaries(selected_country)
-        display_country_level_funding(selected_country)
-        _display_crises_list(selected_country)
+        with cp_charts:
+            _display_pin_stackbar(selected_country)
+            display_cp_beneficiaries(selected_country)
+            display_country_level_funding(selected_country)
+            _display_crises_list(selected_country)
 
-    _custom_title("Causes & Underlying Factors", font_size=30)
-    st.write(" ")
-    physical_env_col, _, impact_of_the_crisis_col = st.columns([0.47, 0.06, 0.47])
-    with physical_env_col:
-        _show_physical_environment(selected_country)
+        _custom_title("Causes & Underlying Factors", font_size=30)
+        st.write(" ")
+        physical_env_col, _, impact_of_the_crisis_col = st.columns([0.47, 0.06, 0.47])
+        with physical_env_col:
+            _show_physical_environment(selected_country)
 
-    with impact_of_the_crisis_col:
-        _show_impact_of_the_crisis(selected_country)
+        with impact_of_the_crisis_col:
+            _show_impact_of_the_crisis(selected_country)
 
-    _add_blank_space(1)
+        _add_blank_space(1)
 
-    _display_number_of_events_targetting_civilians(selected_country)
+        _display_number_of_events_targetting_civilians(selected_country)
 
-    barriers_col, _, food_insecurity_col = st.columns([0.47, 0.06, 0.47])
-    with barriers_col:
-        _show_barriers_goods_services(selected_country)
+        barriers_col, _, food_insecurity_col = st.columns([0.47, 0.06, 0.47])
+        with barriers_col:
+            _show_barriers_goods_services(selected_country)
 
-    with food_insecurity_col:
-        _plot_ipc_results(selected_country)
+        with food_insecurity_col:
+            _plot_ipc_results(selected_country)
 
-    _get_displacement_numbers(selected_country)
+        _get_displacement_numbers(selected_country)
 
-    _add_blank_space(3)
+        _add_blank_space(3)
 
-    country_wise_legal_framework(selected_country, display_detailed_results=False)
+        country_wise_legal_framework(selected_country, display_detailed_results=False)
 
-    _add_blank_space(3)
+        _add_blank_space(3)
 
-    _display_child_protection_risks(selected_country)
-    _display_specific_protection_indicators(selected_country)
+        _display_child_protection_risks(selected_country)
+        _display_specific_protection_indicators(selected_country)
 
-    _add_blank_space(3)
+        _add_blank_space(3)
 
-    _display_tabular_mortality_rates(selected_country)
+        _display_tabular_mortality_rates(selected_country)
     # _custom_title(
     #     "Children’s mental and physical health", st.session_state["subtitle_size"]
     # )
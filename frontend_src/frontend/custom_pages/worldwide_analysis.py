@@ -3,17 +3,13 @@ import streamlit as st
 from frontend.src.specific_datasets_scripts.ocha_hpc import (
     _display_evolution_data,
     _display_top_countries_with_children_in_need,
-    _get_cp_beneficiaries,
-    _get_ratio_children_in_need_to_pop_in_need,
-    _get_ratio_children_targeted_to_children_in_need,
-    _get_ratio_global_funding,
-    _get_total_CP_caseload_in_need,
+    _get_global_key_indicators,
     display_global_funding,
 )
 from frontend.src.utils.utils_functions import _custom_title
-from frontend.src.visualizations.barchart import _get_abbreviated_number
 from frontend.src.visualizations.maps_creation import (
     _create_polygons_map_placeholder_pdk,
+    _load_severity_world_polygons,
 )
 
 
@@ -47,30 +43,19 @@ def main_page():
             date=st.session_state["selected-year"],
         )
 
-        # Define the custom style for the first box
-        total_number_of_children_in_need, n_countries_number_of_children_in_need = _get_total_CP_caseload_in_need()
-
-        shown_total_number_of_children_in_need = _get_abbreviated_number(
-            int(total_number_of_children_in_need.replace(",", ""))
-        ).replace(" ", "\n")
-
-        # Define the custom style for the second box
-        (
-            ratio_children_in_need_to_ppl_in_need,
-            n_countries_ratio_children_in_need_to_ppl_in_need,
-        ) = _get_ratio_children_in_need_to_pop_in_need()
-
-        # Define the custom style for the third box
-        (
-            ratio_children_targeted_to_children_in_need,
-            n_countries_ratio_children_targeted_to_children_in_need,
-        ) = _get_ratio_children_targeted_to_children_in_need()
-
-        # Define the custom style for the fourth box
-        total_cp_beneficiaries, gf_total_countries = _get_cp_beneficiaries()
-
-        # Define the custom style for the fifth box
-        ratio_global_funding, gf_total_countries = _get_ratio_global_funding()
+        # Precomputed for every year, the tiles only format the row of the selected year
+        key_indicators = _get_global_key_indicators()
+        shown_total_number_of_children_in_need = key_indicators["children_in_need"].replace(" ", "\n")
+        n_countries_number_of_children_in_need = key_indicators["n_countries_children_in_need"]
+        ratio_children_in_need_to_ppl_in_need = key_indicators["ratio_children_in_need_to_pop_in_need"]
+        n_countries_ratio_children_in_need_to_ppl_in_need = key_indicators["n_countries_children_in_need_to_pop_in_need"]
+        ratio_children_targeted_to_children_in_need = key_indicators["ratio_children_targeted_to_children_in_need"]
+        n_countries_ratio_children_targeted_to_children_in_need = key_indicators[
+            "n_countries_children_targeted_to_children_in_need"
+        ]
+        total_cp_beneficiaries = key_indicators["cp_beneficiaries"]
+        ratio_global_funding = key_indicators["ratio_global_funding"]
+        gf_total_countries = key_indicators["total_countries"]
 
         key_figures_styles = """
         <style>
@@ -146,7 +131,7 @@ def main_page():
             date=st.session_state["inform_severity_last_updated"],
         )
         with st.container():
-            _create_polygons_map_placeholder_pdk(st.session_state["geojson_country_polygons"], display_type="Country")
+            _create_polygons_map_placeholder_pdk(_load_severity_world_polygons(), display_type="Country")
 
     for _ in range(2):
         st.markdown("")
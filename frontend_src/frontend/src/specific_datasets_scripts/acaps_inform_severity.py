@@ -1,6 +1,11 @@
+import os
+from typing import Any, Callable, Dict, List, Tuple
+
 import pandas as pd
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset
+from frontend.src.utils.published_data import _get_published_snapshot_path, _read_published_table
 from frontend.src.utils.utils_functions import (
     _custom_title,
     _get_bullet_point_as_highlighted_text_display,
@@ -28,25 +33,131 @@ def _clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _load_information_severity_index_data():
+def _prepare_crisis_sheet_many_empty_rows(crisis_wide_df: pd.DataFrame, initial_row_number: int) -> pd.DataFrame:
     """
-    Function to load the INFORM Severity Index data.
+    Applies the header offset, column renames and country renames of a crisis sheet with many empty rows.
     """
+    crisis_wide_df = crisis_wide_df.rename(
+        columns={
+            "Unnamed: 0": "CRISIS",
+            "Unnamed: 1": "DRIVERS",
+            "Unnamed: 2": "CRISIS ID",
+            "Unnamed: 3": "COUNTRY",
+            "Unnamed: 4": "Iso3",
+        }
+    ).iloc[initial_row_number:]
+    crisis_wide_df = crisis_wide_df.replace("x", 0)
 
-    df_countries = pd.read_excel(
-        st.session_state["inform_severity_data_path"],
-        sheet_name="INFORM Severity - country",
-        header=1,
-    ).iloc[2:]
+    return _clean_columns(crisis_wide_df)
+
+
+def _prepare_crisis_sheet_few_empty_rows(crisis_wide_df: pd.DataFrame, initial_row_number: int) -> pd.DataFrame:
+    """
+    Applies the header offset and column renames of a crisis sheet with few empty rows.
+    """
+    crisis_wide_df = crisis_wide_df.iloc[initial_row_number:].rename(columns={"Crisis": "CRISIS"})
+
+    return _clean_columns(crisis_wide_df)
+
+
+# Crisis sheets used by the dashboard, with their published table name, header row, first data row
+# and preparation function
+inform_severity_crisis_sheets = {
+    "INFORM Severity - all crises": ("inform_severity_all_crises", 1, 2, _prepare_crisis_sheet_many_empty_rows),
+    "Impact of the crisis": ("inform_severity_impact", 1, 3, _prepare_crisis_sheet_many_empty_rows),
+    "Complexity of the crisis": ("inform_severity_complexity", 1, 3, _prepare_crisis_sheet_many_empty_rows),
+    "Conditions of people affected": ("inform_severity_conditions", 1, 3, _prepare_crisis_sheet_many_empty_rows),
+    "Crisis Indicator Data": ("inform_severity_crisis_indicators", 0, 1, _prepare_crisis_sheet_few_empty_rows),
+}
+
+
+def _index_crisis_sheet(crisis_wide_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Splits a prepared crisis sheet by COUNTRY, each country table being indexed by CRISIS.
+    Returns an empty table with the sheet columns, used for countries absent from the sheet, and the split tables.
+    """
+    crisis_wide_df = crisis_wide_df.set_index("CRISIS", drop=False).rename_axis(None)
+    empty_df = crisis_wide_df.iloc[0:0]
+    if "COUNTRY" not in crisis_wide_df.columns:
+        return empty_df, {}
+
+    country_dfs = {country: country_df for country, country_df in crisis_wide_df.groupby("COUNTRY", sort=False)}
+    return empty_df, country_dfs
+
+
+def _read_inform_severity_workbook(inform_severity_data_path: os.PathLike, countries: List[str]) -> Dict[str, Any]:
+    """
+    Parses the INFORM Severity Index workbook once and prepares every sheet used by the dashboard.
+
+    Parameters:
+    inform_severity_data_path (os.PathLike): Path to the INFORM Severity Index Excel file.
+    countries (List[str]): Countries covered by the dashboard.
+
+    Returns:
+    Dict[str, Any]: The country level table under "countries" and the crisis sheets under "crisis_sheets",
+    keyed by (sheet name, header row, initial row number).
+
+    Operation:
+    1. Reads the sheets from the published snapshot when they are all available, already prepared.
+    2. Otherwise, opens the workbook a single time and reads the country sheet and all the crisis sheets from it,
+       applying the header offsets, column cleaning and country renames of each sheet.
+    3. Splits each crisis sheet by COUNTRY so that lookups do not scan the whole sheet.
+    """
+    published_tables = {
+        table_name: _read_published_table(table_name)
+        for table_name in ["inform_severity_country"] + [infos[0] for infos in inform_severity_crisis_sheets.values()]
+    }
+
+    crisis_sheets = {}
+    if all(published_table is not None for published_table in published_tables.values()):
+        df_countries = published_tables["inform_severity_country"]
+        for sheet_name, (table_name, header, initial_row_number, _) in inform_severity_crisis_sheets.items():
+            crisis_sheets[(sheet_name, header, initial_row_number)] = _index_crisis_sheet(published_tables[table_name])
+    else:
+        with pd.ExcelFile(inform_severity_data_path) as workbook:
+            df_countries = workbook.parse(sheet_name="INFORM Severity - country", header=1).iloc[2:]
+
+            for sheet_name, (_, header, initial_row_number, preparation_function) in inform_severity_crisis_sheets.items():
+                crisis_wide_df = preparation_function(
+                    workbook.parse(sheet_name=sheet_name, header=header), initial_row_number
+                )
+                crisis_sheets[(sheet_name, header, initial_row_number)] = _index_crisis_sheet(crisis_wide_df)
 
     df_countries = _clean_columns(df_countries)
 
     df_countries["Last updated"] = pd.to_datetime(df_countries["Last updated"]).dt.strftime("%d-%m-%Y")
 
-    df_countries = df_countries[df_countries.COUNTRY.isin(st.session_state["countries"])].rename(
+    df_countries = df_countries[df_countries.COUNTRY.isin(countries)].rename(
         columns={"INFORM Severity category.1": "INFORM Severity category name"}
     )
 
+    return {"countries": df_countries, "crisis_sheets": crisis_sheets}
+
+
+def _load_inform_severity_workbook() -> Dict[str, Any]:
+    """
+    Loads the parsed INFORM Severity Index workbook through the shared dataset cache.
+    """
+    return _load_cached_dataset(
+        "inform_severity",
+        [
+            st.session_state["inform_severity_data_path"],
+            st.session_state["countries_list_path"],
+            _get_published_snapshot_path(),
+        ],
+        _read_inform_severity_workbook,
+        st.session_state["inform_severity_data_path"],
+        list(st.session_state["countries"]),
+    )
+
+
+def _load_information_severity_index_data():
+    """
+    Function to load the INFORM Severity Index data.
+    """
+
+    df_countries = _load_inform_severity_workbook()["countries"]
+
     st.session_state["inform_severity_last_updated"] = "-".join(
         df_countries["Last updated"].max().split("-")[1:]
     )  # .strftime("%m-%Y")
@@ -54,6 +165,25 @@ def _load_information_severity_index_data():
     return df_countries
 
 
+def _get_crisis_sheet(
+    selected_country: str, sheet_name: str, header: int, initial_row_number: int, preparation_function: Callable
+) -> pd.DataFrame:
+    """
+    Returns the rows of the selected country in a prepared crisis sheet.
+    Sheets that are not part of `inform_severity_crisis_sheets` are parsed directly from the workbook.
+    """
+    crisis_sheet = _load_inform_severity_workbook()["crisis_sheets"].get((sheet_name, header, initial_row_number))
+    if crisis_sheet is None:
+        crisis_wide_df = preparation_function(
+            pd.read_excel(st.session_state["inform_severity_data_path"], sheet_name=sheet_name, header=header),
+            initial_row_number,
+        )
+        crisis_sheet = _index_crisis_sheet(crisis_wide_df)
+
+    empty_df, country_dfs = crisis_sheet
+    return country_dfs.get(selected_country, empty_df)
+
+
 def _load_crisis_specific_df_many_empty_rows(selected_country: str, sheet_name: str, initial_row_number: int):
     """
     Loads a specific crisis-related DataFrame with potentially many empty rows from an Excel sheet.
@@ -64,36 +194,13 @@ def _load_crisis_specific_df_many_empty_rows(selected_country: str, sheet_name:
 
     Returns:
     pd.DataFrame: The loaded DataFrame containing crisis-related data filtered for the selected country.
+    It is shared across sessions and must not be modified in place.
 
     Operation:
-    1. Defines a mapping for translating country names.
-    2. Reads an Excel file into a DataFrame, starting from a specified row, and renames columns.
-    3. Filters the DataFrame to include only rows matching the selected country stored in Streamlit session state.
-    4. Returns the filtered DataFrame containing crisis-related data.
+    1. Gets the sheet from the parsed workbook, with columns and country names already cleaned.
+    2. Returns the rows of the selected country, indexed by CRISIS.
     """
-    crisis_wide_df = (
-        pd.read_excel(
-            st.session_state["inform_severity_data_path"],
-            sheet_name=sheet_name,
-            header=1,
-        )
-        .rename(
-            columns={
-                "Unnamed: 0": "CRISIS",
-                "Unnamed: 1": "DRIVERS",
-                "Unnamed: 2": "CRISIS ID",
-                "Unnamed: 3": "COUNTRY",
-                "Unnamed: 4": "Iso3",
-            }
-        )
-        .iloc[initial_row_number:]
-    )
-    crisis_wide_df["COUNTRY"] = crisis_wide_df["COUNTRY"].apply(lambda x: country_names_mapping.get(x, x))
-    crisis_wide_df = crisis_wide_df[crisis_wide_df["COUNTRY"] == selected_country].replace("x", 0)
-
-    crisis_wide_df = _clean_columns(crisis_wide_df)
-
-    return crisis_wide_df
+    return _get_crisis_sheet(selected_country, sheet_name, 1, initial_row_number, _prepare_crisis_sheet_many_empty_rows)
 
 
 def _load_crisis_specific_df_few_empty_rows(selected_country: str, sheet_name: str, initial_row_number: int):
@@ -105,24 +212,14 @@ def _load_crisis_specific_df_few_empty_rows(selected_country: str, sheet_name: s
     initial_row_number (int): The initial row number from which to start loading data.
 
     Returns:
-    pd.DataFrame: The loaded DataFrame containing crisis-related data.
+    pd.DataFrame: The loaded DataFrame containing crisis-related data filtered for the selected country.
+    It is shared across sessions and must not be modified in place.
 
     Operation:
-    1. Reads an Excel file into a DataFrame, starting from a specified row, and renames columns.
-    2. Returns the loaded DataFrame containing crisis-related data.
+    1. Gets the sheet from the parsed workbook, with columns and country names already cleaned.
+    2. Returns the rows of the selected country, indexed by CRISIS.
     """
-    crisis_wide_df = (
-        pd.read_excel(
-            st.session_state["inform_severity_data_path"],
-            sheet_name=sheet_name,
-            header=0,
-        ).iloc[initial_row_number:]
-    ).rename(columns={"Crisis": "CRISIS"})
-
-    crisis_wide_df = _clean_columns(crisis_wide_df)
-
-    # st.markdown(crisis_wide_df.columns)
-    return crisis_wide_df
+    return _get_crisis_sheet(selected_country, sheet_name, 0, initial_row_number, _prepare_crisis_sheet_few_empty_rows)
 
 
 def _get_list_of_crises(selected_country: str):
@@ -23,9 +23,8 @@ def _display_main_summary(selected_country: str, display_evidence: bool = True):
     4. If `display_evidence` is True, also presents the evidence sources for the main summary.
     """
 
-    general_summary_df = st.session_state[f"protection_df_{selected_country}"][
-        st.session_state[f"protection_df_{selected_country}"]["Breakdown Column"] == "1 - General Summary"
-    ]
+    protection_df = _load_protection_indicators_data(selected_country)["protection_df"]
+    general_summary_df = protection_df[protection_df["Breakdown Column"] == "1 - General Summary"]
     if len(general_summary_df) == 0:
         st.markdown(f"No information available for the protection summary for {selected_country}")
         return
@@ -71,9 +70,8 @@ def _display_detailed_summaries(selected_country: str, breakdown: str):
         font_size=st.session_state["subtitle_size"],
     )
 
-    detailed_summary_df = st.session_state[f"protection_df_{selected_country}"][
-        st.session_state[f"protection_df_{selected_country}"]["Breakdown Column"] == breakdown
-    ]
+    protection_df = _load_protection_indicators_data(selected_country)["protection_df"]
+    detailed_summary_df = protection_df[protection_df["Breakdown Column"] == breakdown]
 
     values = detailed_summary_df["Value"].unique()
     for one_value in values:
@@ -112,28 +110,25 @@ def _display_protection_data(selected_country: str):
     #     st.session_state["title_size"],
     # )
     breakdown = None
+    protection_data = _load_protection_indicators_data(selected_country)
 
     with st.container():
         _custom_title(
             f"{selected_country} Protection Concerns",
             font_size=40,
             source="ACAPS, Protection Indicators",
-            date=st.session_state[f"protection_df_max_date_{selected_country}"],
+            date=protection_data["max_date"],
         )
 
-    indicator_list = [
-        i
-        for i, breakdown in enumerate(st.session_state[f"possible_breakdowns_{selected_country}"])
-        if breakdown == "Indicator"
-    ]
+    indicator_list = [i for i, breakdown in enumerate(protection_data["possible_breakdowns"]) if breakdown == "Indicator"]
     indicator_id = indicator_list[0] if indicator_list else 0
 
     brekdown_col, _ = st.columns([0.3, 0.7])
-    if st.session_state[f"possible_breakdowns_{selected_country}"]:
+    if protection_data["possible_breakdowns"]:
         with brekdown_col:
             breakdown = st.selectbox(
                 "Breakdown",
-                st.session_state[f"possible_breakdowns_{selected_country}"],
+                protection_data["possible_breakdowns"],
                 index=indicator_id,
                 key="breakdown",
             )
@@ -141,7 +136,7 @@ def _display_protection_data(selected_country: str):
     _display_main_summary(selected_country)
     _add_blank_space(2)
 
-    # for breakdown in st.session_state[f"possible_breakdowns_{selected_country}"]:
+    # for breakdown in protection_data["possible_breakdowns"]:
     if breakdown:
         _display_detailed_summaries(selected_country, breakdown)
     _add_blank_space(2)
@@ -184,8 +179,8 @@ def _display_specific_protection_indicators(selected_country: str):
         # "Torture or inhumane, cruel, or degrading treatment",
         # "Violence/abuse/intolerance towards individuals based on their sexual orientation, gender identity, and gender expression (SOGIE)"  # noqa
     ]
-    _load_protection_indicators_data(selected_country)
-    by_indicators_country_protection_df = st.session_state[f"protection_df_{selected_country}"].copy()
+    protection_data = _load_protection_indicators_data(selected_country)
+    by_indicators_country_protection_df = protection_data["protection_df"].copy()
     by_indicators_country_protection_df = by_indicators_country_protection_df[
         by_indicators_country_protection_df["Breakdown Column"] == "Indicator"
     ][["Value", "Generated Text"]].drop_duplicates()
@@ -193,7 +188,7 @@ def _display_specific_protection_indicators(selected_country: str):
         "Specific Protection Indicators Summaries",
         font_size=st.session_state["subtitle_size"],
         source="ACAPS, Protection Indicators",
-        date=st.session_state[f"protection_df_max_date_{selected_country}"],
+        date=protection_data["max_date"],
     )
 
     columns = st.columns(2)
@@ -4,40 +4,229 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset, _load_country_cached_dataset
+from frontend.src.utils.published_data import (
+    _get_published_country_profile_frame,
+    _get_published_snapshot_path,
+    _read_published_table,
+)
 from frontend.src.utils.utils_functions import _custom_title
 from frontend.src.visualizations.maps_creation import _display_map_img
 
+number_of_events_targeting_civilians_countries_mapping = {
+    "Democratic Republic of Congo": "Congo DRC",
+    "eSwatini": "Eswatini",
+    "Turkey": "Türkiye",
+}
 
-def _load_acled_data():
-    number_of_events_targeting_civilians_countries_mapping = {
-        "Democratic Republic of Congo": "Congo DRC",
-        "eSwatini": "Eswatini",
-        "Turkey": "Türkiye",
-    }
-    number_of_events_targeting_civilians_df_path = os.path.join(
-        st.session_state["tabular_data_data_path"],
-        "acled",
-        "number_events_evolution.csv",
-    )
+events_by_country_columns = [
+    "country",
+    "admin1",
+    "event_date",
+    "latitude",
+    "longitude",
+    "event_type",
+    "fatalities",
+]
+
+
+def _get_acled_data_path(file_name: str) -> str:
+    return os.path.join(st.session_state["tabular_data_data_path"], "acled", file_name)
 
-    number_of_events_targeting_civilians_df = pd.read_csv(number_of_events_targeting_civilians_df_path)
 
+def _read_number_of_events_targeting_civilians_df(number_of_events_targeting_civilians_df_path: os.PathLike):
+    """
+    Reads the ACLED yearly events counts, with country names mapped.
+    """
+    number_of_events_targeting_civilians_df = _read_published_table("acled_number_events_evolution")
+    if number_of_events_targeting_civilians_df is not None:
+        return number_of_events_targeting_civilians_df
+
+    number_of_events_targeting_civilians_df = pd.read_csv(number_of_events_targeting_civilians_df_path)
     number_of_events_targeting_civilians_df["country"] = number_of_events_targeting_civilians_df["country"].replace(
         number_of_events_targeting_civilians_countries_mapping
     )
+    return number_of_events_targeting_civilians_df
 
-    st.session_state["number_of_events_targeting_civilians_df"] = number_of_events_targeting_civilians_df
 
-    st.session_state["individual_events_targetting_civilians"] = pd.read_csv(
-        os.path.join(
-            st.session_state["tabular_data_data_path"],
-            "acled",
-            "individual_events_targetting_civilians_new.csv",
-        )
+def _read_individual_events_targetting_civilians_df(individual_events_df_path: os.PathLike):
+    """
+    Reads the individual events targetting civilians of all countries, with country names mapped.
+    """
+    individual_events_targetting_civilians_df = _read_published_table("acled_individual_events_targetting_civilians")
+    if individual_events_targetting_civilians_df is not None:
+        return individual_events_targetting_civilians_df
+
+    individual_events_targetting_civilians_df = pd.read_csv(individual_events_df_path)
+    individual_events_targetting_civilians_df["country"] = individual_events_targetting_civilians_df["country"].replace(
+        number_of_events_targeting_civilians_countries_mapping
+    )
+    return individual_events_targetting_civilians_df
+
+
+def _to_compact_events_df(events_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts events to the dtypes of the per-country events files and sorts them by date.
+    """
+    events_df = events_df[events_by_country_columns].copy()
+    events_df["event_date"] = pd.to_datetime(events_df["event_date"])
+    events_df["latitude"] = events_df["latitude"].astype("float32")
+    events_df["longitude"] = events_df["longitude"].astype("float32")
+    events_df["fatalities"] = events_df["fatalities"].fillna(0).astype("int32")
+    for col in ["country", "admin1", "event_type"]:
+        # The missing values stay missing, not a "nan" category, like in the ACLED pipeline
+        events_df[col] = events_df[col].where(events_df[col].isna(), events_df[col].astype(str)).astype("category")
+
+    return events_df.dropna(subset=["event_date"]).sort_values("event_date", kind="stable").reset_index(drop=True)
+
+
+def _read_country_events(country_events_path: os.PathLike, individual_events_df_path: os.PathLike, country: str):
+    """
+    Reads the events targetting civilians of one country, sorted by date and with compact dtypes.
+
+    Parameters:
+    country_events_path (os.PathLike): Path to the Parquet events file of the country, written by the ACLED pipeline.
+    individual_events_df_path (os.PathLike): Path to the CSV file with the events of all countries.
+    country (str): The country name.
+
+    Returns:
+    pd.DataFrame: The events of the country.
+
+    Operation:
+    1. Reads the events file of the country if the pipeline produced it.
+    2. Otherwise, takes the country slice of the events of all countries and converts it to the same dtypes.
+    """
+    if os.path.exists(country_events_path):
+        return pd.read_parquet(country_events_path, engine="pyarrow", memory_map=True)
+
+    individual_events_targetting_civilians_df = _load_cached_dataset(
+        "acled_individual_events",
+        [individual_events_df_path, _get_published_snapshot_path()],
+        _read_individual_events_targetting_civilians_df,
+        individual_events_df_path,
+    )
+    return _to_compact_events_df(
+        individual_events_targetting_civilians_df[individual_events_targetting_civilians_df["country"] == country]
+    )
+
+
+def _load_country_events(country: str) -> pd.DataFrame:
+    """
+    Loads the events targetting civilians of one country through the shared per-country datasets cache.
+    """
+    country_events_path = _get_acled_data_path(os.path.join("events_by_country", f"{country}.parquet"))
+    individual_events_df_path = _get_acled_data_path("individual_events_targetting_civilians_new.csv")
+
+    return _load_country_cached_dataset(
+        "acled_events",
+        country,
+        [country_events_path, individual_events_df_path, _get_published_snapshot_path()],
+        _read_country_events,
+        country_events_path,
+        individual_events_df_path,
+        country,
+    )
+
+
+def _build_events_admin1_monthly_cube(events_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Counts the events and sums the fatalities per country, admin1, event type and month, like the ACLED pipeline.
+    """
+    events_df = events_df.assign(month=events_df["event_date"].dt.to_period("M").dt.to_timestamp())
+    return (
+        events_df.groupby(["country", "admin1", "event_type", "month"], as_index=False, observed=True)
+        .agg(events_count=("event_date", "count"), fatalities=("fatalities", "sum"))
+        .sort_values("month", kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _read_country_events_cube(cube_path: os.PathLike, country: str):
+    """
+    Reads the monthly admin1 events cube of one country, computed from its events if the pipeline did not produce it.
+    """
+    if os.path.exists(cube_path):
+        return pd.read_parquet(cube_path, engine="pyarrow", filters=[("country", "==", country)]).reset_index(drop=True)
+
+    return _build_events_admin1_monthly_cube(_load_country_events(country))
+
+
+def _load_country_events_cube(country: str) -> pd.DataFrame:
+    """
+    Loads the monthly admin1 events cube of one country through the shared per-country datasets cache.
+    """
+    cube_path = _get_acled_data_path("events_admin1_monthly.parquet")
+
+    return _load_country_cached_dataset(
+        "acled_events_cube",
+        country,
+        [
+            cube_path,
+            _get_acled_data_path(os.path.join("events_by_country", f"{country}.parquet")),
+            _get_acled_data_path("individual_events_targetting_civilians_new.csv"),
+            _get_published_snapshot_path(),
+        ],
+        _read_country_events_cube,
+        cube_path,
+        country,
+    )
+
+
+def _get_admin1_events_summary(
+    country_events_df: pd.DataFrame, country_cube_df: pd.DataFrame, start_date: pd.Timestamp, event_type: str
+) -> pd.DataFrame:
+    """
+    Returns the events count and total fatalities per admin1 from `start_date` onwards.
+
+    Parameters:
+    country_events_df (pd.DataFrame): Events of the country, sorted by date.
+    country_cube_df (pd.DataFrame): Monthly admin1 events cube of the country.
+    start_date (pd.Timestamp): Start of the date window.
+    event_type (str): Selected event type, "All" for every type.
+
+    Returns:
+    pd.DataFrame: One row per admin1 with the 'events_count' and 'fatalities' columns.
+
+    Operation:
+    1. Sums the cube buckets of the months fully covered by the window.
+    2. Aggregates the raw events of the partially covered first month, found with a binary search.
+    3. Adds both parts per admin1.
+    """
+    first_full_month = start_date.to_period("M").to_timestamp()
+    if first_full_month < start_date:
+        first_full_month = first_full_month + pd.DateOffset(months=1)
+
+    full_months_df = country_cube_df[country_cube_df["month"] >= first_full_month]
+
+    event_dates = country_events_df["event_date"]
+    first_month_events_df = country_events_df.iloc[
+        event_dates.searchsorted(start_date) : event_dates.searchsorted(first_full_month)
+    ]
+    if event_type != "All":
+        full_months_df = full_months_df[full_months_df["event_type"] == event_type]
+        first_month_events_df = first_month_events_df[first_month_events_df["event_type"] == event_type]
+
+    first_month_df = first_month_events_df.groupby("admin1", as_index=False, observed=True).agg(
+        events_count=("event_date", "count"), fatalities=("fatalities", "sum")
+    )
+
+    return (
+        pd.concat([full_months_df[["admin1", "events_count", "fatalities"]], first_month_df])
+        .astype({"admin1": str})
+        .groupby("admin1", as_index=False)[["events_count", "fatalities"]]
+        .sum()
+    )
+
+
+def _load_acled_data():
+    number_of_events_targeting_civilians_df_path = _get_acled_data_path("number_events_evolution.csv")
+
+    st.session_state["number_of_events_targeting_civilians_df"] = _load_cached_dataset(
+        "acled",
+        [number_of_events_targeting_civilians_df_path, _get_published_snapshot_path()],
+        _read_number_of_events_targeting_civilians_df,
+        number_of_events_targeting_civilians_df_path,
     )
-    st.session_state["individual_events_targetting_civilians"]["country"] = st.session_state[
-        "individual_events_targetting_civilians"
-    ]["country"].replace(number_of_events_targeting_civilians_countries_mapping)
     st.session_state["acled_last_updated"] = st.session_state["number_of_events_targeting_civilians_df"]["year"].max()
 
 
@@ -47,15 +236,21 @@ def _display_number_of_events_targetting_civilians(selected_country: str):
     Displays a line chart showing the number of events targeting civilians over the years for the selected country.
 
     Operation:
-    1. Retrieves the dataframe containing the number of events targeting civilians for the selected country.
-    2. Filters and sorts the dataframe based on the selected country and year.
+    1. Retrieves the number of events targeting civilians of the selected country, from its published profile bundle
+       or filtered from the dataframe of all countries.
+    2. Sorts the dataframe based on the year.
     3. If data is available, sets a custom title for the chart.
     4. Constructs a line chart using Altair to visualize the number of events over the years.
     """
 
-    one_country_number_of_events_targeting_civilians = st.session_state["number_of_events_targeting_civilians_df"][
-        st.session_state["number_of_events_targeting_civilians_df"].country == selected_country
-    ].copy()
+    one_country_number_of_events_targeting_civilians = _get_published_country_profile_frame(
+        selected_country, "acled_number_events_evolution"
+    )
+    if one_country_number_of_events_targeting_civilians is None:
+        one_country_number_of_events_targeting_civilians = st.session_state["number_of_events_targeting_civilians_df"][
+            st.session_state["number_of_events_targeting_civilians_df"].country == selected_country
+        ]
+    one_country_number_of_events_targeting_civilians = one_country_number_of_events_targeting_civilians.copy()
 
     one_country_number_of_events_targeting_civilians.reset_index(drop=True, inplace=True)
 
@@ -116,14 +311,15 @@ def _display_acled_map_data(selected_country: str):
 
     Operation:
     1. Sets a custom title for the map section displaying protection-related events.
-    2. Constructs the path to the CSV file containing protection-related events data specific to the selected country.
-    3. Checks if the events dataset for the selected country is already loaded in session state. If not, loads and stores it.
+    2. Loads the events of the selected country, sorted by date, through the shared dataset cache.
+    3. Returns early with a message if the selected country has no events.
     4. Creates a dropdown to select event types from the loaded events dataset.
     5. Creates a dropdown to select a past date range (3 months, 6 months, or 1 year).
     6. Based on the selected past date range, calculates the start date for filtering events data.
-    7. Filters the displayed DataFrame (`displayed_df`) based on the selected event type and date range.
+    7. Slices the events from the start date with a binary search, then filters them on the selected event type.
     8. Displays the count of events and their characteristics (event type, date range, total events).
-    9. Calls `_display_map_img` to visualize the filtered protection-related events on a map using PolyDeck (PDK).
+    9. Gets the events count and fatalities per admin1 from the monthly cube.
+    10. Calls `_display_map_img` to visualize the filtered protection-related events on a map using PolyDeck (PDK).
     """
     _custom_title(
         "Protection-Related Events",
@@ -132,32 +328,21 @@ def _display_acled_map_data(selected_country: str):
         date=st.session_state["acled_last_updated"],
     )
 
-    if f"events_dataset_{selected_country}" not in st.session_state:
-        st.session_state[f"events_dataset_{selected_country}"] = st.session_state["individual_events_targetting_civilians"][
-            st.session_state["individual_events_targetting_civilians"].country == selected_country
-        ]
-        if len(st.session_state[f"events_dataset_{selected_country}"]) == 0:
-            st.markdown(f"No information available for the protection-related-events for {selected_country}")
-            return
-        st.session_state["events_list"] = (
-            st.session_state[f"events_dataset_{selected_country}"]["event_type"].unique().tolist()
-        )
-        st.session_state["events_list"] = ["All"] + sorted(st.session_state["events_list"])
-
-    displayed_df = st.session_state[f"events_dataset_{selected_country}"].copy()
-    displayed_df["event_date"] = pd.to_datetime(displayed_df["event_date"])
-
-    if displayed_df.empty:
-        st.markdown(f"No information available for the year {st.session_state['acled_last_updated']}")
+    # Shared across sessions and sorted by date, it is sliced but never modified
+    country_events_df = _load_country_events(selected_country)
+    if country_events_df.empty:
+        st.markdown(f"No information available for the protection-related-events for {selected_country}")
         return
 
+    events_list = ["All"] + sorted(country_events_df["event_type"].unique().tolist())
+
     with st.container():
         filter_col, date_range_col = st.columns([0.5, 0.5])
 
         with filter_col:
             event_type = st.selectbox(
                 "Select Event Type",
-                st.session_state["events_list"],
+                events_list,
             )
         with date_range_col:
             past_date = st.selectbox(
@@ -175,7 +360,8 @@ def _display_acled_map_data(selected_country: str):
             elif past_date == "Past 2 years":
                 start_date = today_date - pd.DateOffset(months=24)
 
-    displayed_df = displayed_df[displayed_df["event_date"] >= start_date]
+    # Binary search of the first event in the date window
+    displayed_df = country_events_df.iloc[country_events_df["event_date"].searchsorted(start_date) :]
     if event_type != "All":
         displayed_df = displayed_df[displayed_df["event_type"] == event_type]
 
@@ -183,4 +369,7 @@ def _display_acled_map_data(selected_country: str):
 
     st.markdown(f"**Events Map ({event_text}, {past_date}, {displayed_df.shape[0]} total events)**")
     # Add more content here
-    _display_map_img(displayed_df, selected_country)
+    admin1_events_summary_df = _get_admin1_events_summary(
+        country_events_df, _load_country_events_cube(selected_country), start_date, event_type
+    )
+    _display_map_img(displayed_df, selected_country, admin1_events_summary_df)
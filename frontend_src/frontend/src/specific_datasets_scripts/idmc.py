@@ -1,6 +1,15 @@
+import os
+from typing import List
+
 import pandas as pd
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset
+from frontend.src.utils.published_data import (
+    _get_published_country_profile_frame,
+    _get_published_snapshot_path,
+    _read_published_table,
+)
 from frontend.src.utils.utils_functions import _custom_title
 from frontend.src.visualizations.barchart import (
     _display_stackbar,
@@ -8,21 +17,39 @@ from frontend.src.visualizations.barchart import (
 )
 
 
-@st.fragment
-def _load_idmc_data():
+def _read_idmc_data(idmc_data_path: os.PathLike, countries: List[str]):
     """
-    Function to load the IDMC data from the Excel file.
+    Function to read the IDMC data from the Excel file.
     """
     mapping_countries = {
         "Dem. Rep. Congo": "Congo DRC",
     }
-    df = pd.read_excel(st.session_state["idmc_data_path"], sheet_name="3_IDPs_SADD_estimates")
-    df["Country"] = df["Country"].apply(lambda x: mapping_countries.get(x, x))
-    df = df[df["Country"].isin(st.session_state["countries"])]
+    df = _read_published_table("idmc")
+    if df is None:
+        df = pd.read_excel(idmc_data_path, sheet_name="3_IDPs_SADD_estimates")
+        df["Country"] = df["Country"].apply(lambda x: mapping_countries.get(x, x))
+    df = df[df["Country"].isin(countries)]
 
     return df
 
 
+def _load_idmc_data():
+    """
+    Function to load the IDMC data through the shared dataset cache.
+    """
+    return _load_cached_dataset(
+        "idmc",
+        [
+            st.session_state["idmc_data_path"],
+            st.session_state["countries_list_path"],
+            _get_published_snapshot_path(),
+        ],
+        _read_idmc_data,
+        st.session_state["idmc_data_path"],
+        list(st.session_state["countries"]),
+    )
+
+
 def _display_one_cause_results(df: pd.DataFrame, displacement_cause: str):
     """
     Displays results for displacement driven by a specific cause (either 'Conflict' or 'Disaster').
@@ -99,17 +126,18 @@ def _get_displacement_numbers(selected_country: str):
 
     Operation:
     1. Sets a custom title for the displacement section.
-    2. Retrieves the dataframe containing displacement data (IDMC, GRID) for the selected country.
-    3. Filters the dataframe based on the selected country.
+    2. Retrieves the displacement data (IDMC, GRID) of the selected country, from its published profile bundle
+       or filtered from the dataframe of all countries.
+    3. Resets its index.
     4. If no data is available, displays a message indicating no data.
     5. If data is available, displays results for both conflict and disaster causes using _display_one_cause_results().
     """
     source_name = "IDMC, GRID"
 
-    country_df = st.session_state["idmc_df"].copy()
-
-    country_df = country_df[country_df["Country"] == selected_country]
-    country_df.reset_index(drop=True, inplace=True)
+    country_df = _get_published_country_profile_frame(selected_country, "idmc")
+    if country_df is None:
+        country_df = st.session_state["idmc_df"][st.session_state["idmc_df"]["Country"] == selected_country]
+    country_df = country_df.reset_index(drop=True)
 
     if len(country_df) == 0:
         _custom_title(
@@ -1,6 +1,15 @@
+import os
+from typing import List
+
 import pandas as pd
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset
+from frontend.src.utils.published_data import (
+    _get_published_country_profile_frame,
+    _get_published_snapshot_path,
+    _read_published_table,
+)
 from frontend.src.utils.utils_functions import _custom_title
 from frontend.src.visualizations.barchart import (
     _create_horizontal_continous_scale_barplot,
@@ -9,88 +18,56 @@ from frontend.src.visualizations.barchart import (
 
 
 def _load_preprocess_ipc_data():
+    """
+    Loads the preprocessed IPC data through the shared dataset cache.
+    """
+    return _load_cached_dataset(
+        "ipc",
+        [
+            st.session_state["ipc_data_path"],
+            st.session_state["countries_list_path"],
+            _get_published_snapshot_path(),
+        ],
+        _read_preprocess_ipc_data,
+        st.session_state["ipc_data_path"],
+        list(st.session_state["countries"]),
+    )
+
+
+def _read_preprocess_ipc_data(ipc_data_path: os.PathLike, countries: List[str]):
     """
     Loads and preprocesses IPC (Integrated Food Security Phase Classification) data.
 
     Operation:
-    1. Defines a dictionary mapping countries to their abbreviations.
-    2. Creates a reverse dictionary to map abbreviations back to country names.
-    3. Specifies relevant columns to read from the IPC data file.
-    4. Reads the IPC data file into a DataFrame, skipping the first row.
-    5. Filters the DataFrame to include only current validity period and Phase 3+ (food insecurity).
-    6. Renames columns for clarity.
-    7. Converts the 'Number of Food Insecure People' column to integer type.
-    8. Maps abbreviated country names to full country names using the reverse dictionary.
-    9. Filters the DataFrame to include only countries in the session state.
-    10. Returns the preprocessed DataFrame.
+    1. Reads the IPC table of the published snapshot, whose country abbreviations are mapped to the country names
+       by the publish step. Without it, returns an empty DataFrame, the raw file only having the abbreviations.
+    2. Filters the DataFrame to include only current validity period and Phase 3+ (food insecurity).
+    3. Renames columns for clarity.
+    4. Converts the 'Number of Food Insecure People' column to integer type.
+    5. Filters the DataFrame to include only the given countries.
+    6. Returns the preprocessed DataFrame.
     """
-    countries_abbr = {
-        "Afghanistan": "AFG",
-        "Bangladesh": "BAN",
-        "Burkina Faso": "BFA",
-        "Burundi": "BDI",
-        "Cameroon": "CMR",
-        "Central African Republic": "CAR",
-        "Chad": "CHA",
-        "Colombia": "COL",
-        "Congo DRC": "COD",
-        "Ecuador": "ECU",
-        "El Salvador": "SLV",
-        "Ethiopia": "ETH",
-        "Guatemala": "GTM",
-        "Haiti": "HTI",
-        "Honduras": "HON",
-        "Iran": "IRN",
-        "Iraq": "IRQ",
-        "Jordan": "JOR",
-        "Kenya": "KEN",
-        "Lebanon": "LBN",
-        "Libya": "LBY",
-        "Madagascar": "MAD",
-        "Malawi": "MWI",
-        "Mali": "MLI",
-        "Mexico": "MEX",
-        "Mozambique": "MOZ",
-        "Myanmar": "MMR",
-        "Nepal": "NEP",
-        "Nicaragua": "NIC",
-        "Niger": "NIG",
-        "Nigeria": "NGA",
-        "Pakistan": "PAK",
-        "Palestine": "PAL",
-        "Peru": "PER",
-        "Philippines": "PHI",
-        "Somalia": "SOM",
-        "South Sudan": "SSD",
-        "Sudan": "SUD",
-        "Syria": "SYR",
-        "Türkiye": "TUR",
-        "Ukraine": "UKR",
-        "Venezuela": "VEN",
-        "Yemen": "YEM",
-        "Zimbabwe": "ZIM",
-    }
-    abrev2country = {v: k for k, v in countries_abbr.items()}
-
     relevant_cols = [
         "Date of analysis",
-        "Country",
+        "Country abrv",
         "Level 1",
         "Validity period",
         "Phase",
         "Number",
+        "Country",
     ]
-    df = pd.read_csv(st.session_state["ipc_data_path"], usecols=relevant_cols).iloc[1:]
-    df = df[(df["Validity period"] == "current") & (df["Phase"] == "3+")].rename(
-        columns={
-            "Country": "Country abrv",
-            "Level 1": "Region Name",
-            "Number": "Number of Food Insecure People",
-        }
-    )
+    renamed_cols = {
+        "Level 1": "Region Name",
+        "Number": "Number of Food Insecure People",
+    }
+    df = _read_published_table("ipc")
+    if df is None:
+        print(f"IPC table not published, the countries of {ipc_data_path} are not mapped")
+        return pd.DataFrame(columns=relevant_cols).rename(columns=renamed_cols)
+
+    df = df[(df["Validity period"] == "current") & (df["Phase"] == "3+")][relevant_cols].rename(columns=renamed_cols)
     df["Number of Food Insecure People"] = df["Number of Food Insecure People"].astype(int)
-    df["Country"] = df["Country abrv"].apply(lambda x: abrev2country.get(x, x))
-    df = df[df["Country"].isin(st.session_state["countries"])]
+    df = df[df["Country"].isin(countries)]
     # st.dataframe(df)
     return df
 
@@ -102,7 +79,7 @@ def _plot_ipc_results(selected_country: str):
 
     Operation:
     1. Sets a custom title for the Food Insecurity section.
-    2. Copies and filters the IPC DataFrame for the selected country.
+    2. Copies the IPC rows of the selected country, from its published profile bundle or filtered from the IPC DataFrame.
     3. Checks if data is available for the selected country; if not, displays a message and returns.
     4. Sorts the filtered DataFrame by the number of food insecure people in ascending order.
     5. Adds a column 'Shown Number' with abbreviated numbers for display.
@@ -114,8 +91,10 @@ def _plot_ipc_results(selected_country: str):
        - Custom color, title, x-axis and y-axis titles.
     """
 
-    ipc_one_country_values_df = st.session_state["ipc_df"].copy()
-    ipc_one_country_values_df = ipc_one_country_values_df[ipc_one_country_values_df["Country"] == selected_country]
+    ipc_one_country_values_df = _get_published_country_profile_frame(selected_country, "ipc")
+    if ipc_one_country_values_df is None:
+        ipc_one_country_values_df = st.session_state["ipc_df"][st.session_state["ipc_df"]["Country"] == selected_country]
+    ipc_one_country_values_df = ipc_one_country_values_df.copy()
 
     if len(ipc_one_country_values_df) == 0:
         _custom_title("Food Insecurity", font_size=st.session_state["subtitle_size"], source="IPC")
@@ -128,15 +107,13 @@ def _plot_ipc_results(selected_country: str):
 
     max_date = ipc_one_country_values_df["Formatted Date"].max()
 
-    st.session_state[f"max_date_ipc_{selected_country}"] = max_date.strftime("%b %Y")
-
     ipc_one_country_values_df = ipc_one_country_values_df[ipc_one_country_values_df["Formatted Date"] == max_date]
 
     _custom_title(
         "Food Insecurity",
         font_size=st.session_state["subtitle_size"],
         source="IPC",
-        date=st.session_state[f"max_date_ipc_{selected_country}"],
+        date=max_date.strftime("%b %Y"),
     )
 
     ipc_one_country_values_df = ipc_one_country_values_df[
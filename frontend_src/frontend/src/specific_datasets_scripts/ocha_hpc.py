@@ -1,5 +1,8 @@
+from typing import Dict, List, Optional
+
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
 from frontend.src.utils.utils_functions import (
@@ -27,6 +30,129 @@ def plan_type_order_handler(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _select_priority_plans(df: pd.DataFrame, group_cols: List[str]) -> pd.DataFrame:
+    """
+    Keeps one plan per group of `group_cols`, following the order of `df`: the first plan that is not a flash appeal,
+    or the first plan of the group when it only has flash appeals.
+    """
+    is_flash = df["name"].str.contains("flash", case=False, na=False)
+    has_other_plans = (~is_flash).groupby([df[col] for col in group_cols], dropna=False).transform("any")
+    return df[~is_flash | ~has_other_plans].drop_duplicates(subset=group_cols, keep="first")
+
+
+def _split_by_country(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    return {
+        country: country_df.drop(columns="country").reset_index(drop=True) for country, country_df in df.groupby("country")
+    }
+
+
+def _get_global_funding_chart_data(global_funding_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes the melted frame of the global funding chart for all the years, with the amounts in millions.
+    """
+    df = global_funding_df.rename(
+        columns={
+            "funding_requested": "Funding Requested",
+            "funding_received": "Funding Received",
+            "total_countries": "Total Countries",
+        },
+    )
+    df_melted = df.melt(
+        id_vars=["year", "Total Countries"],
+        value_vars=["Funding Requested", "Funding Received"],
+        var_name="Funding Type",
+        value_name="amount",
+    )
+    df_melted["amount"] = (df_melted["amount"] / 1_000_000).round(2)
+    return df_melted
+
+
+def _get_country_funding_charts_data(country_funding_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Computes the melted frame of the country funding chart of every country for all the years, with the amounts in millions.
+
+    Operation:
+    1. Orders the plans by year and plan type, the HRP coming first.
+    2. Keeps one plan per country and year, the first one which is not a flash appeal if there is one.
+    3. Melts the requested and received fundings into one column and splits the frame by country.
+    """
+    if country_funding_df.empty:
+        return {}
+
+    df = plan_type_order_handler(country_funding_df.copy())
+    df = _select_priority_plans(df, ["country", "year"])
+    df = df.rename(
+        columns={
+            "funding_requested": "Funding Requested",
+            "funding_received": "Funding Received",
+        },
+    )
+    df_melted = df.melt(
+        id_vars=["country", "year"],
+        value_vars=["Funding Requested", "Funding Received"],
+        var_name="Funding Type",
+        value_name="amount",
+    )
+    df_melted["amount"] = (df_melted["amount"] / 1_000_000).round(2)
+    return _split_by_country(df_melted)
+
+
+def _get_cp_beneficiaries_charts_data(all_pin_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Computes the melted frame of the CP beneficiaries chart of every country for all the years, with the numbers in millions.
+
+    Operation:
+    1. Keeps one plan per year, country and plan type, the first one which is not a flash appeal if there is one.
+    2. Keeps the plan of the type of highest priority for each country and year, the HRP coming first.
+    3. Melts the CP beneficiaries and targeted numbers into one column and splits the frame by country.
+    """
+    df = _select_priority_plans(all_pin_df, ["year", "country", "plan_type"])
+    df = plan_type_order_handler(df.copy())
+    df = df.drop_duplicates(subset=["year", "country"], keep="first")
+    df = df.rename(columns={"cp_beneficiaries": "CP Beneficiaries", "cp_targeted": "CP Targeted"})
+    df_melted = df.melt(
+        id_vars=["country", "year"],
+        value_vars=["CP Beneficiaries", "CP Targeted"],
+        var_name="CP Type",
+        value_name="cp_numbers",
+    )
+    df_melted["cp_numbers"] = (df_melted["cp_numbers"] / 1_000_000).round(2)
+    return _split_by_country(df_melted)
+
+
+@st.cache_data(max_entries=512)
+def _get_grouped_barplot_figure(
+    df_melted: pd.DataFrame,
+    y_col: str,
+    color_col: str,
+    color_discrete_map: Dict[str, str],
+    labels: Dict[str, str],
+    text_auto: bool,
+    textfont_size: Optional[int] = None,
+    hover_data: Optional[Dict[str, bool]] = None,
+) -> go.Figure:
+    """
+    Creates the grouped bar chart of a melted frame, cached on the content of the frame and the styling arguments.
+    """
+    fig = px.bar(
+        df_melted,
+        x="year",
+        y=y_col,
+        color=color_col,
+        color_discrete_map=color_discrete_map,
+        barmode="group",
+        labels=labels,
+        text=y_col,
+        text_auto=text_auto,
+        hover_data=hover_data,
+        height=None,
+    )
+    fig.update_traces(texttemplate="%{y:,} million", textposition="outside")
+    if textfont_size is not None:
+        fig.update_traces(textfont=dict(size=textfont_size))
+    return fig
+
+
 def _display_top_countries_with_children_in_need(n_kept_countries: int = 10):
     """
     Displays a horizontal single-scale bar plot showing the top countries with the highest proportion of children in need.
@@ -155,154 +281,63 @@ def _display_evolution_data():
     )
 
 
-def _get_total_CP_caseload_in_need():
-    """
-    Calculates and returns the total number of children in need across
-    countries and the number of countries reporting children in need.
-
-    Returns:
-    - Tuple[str, int]: A tuple containing:
-    - Total number of children in need formatted with commas.
-    - Number of countries reporting children in need.
-
-    Operation:
-    1. Copies the 'country_wise_pin_data' DataFrame from session state into 'df'.
-    2. Computes the sum of 'children_in_need' column values in 'df'
-       to get the total number of children in need.
-    3. Counts the number of countries in 'df' where 'children_in_need' values
-       are not NaN to determine the number of reporting countries.
-    4. Formats the total number of children in need using '_add_commas' function for readability.
-    5. Returns a tuple with the formatted total number of children in
-       need and the count of reporting countries.
-    """
-
-    df = st.session_state["country_wise_pin_data"].copy()
-    total_number_of_children_in_need = int(df["children_in_need"].sum())
-    n_countries = len(df["country"].unique())
-    return _add_commas(total_number_of_children_in_need), n_countries
-
-
-def _get_ratio_children_in_need_to_pop_in_need():
-    """
-    Calculates the ratio of children in need to total population in need across countries reporting both values.
-
-    Returns:
-    - Tuple[str, int]: A tuple containing:
-    - Ratio of children in need to total population in need formatted as a percentage.
-    - Number of countries with available data for both children in need and total population in need.
-
-    Operation:
-    1. Copies the 'country_wise_pin_data' DataFrame from session state into 'df'.
-    2. Filters 'df' to include rows where both 'children_in_need' and 'tot_pop_in_need' columns are not NaN.
-    3. Computes the ratio of the sum of 'children_in_need' to the sum of 'tot_pop_in_need' in 'df'.
-    4. Formats the ratio as a percentage using the '_get_percentage' function.
-    5. Counts the number of rows (countries) in the filtered 'df' to determine the number of countries with available data.
-    6. Returns a tuple with the formatted ratio and the count of countries with available data.
-    """
-    df = st.session_state["country_wise_pin_data"].copy()
-    df = df[(df["tot_pop_in_need"].notna()) & (df["children_in_need"].notna())]
-    if df["tot_pop_in_need"].sum() > 0:
-        ratio = df["children_in_need"].sum() / df["tot_pop_in_need"].sum()
-    else:
-        ratio = 0
-
-    ratio = _get_percentage(ratio)
-    number_of_countries = len(df["country"].unique())
-    return ratio, number_of_countries
-
-
-def _get_ratio_children_targeted_to_children_in_need():
+def _get_global_key_indicators() -> Dict[str, str]:
     """
-    Calculates the ratio of targeted children to children in need across countries reporting both values.
+    Formats the key indicators of the selected year for the Global Overview tiles.
 
     Returns:
-    - Tuple[str, int]: A tuple containing:
-    - Ratio of targeted children to children in need formatted as a percentage.
-    - Number of countries with available data for both targeted children and children in need.
+    - Dict[str, str]: The shown value of each indicator of `global_kpis_columns`, '-' when the year has no value.
 
     Operation:
-    1. Copies the 'country_wise_pin_data' DataFrame from session state into 'df'.
-    2. Filters 'df' to include rows where both 'targeted_children' and 'children_in_need' columns are not NaN.
-    3. Computes the ratio of the sum of 'targeted_children' to the sum of 'children_in_need' in 'df'.
-    4. Formats the ratio as a percentage using the '_get_percentage' function.
-    5. Counts the number of rows (countries) in the filtered 'df' to determine the number of countries with available data.
-    6. Returns a tuple with the formatted ratio and the count of countries with available data.
+    1. Reads the row of the selected year, looked up by the dataset loader from the key indicators table.
+    2. Abbreviates the CP caseload in need and the CP beneficiaries above a million.
+    3. Formats the ratios as percentages and the numbers of countries as integers.
     """
+    year_kpis = st.session_state["global_kpis"]
+
+    def _is_missing(col: str) -> bool:
+        return col not in year_kpis or pd.isna(year_kpis[col])
+
+    key_indicators = {col: "-" if _is_missing(col) else str(int(year_kpis[col])) for col in global_kpis_columns}
+
+    if not _is_missing("children_in_need"):
+        key_indicators["children_in_need"] = _get_abbreviated_number(int(year_kpis["children_in_need"]))
+    for col in [
+        "ratio_children_in_need_to_pop_in_need",
+        "ratio_children_targeted_to_children_in_need",
+        "ratio_global_funding",
+    ]:
+        if not _is_missing(col):
+            key_indicators[col] = _get_percentage(year_kpis[col])
+    if not _is_missing("cp_beneficiaries"):
+        cp_beneficiaries = year_kpis["cp_beneficiaries"]
+        if cp_beneficiaries >= 1_000_000:
+            key_indicators["cp_beneficiaries"] = f"{round(cp_beneficiaries / 1_000_000, 2)} million"
+        else:
+            key_indicators["cp_beneficiaries"] = _add_commas(int(cp_beneficiaries))
 
-    df = st.session_state["country_wise_pin_data"].copy()
-    df = df[(df["targeted_children"].notna()) & (df["children_in_need"].notna())]
-    if df["children_in_need"].sum() > 0:
-        ratio = df["targeted_children"].sum() / df["children_in_need"].sum()
-    else:
-        ratio = 0
-    ratio = _get_percentage(ratio)
-    number_of_countries = len(df["country"].unique())
-    return ratio, number_of_countries
-
-
-def _get_cp_beneficiaries():
-    df = st.session_state["ocha_hpc_global_funding_df"].copy()
-    df = df[df["year"] == st.session_state["selected-year"]]
-    df.reset_index(drop=True, inplace=True)
-    cp_beneficiaries = df["cp_beneficiaries"].iat[0]
-    if cp_beneficiaries >= 1_000_000:
-        cp_beneficiaries = f"{round(cp_beneficiaries / 1_000_000, 2)} million"
-    total_countries = df["total_countries"].iat[0]
-    return cp_beneficiaries, total_countries
-
-
-def _get_ratio_global_funding():
-    df = st.session_state["ocha_hpc_global_funding_df"].copy()
-    df = df[df["year"] == st.session_state["selected-year"]]
-    df.reset_index(drop=True, inplace=True)
-    ratio = df["funding_received"].iat[0] / df["funding_requested"].iat[0]
-    ratio = _get_percentage(ratio)
-    total_countries = df["total_countries"].iat[0]
-    return ratio, total_countries
+    return key_indicators
 
 
 def display_global_funding():
     """Plot a grouped barchart related to funding"""
-    global_funding_df = st.session_state["ocha_hpc_global_funding_df"]
+    df_melted = st.session_state["ocha_hpc_global_funding_chart_data"]
     # Filter based on selected year
-    global_funding_df = global_funding_df[global_funding_df["year"] <= st.session_state["selected-year"]]
-    global_funding_df.reset_index(drop=True, inplace=True)
-
-    global_funding_df.rename(
-        columns={
-            "funding_requested": "Funding Requested",
-            "funding_received": "Funding Received",
-            "total_countries": "Total Countries",
-        },
-        inplace=True,
-    )
+    df_melted = df_melted[df_melted["year"] <= st.session_state["selected-year"]]
 
-    if len(global_funding_df):
-        df_melted = global_funding_df.melt(
-            id_vars=["year", "Total Countries"],
-            value_vars=["Funding Requested", "Funding Received"],
-            var_name="Funding Type",
-            value_name="amount",
-        )
-
-        df_melted["amount"] = df_melted["amount"].apply(lambda x: round(x / 1_000_000, 2))
-
-        fig = px.bar(
+    if len(df_melted):
+        fig = _get_grouped_barplot_figure(
             df_melted,
-            x="year",
-            y="amount",
-            color="Funding Type",
+            y_col="amount",
+            color_col="Funding Type",
             color_discrete_map={
                 "Funding Requested": "#D6E9DF",
                 "Funding Received": "#B1DBC3",
             },
-            barmode="group",
             labels={"amount": "Funding Amount (in millions)", "year": "Year"},
-            text="amount",
+            text_auto=False,
             hover_data={"Total Countries": True},
-            height=None,
         )
-        fig.update_traces(texttemplate="%{y:,} million", textposition="outside")
         st.plotly_chart(fig)
     else:
         st.write("No funding related data available.")
@@ -320,12 +355,6 @@ def country_mapping(country: str):
 
 def display_country_level_funding(selected_country: str):
     """Plot a grouped barchart related to funding"""
-
-    def group_filter(group):
-        if len(group) > 1:
-            return group[~group["name"].str.contains("flash", case=False, na=False)].iloc[0]
-        return group.iloc[0]
-
     year = st.session_state["selected-year"]
     selected_country = country_mapping(selected_country)
 
@@ -340,50 +369,24 @@ def display_country_level_funding(selected_country: str):
         If both type of documents are available for a country, the HNRP will take priority.**"
     )  # noqa
 
-    df = st.session_state["ocha_hpc_country_funding_df"]
-    df = df[(df["country"] == selected_country) & (df["year"] <= year)]
-    df.reset_index(drop=True, inplace=True)
-
-    df = plan_type_order_handler(df.copy())
-    df = df.groupby("year").apply(group_filter).reset_index(drop=True)
-
-    df.rename(
-        columns={
-            "funding_requested": "Funding Requested",
-            "funding_received": "Funding Received",
-        },
-        inplace=True,
+    # Computed once per data version for every country and year, see `_get_country_funding_charts_data`
+    df_melted = st.session_state["ocha_hpc_country_funding_charts_data"].get(
+        selected_country, pd.DataFrame(columns=["year"])
     )
+    df_melted = df_melted[df_melted["year"] <= year]
 
-    if len(df):
-        df_melted = df.melt(
-            id_vars=["year"],
-            value_vars=["Funding Requested", "Funding Received"],
-            var_name="Funding Type",
-            value_name="amount",
-        )
-
-        df_melted["amount"] = df_melted["amount"].apply(lambda x: round(x / 1_000_000, 2))
-
-        fig = px.bar(
+    if len(df_melted):
+        fig = _get_grouped_barplot_figure(
             df_melted,
-            x="year",
-            y="amount",
-            color="Funding Type",
+            y_col="amount",
+            color_col="Funding Type",
             color_discrete_map={
                 "Funding Requested": "#D6E9DF",
                 "Funding Received": "#B1DBC3",
             },
-            barmode="group",
             labels={"amount": "Funding Amount (in millions)", "year": "Year"},
-            text="amount",
             text_auto=True,
-            height=None,
-        )
-        fig.update_traces(
-            texttemplate="%{y:,} million",
-            textposition="outside",
-            textfont=dict(size=30),
+            textfont_size=30,
         )
         st.plotly_chart(fig)
     else:
@@ -424,15 +427,6 @@ def display_country_level_funding(selected_country: str):
 
 def display_cp_beneficiaries(selected_country: str):
     """Plot a grouped barchart related to funding"""
-
-    def pick_valid_row(group):
-        valid_rows = pd.DataFrame()
-        if len(group) >= 2:
-            # Filter out rows where 'name' contains the keyword 'flash'
-            valid_rows = group[~group["name"].str.contains("flash", case=False, na=False)]
-        # If we have any valid rows, pick the first one; otherwise fallback to the first in the group
-        return valid_rows.iloc[0] if not valid_rows.empty else group.iloc[0]
-
     year = st.session_state["selected-year"]
     selected_country = country_mapping(selected_country)
 
@@ -443,51 +437,22 @@ def display_cp_beneficiaries(selected_country: str):
         date=f"{min(st.session_state['filter-years'])}-{year}",
     )
 
-    df = st.session_state["all_pin_data"]
-
-    df = df[(df["country"] == selected_country) & (df["year"] <= year)]
-    df.reset_index(drop=True, inplace=True)
-    # Note: If there are plans of same types, get the first one.
-
-    df = df.groupby(["year", "country", "plan_type"], as_index=False).apply(pick_valid_row).reset_index(drop=True)
-
-    df = plan_type_order_handler(df=df)
-
-    df = df.drop_duplicates(subset=["year", "country"], keep="first")
-    df.rename(
-        columns={"cp_beneficiaries": "CP Beneficiaries", "cp_targeted": "CP Targeted"},
-        inplace=True,
-    )
-
-    if len(df):
-        df_melted = df.melt(
-            id_vars=["year"],
-            value_vars=["CP Beneficiaries", "CP Targeted"],
-            var_name="CP Type",
-            value_name="cp_numbers",
-        )
-
-        df_melted["cp_numbers"] = df_melted["cp_numbers"].apply(lambda x: round(x / 1_000_000, 2))
+    # Computed once per data version for every country and year, see `_get_cp_beneficiaries_charts_data`
+    df_melted = st.session_state["cp_beneficiaries_charts_data"].get(selected_country, pd.DataFrame(columns=["year"]))
+    df_melted = df_melted[df_melted["year"] <= year]
 
-        fig = px.bar(
+    if len(df_melted):
+        fig = _get_grouped_barplot_figure(
             df_melted,
-            x="year",
-            y="cp_numbers",
-            color="CP Type",
+            y_col="cp_numbers",
+            color_col="CP Type",
             color_discrete_map={
                 "CP Beneficiaries": "#D6E9DF",
                 "CP Targeted": "#B1DBC3",
             },
-            barmode="group",
             labels={"cp_numbers": "Total numbers(in millions)", "year": "Year"},
-            text="cp_numbers",
             text_auto=True,
-            height=None,
-        )
-        fig.update_traces(
-            texttemplate="%{y:,} million",
-            textposition="outside",
-            textfont=dict(size=20),
+            textfont_size=20,
         )
         st.plotly_chart(fig)
     else:
@@ -532,129 +497,101 @@ def display_cp_beneficiaries(selected_country: str):
     #     _display_stackbar(numbers_values)
 
 
-def _get_country_wise_pin_data(df: pd.DataFrame):
+country_wise_pin_columns = [
+    "name",
+    "plan_id",
+    "country",
+    "year",
+    "children_in_need",
+    "targeted_children",
+    "tot_pop_in_need",
+    "plan_type",
+]
+country_wise_children_in_need_columns = ["country", "children_in_need", "proportion_children_in_need", "year"]
+# Key indicators of the Global Overview, one row per year
+global_kpis_columns = [
+    "year",
+    "children_in_need",
+    "n_countries_children_in_need",
+    "ratio_children_in_need_to_pop_in_need",
+    "n_countries_children_in_need_to_pop_in_need",
+    "ratio_children_targeted_to_children_in_need",
+    "n_countries_children_targeted_to_children_in_need",
+    "cp_beneficiaries",
+    "ratio_global_funding",
+    "total_countries",
+]
+
+
+def _get_country_wise_pin_tables(df: pd.DataFrame) -> Dict[int, pd.DataFrame]:
     """
-    Extracts and returns country-wise PIN (People in Need) data for the specified year from the provided DataFrame.
+    Extracts the country-wise PIN (People in Need) table of every year from the provided DataFrame, in one pass.
 
     Args:
-    - df (pd.DataFrame): DataFrame containing columns 'country',
-      'year', 'children_in_need', 'targeted_children', and 'tot_pop_in_need'.
+    - df (pd.DataFrame): DataFrame containing columns 'name', 'plan_id', 'country',
+      'year', 'children_in_need', 'targeted_children', 'tot_pop_in_need' and 'plan_type'.
 
     Returns:
-    - pd.DataFrame: Filtered DataFrame with columns:
+    - Dict[int, pd.DataFrame]: Table of each year, the selected year table being a lookup. Each table has the columns:
+    - 'name' and 'plan_id': Name and identifier of the plan.
     - 'country': Country name.
-    - 'year': Year of data (filtered for 2024).
+    - 'year': Year of data.
     - 'children_in_need': Number of children in need.
     - 'targeted_children': Number of targeted children.
     - 'tot_pop_in_need': Total population in need.
+    - 'plan_type': Type of the plan.
 
     Operation:
-    1. Copies and filters the input DataFrame 'df' to include data only for the year 2024.
-    2. Filters rows based on non-null values in columns related to children in need,
+    1. Filters rows based on non-null values in columns related to children in need,
        targeted children, and total population in need.
-    3. Sorts and resets the index of the resulting DataFrame 'all_pin_data' for clarity and consistency.
-    4. Selects relevant columns ('country', 'year', 'children_in_need',
-       'targeted_children', 'tot_pop_in_need') from the filtered data.
+    2. Sorts the rows by country, keeping the original order of the plans of a country.
+    3. Splits the relevant columns by year.
     """
-    # country_wise_results = pd.DataFrame()
-
-    # number_cols = [
-    #     "children_in_need",
-    #     "targeted_children",
-    #     "tot_pop_in_need",
-    # ]
-
-    all_pin_data = df.copy()
-
-    all_pin_data = all_pin_data[all_pin_data["year"] == st.session_state["selected-year"]]
-    all_pin_data = (
-        all_pin_data[
-            (~all_pin_data["children_in_need"].isna())
-            | (~all_pin_data["targeted_children"].isna())
-            | (~all_pin_data["tot_pop_in_need"].isna())
-        ]
-        .sort_values(by=["country", "year"])
-        .reset_index(drop=True)
-    )
+    all_pin_data = df[(~df["children_in_need"].isna()) | (~df["targeted_children"].isna()) | (~df["tot_pop_in_need"].isna())]
+    all_pin_data = all_pin_data.sort_values(by="country", kind="stable")[country_wise_pin_columns]
 
-    all_pin_data = all_pin_data[
-        [
-            "name",
-            "plan_id",
-            "country",
-            "year",
-            "children_in_need",
-            "targeted_children",
-            "tot_pop_in_need",
-            "plan_type",
-        ]
-    ]
-
-    return all_pin_data
+    return {year: year_df.reset_index(drop=True) for year, year_df in all_pin_data.groupby("year")}
 
 
-def _get_country_wise_children_in_need_data(df: pd.DataFrame):
+def _get_country_wise_children_in_need_tables(df: pd.DataFrame) -> Dict[int, pd.DataFrame]:
     """
-    Calculates and returns country-wise data on children in need based on the provided DataFrame.
+    Calculates the country-wise children in need table of every year from the provided DataFrame, in one pass.
 
     Args:
-    - df (pd.DataFrame): DataFrame containing columns 'country', 'year', 'children_in_need', and 'tot_pop_in_need'.
+    - df (pd.DataFrame): DataFrame containing columns 'country', 'year', 'children_in_need', 'tot_pop_in_need',
+      'plan_type' and 'name'.
 
     Returns:
-    - pd.DataFrame: Country-wise results DataFrame with columns:
+    - Dict[int, pd.DataFrame]: Table of each year, the selected year table being a lookup. Each table has the columns:
     - 'country': Country name.
-    - 'children_in_need': Total number of children in need in the latest year available.
+    - 'children_in_need': Total number of children in need in the year.
     - 'proportion_children_in_need': Proportion of children in need to
        total population in need, rounded to two decimal places.
-    - 'year': Year corresponding to the latest data entry for children in need.
+    - 'year': Year of the data.
 
     Operation:
-    1. Extracts relevant columns ('country', 'year', 'children_in_need', 'tot_pop_in_need')
-       from the input DataFrame.
-    2. Iterates over each unique country to calculate statistics:
-    - Selects the most recent data entry for each country based on year.
-    - Computes the proportion of children in need to total population in need.
-    3. Constructs a new DataFrame 'country_wise_results' with calculated values for each country.
+    1. Keeps the plans with all the relevant columns filled.
+    2. Orders the plans by year, country (in order of first appearance) and plan type, the HRP coming first.
+    3. Keeps one plan per country and year, the first one which is not a flash appeal if there is one.
+    4. Computes the proportion of children in need to total population in need and splits the results by year.
     """
-    country_wise_results = pd.DataFrame()
-
-    all_pin_data = df.copy()[["country", "year", "children_in_need", "tot_pop_in_need", "plan_type", "name"]].dropna()
-
-    for one_country in all_pin_data.country.unique():
-        one_col_one_country_df = all_pin_data[
-            (all_pin_data["country"] == one_country) & (all_pin_data["year"] == st.session_state["selected-year"])
-        ]
-        one_col_one_country_df.reset_index(drop=True, inplace=True)
-
-        if one_col_one_country_df.empty:
-            continue
-        # one_col_one_country_df = one_country_df.sort_values(
-        #     "year", ascending=False
-        # ).iloc[0] # latest year
-
-        results_one_country = {"country": one_country}
-
-        one_col_one_country_df = plan_type_order_handler(one_col_one_country_df.copy())
-
-        if len(one_col_one_country_df) > 1:
-            one_col_one_country_df = one_col_one_country_df[
-                ~one_col_one_country_df["name"].str.contains("flash", case=False, na=False)
-            ]  # noqa
-
-        one_col_one_country_df.reset_index(drop=True, inplace=True)
-
-        results_one_col = round(
-            one_col_one_country_df["children_in_need"][0] / one_col_one_country_df["tot_pop_in_need"][0],
-            2,
-        )
-
-        results_one_country["children_in_need"] = int(one_col_one_country_df["children_in_need"][0])
-        results_one_country["proportion_children_in_need"] = results_one_col
-        results_one_country["year"] = one_col_one_country_df["year"][0]
-
-        country_wise_results = country_wise_results._append(results_one_country, ignore_index=True)
+    all_pin_data = df[["country", "year", "children_in_need", "tot_pop_in_need", "plan_type", "name"]].dropna()
+
+    all_pin_data = plan_type_order_handler(all_pin_data.copy())
+    all_pin_data["country_order"] = pd.factorize(all_pin_data["country"])[0]
+    all_pin_data = all_pin_data.sort_values(by=["year", "country_order", "plan_type_order"], kind="stable")
+    all_pin_data = _select_priority_plans(all_pin_data, ["year", "country"])
+
+    country_wise_results = pd.DataFrame(
+        {
+            "country": all_pin_data["country"],
+            "children_in_need": all_pin_data["children_in_need"].astype(int),
+            "proportion_children_in_need": (all_pin_data["children_in_need"] / all_pin_data["tot_pop_in_need"]).round(2),
+            "year": all_pin_data["year"],
+        }
+    )
 
-    return country_wise_results
+    return {year: year_df.reset_index(drop=True) for year, year_df in country_wise_results.groupby("year")}
 
 
 def _display_pin_stackbar(selected_country: str):
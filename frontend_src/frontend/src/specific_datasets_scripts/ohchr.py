@@ -1,12 +1,19 @@
 import os
 import re
+from typing import Any, Dict, Optional
 
 import pandas as pd
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset, _load_country_cached_dataset
+from frontend.src.utils.published_data import (
+    _get_published_country_profile_frame,
+    _get_published_country_profile_scalar,
+    _get_published_snapshot_path,
+    _read_published_table,
+)
 from frontend.src.utils.utils_functions import (
     _add_blank_space,
-    _convert_to_datetime,
     _custom_title,
     _display_bullet_point_as_highlighted_text,
 )
@@ -26,16 +33,85 @@ def _replace_special_chars(input_string):
     return replaced_string
 
 
-def _load_country_summaries_indicators(data_path: os.PathLike):
+def _get_legal_framework_country_tables(country_df: pd.DataFrame, last_update: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Builds the legal framework tables of one country, from its rows with parsed 'Formatted Submitted Date' values.
+    The month of the last update is computed from the rows when it is not given.
+
+    Returns a dictionary with:
+    - 'indicators' (Dict[str, pd.DataFrame]): Articles of each indicator, in the order of the results file.
+    - 'last_update' (str): Month of the most recent article, '-' when no article is dated.
+    """
+    if last_update is None:
+        max_date = country_df["Formatted Submitted Date"].max()
+        last_update = "-" if pd.isna(max_date) else max_date.strftime("%b %Y")
+    return {
+        "indicators": {
+            indicator: indicator_df.reset_index(drop=True)
+            for indicator, indicator_df in country_df.groupby("Indicator", sort=False)
+        },
+        "last_update": last_update,
+    }
+
+
+def _read_published_legal_framework_tables() -> Dict[str, Dict[str, Any]]:
+    """
+    Reads the legal framework table of the published snapshot and splits it by country, an empty dictionary if it is
+    not published.
+    """
+    df = _read_published_table("ohchr_legal_framework")
+    if df is None:
+        return {}
+    return {
+        country: _get_legal_framework_country_tables(country_df) for country, country_df in df.groupby("Country", sort=False)
+    }
+
+
+def _read_legal_framework_results_file(data_path: os.PathLike) -> Dict[str, Any]:
     """
-    Function to load the country summaries indicators
+    Reads the results file of one country, with the same date parsing as the published table.
     """
-    country_summaries_dataset = pd.read_excel(data_path).ffill()
-    country_summaries_dataset["Formatted Submitted Date"] = country_summaries_dataset["Submitted Date"].apply(
-        _convert_to_datetime
+    df = pd.read_excel(data_path).ffill()
+    df["Formatted Submitted Date"] = pd.to_datetime(
+        df["Submitted Date"].where(df["Submitted Date"] != "-"), format="%d %b %Y"
+    )
+    return _get_legal_framework_country_tables(df)
+
+
+def _load_legal_framework_country_tables(selected_country: str) -> Optional[Dict[str, Any]]:
+    """
+    Loads the legal framework tables of a country through the shared dataset cache, None if it has no results.
+
+    Operation:
+    1. Builds the tables from the published profile bundle of the country, once per snapshot.
+    2. Otherwise looks the country up in the published table, split by country once per snapshot.
+    3. Otherwise reads the results file of the country, once per version of the file.
+    """
+    country_profile_df = _get_published_country_profile_frame(selected_country, "legal_framework")
+    if country_profile_df is not None and len(country_profile_df) > 0:
+        return _load_country_cached_dataset(
+            "legal_framework_tables",
+            selected_country,
+            [_get_published_snapshot_path()],
+            _get_legal_framework_country_tables,
+            country_profile_df,
+            _get_published_country_profile_scalar(selected_country, "legal_framework_last_update"),
+        )
+
+    published_tables = _load_cached_dataset(
+        "ohchr_legal_framework_tables",
+        [_get_published_snapshot_path()],
+        _read_published_legal_framework_tables,
+    )
+    if selected_country in published_tables:
+        return published_tables[selected_country]
+
+    data_path = os.path.join(st.session_state["legal_framework_summaries_data_path"], f"{selected_country}.xlsx")
+    if not os.path.exists(data_path):
+        return None
+    return _load_cached_dataset(
+        f"ohchr_legal_framework_{selected_country}", [data_path], _read_legal_framework_results_file, data_path
     )
-    displayed_indicators = country_summaries_dataset.Tag.unique()
-    return country_summaries_dataset, displayed_indicators
 
 
 def _display_legend_box(
@@ -190,26 +266,24 @@ def _get_color(input_text: str) -> str:
     return displayed_color
 
 
-def _display_one_box_results(country_summaries_dataset, one_indicator):
+def _display_one_box_results(country_indicators: Dict[str, pd.DataFrame], one_indicator: str):
     """
-    Displays results for a single indicator box based on provided country summaries dataset.
+    Displays results for a single indicator box based on provided country legal framework tables.
 
     Args:
-    - country_summaries_dataset (pd.DataFrame): DataFrame containing country summaries data.
+    - country_indicators (Dict[str, pd.DataFrame]): Articles of each indicator of the country.
     - one_indicator (str): Indicator tag to display results for.
 
     Operation:
-    1. Checks if `one_indicator` exists in `displayed_indicators`.
-    2. Retrieves the summary of `one_indicator` from `country_summaries_dataset`.
-    3. Checks if the summary contains keywords such as 'law', 'article', or 'decree'
-       to determine the indicator box color using `_display_indicator_box`.
-    4. If `one_indicator` is not in `displayed_indicators`, displays the indicator
-       box with a color indicating 'NOT AVAILABLE'.
+    1. Looks up the articles of `one_indicator` in `country_indicators`.
+    2. Retrieves the laws summary of its first article, 'No Information Available' if it has none.
+    3. Displays the indicator box with the color of the laws summary using `_display_indicator_box`.
 
     """
-    one_indicator_results = country_summaries_dataset[country_summaries_dataset["Indicator"] == one_indicator][
-        "Laws Summary"
-    ].values[0]
+    if one_indicator in country_indicators:
+        one_indicator_results = country_indicators[one_indicator]["Laws Summary"].values[0]
+    else:
+        one_indicator_results = "No Information Available"
 
     displayed_color = _get_color(one_indicator_results)
 
@@ -231,8 +305,7 @@ def _display_one_box_results(country_summaries_dataset, one_indicator):
 
 
 def _display_legal_framework_indicator_boxes(
-    country_summaries_dataset: pd.DataFrame,
-    selected_country: str,
+    country_tables: Dict[str, Any],
     display_all_tags: bool = True,
 ):
     """
@@ -240,8 +313,8 @@ def _display_legal_framework_indicator_boxes(
     on provided country summaries dataset.
 
     Args:
-    - country_summaries_dataset (pd.DataFrame): DataFrame containing country summaries data.
-    - displayed_indicators (list[str]): List of indicators to display within the legal framework boxes.
+    - country_tables (Dict[str, Any]): Legal framework tables of the country, with its articles per indicator
+      and the month of its last update.
     - display_all_tags (bool, optional): Flag indicating whether to display all legal framework
       tags or only specific ones. Default is True.
 
@@ -285,7 +358,7 @@ def _display_legal_framework_indicator_boxes(
                 "Legal Framework & Rule of Law",
                 st.session_state["subtitle_size"],
                 source="OHCHR, UN Treaty Bodies Dataset, Committee on the Rights of the Child, State Parties Reporting",
-                date="Last update date: " + st.session_state[f"date_ohchr_{selected_country}"],
+                date="Last update date: " + country_tables["last_update"],
                 additional_text=added_text,
             )
         with yes_col:
@@ -306,21 +379,21 @@ def _display_legal_framework_indicator_boxes(
                 nb = (2 * indicator_id) % 12
                 with shown_columns[nb].container():
                     _display_one_box_results(
-                        country_summaries_dataset,
+                        country_tables["indicators"],
                         one_indicator,
                     )
 
 
-def _display_results_one_indicator(country_summaries_datset: pd.DataFrame, one_indicator: str):
+def _display_results_one_indicator(country_indicators: Dict[str, pd.DataFrame], one_indicator: str):
     """
-    Displays results for a specific indicator in a country summaries dataset.
+    Displays results for a specific indicator in a country legal framework tables.
 
     Args:
-    - country_summaries_datset (pd.DataFrame): DataFrame containing country summaries data.
+    - country_indicators (Dict[str, pd.DataFrame]): Articles of each indicator of the country.
     - one_indicator (str): Specific indicator tag to display results for.
 
     Operation:
-    1. Filters the `country_summaries_datset` DataFrame to retrieve entries matching the `one_indicator`.
+    1. Looks up the articles of `one_indicator` in `country_indicators`.
     2. Sorts the filtered DataFrame based on the 'Formatted Submitted Date' in descending order.
     3. Retrieves the summary of the most recent entry for the specified indicator.
     4. Retrieves relevant details such as text snippets, document title,
@@ -329,9 +402,12 @@ def _display_results_one_indicator(country_summaries_datset: pd.DataFrame, one_i
     6. Displays the summary of the most recent entry in one column and lists relevant articles
        with their titles, dates, and URLs in another column.
     """
-    df_one_indicator = country_summaries_datset[
-        country_summaries_datset["Indicator"] == one_indicator
-    ]  # .sort_values("Formatted Submitted Date", ascending=False)
+    if one_indicator not in country_indicators:
+        _display_bullet_point_as_highlighted_text(one_indicator.replace("Chid", "Child"), no_info_color)
+        st.markdown("No information extracted for this indicator.")
+        return
+
+    df_one_indicator = country_indicators[one_indicator]  # .sort_values("Formatted Submitted Date", ascending=False)
 
     one_indicator_summary = df_one_indicator["General Summary"].values[0]
 
@@ -371,24 +447,18 @@ def country_wise_legal_framework(selected_country: str, display_detailed_results
     - display_detailed_results (bool): Flag indicating whether to display detailed results for legal framework indicators.
 
     Operation:
-    1. Checks if the path to the legal framework report for the selected country exists in the session state.
-    2. Constructs the path to the legal framework report if it does not exist.
-    3. If the legal framework report does not exist, displays a custom title indicating no information available and returns.
-    4. Checks if the country summaries dataset and displayed indicators are loaded in the session state.
-    5. Loads the country summaries dataset and displayed indicators from the legal framework report if not already loaded.
-    6. Sets up a Streamlit container and displays legal framework indicator boxes
+    1. Loads the legal framework tables of the selected country from the shared dataset cache,
+       built from the published table or from the legal framework report of the country.
+    2. If the country has no results, displays a custom title indicating no information available and returns.
+    3. Sets up a Streamlit container and displays legal framework indicator boxes
        using `_display_legal_framework_indicator_boxes`.
-    7. If `display_detailed_results` is True, displays detailed results for each displayed indicator
+    4. If `display_detailed_results` is True, displays detailed results for each displayed indicator
        using `_display_results_one_indicator`.
 
     """
-    if f"legal_framework_summaries_country_path_{selected_country}" not in st.session_state:
-        st.session_state[f"legal_framework_summaries_country_path_{selected_country}"] = os.path.join(
-            st.session_state["legal_framework_summaries_data_path"],
-            f"{selected_country}.xlsx",
-        )
+    country_tables = _load_legal_framework_country_tables(selected_country)
 
-    if not os.path.exists(st.session_state[f"legal_framework_summaries_country_path_{selected_country}"]):
+    if country_tables is None:
         _custom_title(
             "Legal Framework & Rule of Law",
             st.session_state["subtitle_size"],
@@ -398,27 +468,8 @@ def country_wise_legal_framework(selected_country: str, display_detailed_results
         st.markdown(f"No information available for the legal framework for {selected_country}")
         return
 
-    if f"country_summaries_dataset_{selected_country}" not in st.session_state:
-        country_summaries_dataset, displayed_indicators = _load_country_summaries_indicators(
-            st.session_state[f"legal_framework_summaries_country_path_{selected_country}"]
-        )
-        st.session_state[f"country_summaries_dataset_{selected_country}"] = country_summaries_dataset
-
-        st.session_state[f"date_ohchr_{selected_country}"] = (
-            pd.to_datetime(
-                country_summaries_dataset[country_summaries_dataset["Submitted Date"] != "-"]["Submitted Date"],
-                format="%d %b %Y",
-            )
-            .max()
-            .strftime("%b %Y")
-        )
-
     with st.container():
-        _display_legal_framework_indicator_boxes(
-            st.session_state[f"country_summaries_dataset_{selected_country}"],
-            selected_country,
-            display_all_tags=display_detailed_results,
-        )
+        _display_legal_framework_indicator_boxes(country_tables, display_all_tags=display_detailed_results)
 
     if display_detailed_results:
         st.write("")
@@ -429,7 +480,4 @@ def country_wise_legal_framework(selected_country: str, display_detailed_results
             _custom_title(f"{tag_id + 1}) {tagname}", st.session_state["subsubtitle_size"])
 
             for one_indicator in tag_indicators:
-                _display_results_one_indicator(
-                    st.session_state[f"country_summaries_dataset_{selected_country}"],
-                    one_indicator,
-                )
+                _display_results_one_indicator(country_tables["indicators"], one_indicator)
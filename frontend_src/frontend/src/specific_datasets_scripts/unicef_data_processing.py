@@ -1,196 +1,115 @@
 import os
-from typing import List
+from typing import Dict, Tuple
 
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset, _load_country_cached_dataset
+from frontend.src.utils.published_data import (
+    _get_published_country_profile_frame,
+    _get_published_snapshot_path,
+    _read_published_table,
+)
 from frontend.src.utils.utils_functions import _add_blank_space, _custom_title
 
-countries_mapping = {
-    "Democratic Republic of the Congo": "Congo DRC",
-    "Iran (Islamic Republic of)": "Iran",
-    "State of Palestine": "Palestine",
-    "Syrian Arab Republic": "Syria",
-    "Venezuela (Bolivarian Republic of)": "Venezuela",
-}
-
 sexes = ["_T", "F", "M"]
 sex_to_gender = {"F": "Female", "M": "Male", "_T": "All Sexes"}
 
-kept_columns = ["Geographic area", "Indicator", "TIME_PERIOD", "OBS_VALUE", "SEX"]
-
-mortality_rate_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.CME_MRY15T19+CME_MRY1T4+CME_MRY5T24._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-nb_deprivations_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PV_CHLD_DPRV-AVG-S-HS._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-percentage_adults_think_physical_punishement_good_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PT_ADLT_PS_NEC._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-percentage_women_sexual_violence_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PT_F_18-29_SX-V_AGE-18._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-percentage_men_sexual_violence_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PT_M_18-29_SX-V_AGE-18._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-young_women_married_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PT_F_20-24_MRD_U18_TND._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-children_detention_rate_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PT_CHLD_DN._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-children_residential_care_rate_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.PT_CHLD_RES-CARE._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-out_of_school_rate_adolescents_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.ED_ROFST_L3._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-out_of_school_rate_children_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.ED_ROFST_L1_ADM._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-out_of_school_rate_youth_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.ED_ROFST_L2._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-refugee_host_per_country_link = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data/UNICEF,GLOBAL_DATAFLOW,1.0/.MG_RFGS_CNTRY_ASYLM_PER1000._T+F+M?format=csv&includehistory=true&labels=both"  # noqa
-
-st.session_state["mortality_rate_doc_path"] = os.path.join(
-    st.session_state["tabular_data_data_path"],
-    "unicef",
-    "mortality_rate_df.csv",
-    # "Mortality-rate-among-children-and-youth-age-5-to-24_2023-1.xlsx",
-)
-
+# Datasets of the UNICEF indicator store, written by the UNICEF processing step
+unicef_datasets = [
+    "out_of_school_rate",
+    "nb_deprivations",
+    "refugee_host_per_country",
+    "children_detention_rate",
+    "children_residential_care_rate",
+    "percentage_adults_think_physical_punishement_good",
+    "percentage_sexual_violence",
+    "young_women_married",
+    "mortality_rate",
+]
+store_columns = ["dataset", "Geographic area", "Indicator", "TIME_PERIOD", "OBS_VALUE", "SEX"]
+
+
+def _read_unicef_indicators(store_path: os.PathLike) -> pd.DataFrame:
+    """
+    Reads the UNICEF indicator store from the published snapshot, or from its CSV file.
 
-def _import_preprocess_df(link):
+    Data folders prepared before the store have one CSV file per dataset, downloaded by the dashboard itself.
+    They are read as they are, the dashboard never downloads the missing ones.
     """
-    Fetches and preprocesses data from the specified CSV link.
+    df = _read_published_table("unicef_indicators")
+    if df is not None:
+        return df
+    if os.path.exists(store_path):
+        return pd.read_csv(store_path)
+
+    datasets_dfs = []
+    for dataset_name in unicef_datasets:
+        dataset_path = os.path.join(os.path.dirname(store_path), f"{dataset_name}_df.csv")
+        if os.path.exists(dataset_path):
+            datasets_dfs.append(pd.read_csv(dataset_path).assign(dataset=dataset_name))
+    if len(datasets_dfs) == 0:
+        print(f"UNICEF indicator store not found at {store_path}")
+        return pd.DataFrame(columns=store_columns)
+    return pd.concat(datasets_dfs, ignore_index=True)[store_columns]
+
+
+def _read_unicef_indicators_tables(store_path: os.PathLike) -> Dict[Tuple[str, str], pd.DataFrame]:
     """
-    df = pd.read_csv(link)[kept_columns]
-    df["Geographic area"] = df["Geographic area"].replace(countries_mapping)
-    df = df[df["Geographic area"].isin(st.session_state["countries"])]
-    return df
+    Reads the UNICEF indicator store and splits it by country and dataset, in one pass.
 
-
-def _import_merge_multiple_df(links):
-    """
-    Fetches and merges data from multiple CSV links into a single DataFrame.
+    Each table keeps the order of the store rows and its indicator, sex, year and value columns,
+    so that the panels of a country are dictionary lookups instead of filters of the whole store.
     """
-    return pd.concat([_import_preprocess_df(link) for link in links])
+    df = _read_unicef_indicators(store_path)
+    return {
+        (country, dataset_name): dataset_df.drop(columns="dataset").reset_index(drop=True)
+        for (country, dataset_name), dataset_df in df.groupby(["Geographic area", "dataset"], sort=False)
+    }
 
 
-def _standard_unicef_data_import(selected_country, df_path: os.PathLike, df_links: List[str]):
+def _load_unicef_indicators_tables() -> Dict[Tuple[str, str], pd.DataFrame]:
     """
-    Fetches and preprocesses UNICEF data from the specified CSV file path and links.
+    Loads the tables of the UNICEF indicator store once per data version, shared by every session.
     """
-    if os.path.exists(df_path):
-        df = pd.read_csv(df_path)
-    else:
-        assert isinstance(df_links, list), "df_links should be a list of links"
-        df = _import_merge_multiple_df(df_links)
-        df.to_csv(df_path, index=False)
-
-    df = df[df["Geographic area"] == selected_country]
-    return df
+    return _load_cached_dataset(
+        "unicef_indicators_tables",
+        [st.session_state["unicef_indicators_file_path"], _get_published_snapshot_path()],
+        _read_unicef_indicators_tables,
+        st.session_state["unicef_indicators_file_path"],
+    )
 
 
-def _get_unicef_global_db_5_14_mortality_rate_df():
+def _get_unicef_country_tables(country_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     """
-    Fetches and preprocesses global mortality rate data among children and youth aged 5-14 from an Excel file.
-
-    Operation:
-    1. Defines 'unicef_countries_mapping' to map specific country names to standardized names.
-    2. Reads mortality rate data from 'df_path' Excel file, specific to 'sheet_name' "Age 5to14 Country estimates",
-       skipping the first 14 header rows and excluding the last 2 rows.
-    3. Maps country names using 'unicef_countries_mapping'.
-    4. Filters data where 'Uncertainty.Bounds*' is "Median" and 'Country.Name' is within 'st.session_state["countries"]'.
-    5. Identifies columns associated with numerical values ('number_associated_cols').
-    6. Selects relevant columns ('Country.Name', 'Uncertainty.Bounds*', and 'number_associated_cols').
-    7. Constructs 'final_df' DataFrame by iterating through rows and columns to append mortality rate data.
-
-    Returns:
-    - pd.DataFrame: Processed DataFrame containing global mortality rate data among children aged 5-14,
-      filtered for specified countries.
+    Splits the UNICEF indicators of one country by dataset, the 'dataset' column being dropped.
     """
-
-    unicef_countries_mapping = {
-        # "Central African Republic": "CAR",
-        # "Czechia": "Czech Republic",
-        # "Democratic People's Republic of Korea": "DPRK",
-        "Democratic Republic of the Congo": "Congo, DRC",
-        "Iran (Islamic Republic of)": "Iran",
-        # "Lao People's Democratic Republic": "Laos",
-        # "Republic of Moldova": "Moldova",
-        "State of Palestine": "Palestine",
-        "Russian Federation": "Russia",
-        "Syrian Arab Republic": "Syria",
-        # "United Republic of Tanzania": "Tanzania",
-        # "Timor-Leste": "Timor Leste",
-        "Venezuela (Bolivarian Republic of)": "Venezuela",
+    return {
+        dataset_name: dataset_df.drop(columns="dataset").reset_index(drop=True)
+        for dataset_name, dataset_df in country_df.groupby("dataset", sort=False)
     }
 
-    def _str_contains_digit(string: str) -> bool:
-        return any(char.isdigit() for char in string)
 
-    df_path = os.path.join(
-        "..",
-        "tabular_data",
-        "data",
-        "Mortality-rate-among-children-and-youth-age-5-to-24_2023-1.xlsx",
-    )
-    sheet_name = "Age 5to14 Country estimates"
-
-    # def _read_preprocess_one_df(sheet_name: str) -> pd.DataFrame:
-    df = pd.read_excel(df_path, sheet_name=sheet_name, header=14).iloc[:-2]
-    df["Country.Name"] = df["Country.Name"].apply(lambda x: unicef_countries_mapping.get(x, x))
-    df = df[(df["Uncertainty.Bounds*"] == "Median") & (df["Country.Name"].isin(st.session_state["countries"]))]
-    number_associated_cols = [col for col in df.columns if _str_contains_digit(col)]
-    df = df[["Country.Name", "Uncertainty.Bounds*"] + number_associated_cols]
-
-    final_df = pd.DataFrame()
-    for i, row in df.iterrows():
-        for col in number_associated_cols:
-            final_df = final_df._append(
-                {
-                    "Geographic area": row["Country.Name"],
-                    "Indicator": "Mortality rate age 5-14",
-                    "OBS_VALUE": row[col],
-                    "TIME_PERIOD": col.split(".")[0],
-                    "SEX": "_T",
-                },
-                ignore_index=True,
-            )
-
-    return final_df
-
-
-def _get_mortality_rate_df(df_path: os.PathLike):
+def _standard_unicef_data_import(selected_country: str, dataset_name: str) -> pd.DataFrame:
     """
-    Fetches and preprocesses mortality rate data from the specified CSV file path.
-
-    Args:
-    - df_path (os.PathLike): Path to the CSV file containing mortality rate data.
-
-    Operation:
-    1. Checks if the file specified by 'df_path' exists. If exists, reads the data into 'unicef_mortality_rates_df'.
-    2. If the file doesn't exist:
-        - Retrieves global mortality rate data for ages 5-14 from '_get_unicef_global_db_5_14_mortality_rate_df'.
-        - Imports and merges data from [mortality_rate_link] using '_import_merge_multiple_df'.
-        - Filters out entries where 'SEX' is "_T" and 'Indicator' is not "Mortality rate age 5-24".
-        - Concatenates global mortality rate data with imported data.
-        - Converts 'TIME_PERIOD' column to integer type and filters data for years since 1990.
-        - Saves the processed data to 'df_path' as a CSV file.
-    3. Filters 'unicef_mortality_rates_df' to include only data for countries listed in 'st.session_state["countries"]'.
-
-    Returns:
-    - pd.DataFrame: Processed DataFrame containing mortality rate data filtered for specified countries.
+    Returns the rows of a dataset of the UNICEF indicator store for the selected country, from the published
+    profile bundle of the country when there is one, otherwise from the tables of the whole store.
+    The returned table is shared by every session and must not be modified.
     """
+    empty_df = pd.DataFrame(columns=store_columns[1:])
+    country_profile_df = _get_published_country_profile_frame(selected_country, "unicef_indicators")
+    if country_profile_df is not None:
+        country_tables = _load_country_cached_dataset(
+            "unicef_indicators_tables",
+            selected_country,
+            [_get_published_snapshot_path()],
+            _get_unicef_country_tables,
+            country_profile_df,
+        )
+        return country_tables.get(dataset_name, empty_df)
 
-    if os.path.exists(df_path):
-        unicef_mortality_rates_df = pd.read_csv(df_path)
-    else:
-        global_db_5_14_mortality_rate = _get_unicef_global_db_5_14_mortality_rate_df()
-        unicef_mortality_rates_df = _import_merge_multiple_df([mortality_rate_link])
-        unicef_mortality_rates_df = unicef_mortality_rates_df[
-            (unicef_mortality_rates_df["SEX"] == "_T")
-            & (unicef_mortality_rates_df["Indicator"] != "Mortality rate age 5-24")
-        ]
-        unicef_mortality_rates_df = pd.concat([unicef_mortality_rates_df, global_db_5_14_mortality_rate])
-        unicef_mortality_rates_df["TIME_PERIOD"] = unicef_mortality_rates_df["TIME_PERIOD"].astype(int)
-        unicef_mortality_rates_df = unicef_mortality_rates_df[unicef_mortality_rates_df["TIME_PERIOD"] >= 1990]
-        unicef_mortality_rates_df.to_csv(df_path, index=False)
-
-    unicef_mortality_rates_df = unicef_mortality_rates_df[
-        unicef_mortality_rates_df["Geographic area"].isin(st.session_state["countries"])
-    ]
-    return unicef_mortality_rates_df
+    return _load_unicef_indicators_tables().get((selected_country, dataset_name), empty_df)
 
 
 @st.fragment
@@ -338,11 +257,11 @@ def _show_one_number_results(df: pd.DataFrame, title: str):
         # _display_number_cards(shown_string)
 
 
-def _get_nb_deprivations_df(selected_country: str, df_path: os.PathLike):
+def _get_nb_deprivations_df(selected_country: str):
     """
-    Fetches and displays the average number of deprivations suffered per child from the specified CSV file.
+    Fetches and displays the average number of deprivations suffered per child from the UNICEF indicator store.
     """
-    df = _standard_unicef_data_import(selected_country, df_path, [nb_deprivations_link])
+    df = _standard_unicef_data_import(selected_country, "nb_deprivations")
     # df = df[df["TIME_PERIOD"] == st.session_state["selected-year"]]
     # df.reset_index(drop=True, inplace=True)
     _show_one_number_results(
@@ -351,16 +270,12 @@ def _get_nb_deprivations_df(selected_country: str, df_path: os.PathLike):
     )
 
 
-def _get_percentage_adults_think_physical_punishement_good_df(selected_country: str, df_path: os.PathLike):
+def _get_percentage_adults_think_physical_punishement_good_df(selected_country: str):
     """
     Fetches and displays the percentage of adults who think that physical punishment
-    is necessary to raise/educate children from the specified CSV file.
+    is necessary to raise/educate children from the UNICEF indicator store.
     """
-    df = _standard_unicef_data_import(
-        selected_country,
-        df_path,
-        [percentage_adults_think_physical_punishement_good_link],
-    )
+    df = _standard_unicef_data_import(selected_country, "percentage_adults_think_physical_punishement_good")
 
     _show_one_number_results(
         df,
@@ -368,55 +283,50 @@ def _get_percentage_adults_think_physical_punishement_good_df(selected_country:
     )
 
 
-def _get_percentage_sexual_violence_df(selected_country: str, df_path: os.PathLike):
-    """Fetches and displays the percentage of people exposed to sexual violence from the specified CSV file."""
+def _get_percentage_sexual_violence_df(selected_country: str):
+    """Fetches and displays the percentage of people exposed to sexual violence from the UNICEF indicator store."""
 
-    df = _standard_unicef_data_import(
-        selected_country,
-        df_path,
-        [percentage_women_sexual_violence_link, percentage_men_sexual_violence_link],
-    )
+    df = _standard_unicef_data_import(selected_country, "percentage_sexual_violence")
 
     _show_one_number_results(df, "Percentage of people exposed to sexual violence")
 
 
-def _get_young_women_married_df(selected_country: str, df_path: os.PathLike):
+def _get_young_women_married_df(selected_country: str):
     """
     Fetches and displays the percentage of young women married.
     """
-    df = _standard_unicef_data_import(selected_country, df_path, [young_women_married_link])
+    df = _standard_unicef_data_import(selected_country, "young_women_married")
     _show_one_number_results(
         df,
         title="Percentage of women (aged 20-24 years) married or in union before age 18",
     )
 
 
-def _get_children_detention_rate_df(selected_country: str, df_path: os.PathLike):
-    """Fetches and displays the rate of children in detention from the specified CSV file."""
-    df = _standard_unicef_data_import(selected_country, df_path, [children_detention_rate_link])
+def _get_children_detention_rate_df(selected_country: str):
+    """Fetches and displays the rate of children in detention from the UNICEF indicator store."""
+    df = _standard_unicef_data_import(selected_country, "children_detention_rate")
 
     _show_one_number_results(df, "Rate of children in detention")
 
 
-def _get_children_residential_care_rate_df(selected_country: str, df_path: os.PathLike):
-    """Fetches and displays the rate of children in residential care from the specified CSV file."""
-    df = _standard_unicef_data_import(selected_country, df_path, [children_residential_care_rate_link])
+def _get_children_residential_care_rate_df(selected_country: str):
+    """Fetches and displays the rate of children in residential care from the UNICEF indicator store."""
+    df = _standard_unicef_data_import(selected_country, "children_residential_care_rate")
 
     _show_one_number_results(df, "Rate of children in residential care")
 
 
-def _get_out_of_school_rate(selected_country: str, df_path: os.PathLike):
+def _get_out_of_school_rate(selected_country: str):
     """
-    Fetches and displays out-of-school rates for different age groups from the specified CSV file.
+    Fetches and displays out-of-school rates for different age groups from the UNICEF indicator store.
 
     Args:
-    - df_path (os.PathLike): Path to the CSV file containing out-of-school rate data.
+    - selected_country (str): Country of the displayed rates.
 
     Operation:
-    1. Calls '_standard_unicef_data_import' function with 'df_path' and a list of links
-       [out_of_school_rate_adolescents_link, out_of_school_rate_children_link, out_of_school_rate_youth_link]
-       as arguments to import and standardize UNICEF data.
-    2. Loads and processes the data from the CSV file specified by 'df_path' using '_standard_unicef_data_import'.
+    1. Calls '_standard_unicef_data_import' function to read the 'out_of_school_rate' dataset
+       of the selected country, holding the adolescents, children and youth rates.
+    2. The data comes from the UNICEF indicator store, loaded once per data version.
     3. Retrieves unique indicators from the processed DataFrame 'df'.
     4. Iterates through each unique indicator in 'df', filters data for the indicator, and calls
        '_show_one_number_results' function to display the processed data as one-number results with
@@ -427,15 +337,7 @@ def _get_out_of_school_rate(selected_country: str, df_path: os.PathLike):
     - None
     """
 
-    df = _standard_unicef_data_import(
-        selected_country,
-        df_path,
-        [
-            out_of_school_rate_adolescents_link,
-            out_of_school_rate_children_link,
-            out_of_school_rate_youth_link,
-        ],
-    )
+    df = _standard_unicef_data_import(selected_country, "out_of_school_rate")
 
     indicators = df["Indicator"].unique()
 
@@ -448,17 +350,17 @@ def _get_out_of_school_rate(selected_country: str, df_path: os.PathLike):
         _add_blank_space(1)
 
 
-def _get_refugee_host_per_country_df(selected_country: str, df_path: os.PathLike):
+def _get_refugee_host_per_country_df(selected_country: str):
     """
     Fetches and displays refugee population data hosted by countries per 1000 population.
 
     Args:
-    - df_path (os.PathLike): Path to the CSV file containing refugee host country data.
+    - selected_country (str): Country of the displayed numbers.
 
     Operation:
-    1. Calls '_standard_unicef_data_import' function with 'df_path' and
-       [refugee_host_per_country_link] as arguments to import and standardize UNICEF data.
-    2. Loads and processes the data from the CSV file specified by 'df_path' using '_standard_unicef_data_import'.
+    1. Calls '_standard_unicef_data_import' function to read the 'refugee_host_per_country' dataset
+       of the selected country.
+    2. The data comes from the UNICEF indicator store, loaded once per data version.
     3. Calls '_show_one_number_results' function to display the processed data as one-number
        results with the title "Refugees by host country (per 1000 population)".
 
@@ -466,7 +368,7 @@ def _get_refugee_host_per_country_df(selected_country: str, df_path: os.PathLike
     - None
     """
 
-    df = _standard_unicef_data_import(selected_country, df_path, [refugee_host_per_country_link])
+    df = _standard_unicef_data_import(selected_country, "refugee_host_per_country")
 
     _show_one_number_results(df, "Refugees by host country (per 1000 population)")
 
@@ -487,7 +389,7 @@ def _display_child_protection_risks(selected_country: str):
       '_get_percentage_adults_think_physical_punishement_good_df', '_get_percentage_sexual_violence_df',
       and '_get_young_women_married_df' functions to fetch and display respective data
       visualizations or summaries.
-    - Each function call loads data from CSV files located in 'st.session_state["unicef_data_folder_path"]'.
+    - Each function call reads its dataset from the UNICEF indicator store, loaded once per data version.
     - Inserts blank spaces between different data visualizations or summaries for spacing and clarity.
 
     Returns:
@@ -504,68 +406,23 @@ def _display_child_protection_risks(selected_country: str):
     with st.container():
         shown_columns = st.columns([0.32, 0.02, 0.32, 0.02, 0.32])
         with shown_columns[0]:
-            _get_out_of_school_rate(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "out_of_school_rate_df.csv",
-                ),
-            )
+            _get_out_of_school_rate(selected_country)
 
         with shown_columns[2]:
-            _get_nb_deprivations_df(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "nb_deprivations_df.csv",
-                ),
-            )
+            _get_nb_deprivations_df(selected_country)
             _add_blank_space(1)
-            _get_refugee_host_per_country_df(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "refugee_host_per_country_df.csv",
-                ),
-            )
+            _get_refugee_host_per_country_df(selected_country)
             _add_blank_space(1)
-            _get_children_detention_rate_df(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "children_detention_rate_df.csv",
-                ),
-            )
+            _get_children_detention_rate_df(selected_country)
 
         with shown_columns[4]:
-            _get_children_residential_care_rate_df(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "children_residential_care_rate_df.csv",
-                ),
-            )
+            _get_children_residential_care_rate_df(selected_country)
             _add_blank_space(1)
-            _get_percentage_adults_think_physical_punishement_good_df(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "percentage_adults_think_physical_punishement_good_df.csv",
-                ),
-            )
+            _get_percentage_adults_think_physical_punishement_good_df(selected_country)
             _add_blank_space(1)
-            _get_percentage_sexual_violence_df(
-                selected_country,
-                os.path.join(
-                    st.session_state["unicef_data_folder_path"],
-                    "percentage_sexual_violence_df.csv",
-                ),
-            )
+            _get_percentage_sexual_violence_df(selected_country)
 
-    _get_young_women_married_df(
-        selected_country,
-        os.path.join(st.session_state["unicef_data_folder_path"], "young_women_married_df.csv"),
-    )
+    _get_young_women_married_df(selected_country)
 
 
 # Mortality Rate Processing
@@ -669,7 +526,7 @@ def _display_tabular_mortality_rates(selected_country: str):
     Operation:
     1. Calls '_custom_title' function to create a custom title
        "Consequences for Children's Protection" with specified font size and source.
-    2. Retrieves mortality rate data from a CSV file located at the specified path using '_get_mortality_rate_df' function.
+    2. Retrieves the mortality rates of the selected country from the UNICEF indicator store.
     3. Checks if the retrieved DataFrame 'mortality_rate_df' is empty:
     - If empty, displays a markdown message indicating no data available for the country.
     - If not empty, calls '_create_mortality_rate_viz' function to create and display
@@ -679,13 +536,7 @@ def _display_tabular_mortality_rates(selected_country: str):
     - None
     """
 
-    mortality_rate_df = _get_mortality_rate_df(
-        os.path.join(st.session_state["unicef_data_folder_path"], "mortality_rate_df.csv")
-    )
-
-    # Filter based on selected country
-    mortality_rate_df = mortality_rate_df[mortality_rate_df["Geographic area"] == selected_country]
-    mortality_rate_df.reset_index(drop=True, inplace=True)
+    mortality_rate_df = _standard_unicef_data_import(selected_country, "mortality_rate")
 
     if len(mortality_rate_df) == 0:
         _custom_title("Consequences for Children's Protection", font_size=30, source="UNICEF")
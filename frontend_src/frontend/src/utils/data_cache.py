@@ -0,0 +1,282 @@
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+# Memory budget of the per-country datasets shared by every session, the least recently used countries are evicted first
+country_datasets_cache_max_bytes = int(os.getenv("CPAOR_COUNTRY_DATASETS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Metadata of the datasets, stamped by `update_datasets.py` with a data version increasing with each data update
+datasets_metadata_path = os.path.join(os.getenv("CPAOR_DATA_FOLDER", "/data"), "datasets_metadata.json")
+
+# Last data version read from `datasets_metadata_path`, with the file version it was read from
+_data_version_lock = threading.Lock()
+_data_version_entry: Dict[str, Any] = {"file_version": None, "data_version": 0}
+
+
+def _get_file_version(file_path: os.PathLike) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Returns the version of a file on disk as (path, modification time in ns, size in bytes).
+    A missing file gets (path, None, None) so that its later creation changes the version.
+    """
+    try:
+        file_stats = os.stat(file_path)
+    except FileNotFoundError:
+        return str(file_path), None, None
+    return str(file_path), file_stats.st_mtime_ns, file_stats.st_size
+
+
+def _get_data_version() -> int:
+    """
+    Returns the data version stamped in the datasets metadata, 0 if it was never stamped.
+    The file is parsed again only when it changes. As it is rewritten in place, a partially written file
+    keeps the last version read, the new one being picked up by a later call.
+    """
+    file_version = _get_file_version(datasets_metadata_path)
+    with _data_version_lock:
+        if file_version == _data_version_entry["file_version"]:
+            return _data_version_entry["data_version"]
+
+        try:
+            with open(datasets_metadata_path, "r") as f:
+                data_version = int(json.load(f).get("data_version", 0))
+        except FileNotFoundError:
+            data_version = 0
+        except (json.JSONDecodeError, ValueError):
+            return _data_version_entry["data_version"]
+
+        _data_version_entry["file_version"] = file_version
+        _data_version_entry["data_version"] = data_version
+        return data_version
+
+
+class _SharedDatasetCache:
+    """
+    Process-wide cache of parsed datasets, shared by every Streamlit session.
+
+    Each dataset name holds a single entry tagged with the (data version, file versions) it was built from.
+    When the version changes, the entry is rebuilt and the stale one is dropped straight away.
+    When the data version changes, the entries of the older data versions are all dropped at once.
+    Hit and miss counts are tracked per dataset name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loading_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, Tuple[Any, Any]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._data_version: Optional[int] = None
+
+    def _count(self, name: str, counter: str):
+        with self._lock:
+            name_stats = self._stats.setdefault(name, {"hits": 0, "misses": 0})
+            name_stats[counter] += 1
+
+    def get(self, name: str, version: Any, loader: Callable, *args, **kwargs) -> Any:
+        """
+        Returns the cached value of `name` if it was built for `version`, otherwise builds it with `loader`.
+        Only one session builds a given dataset at a time, the others wait and reuse its result.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            loading_lock = self._loading_locks.setdefault(name, threading.Lock())
+
+        if entry is not None and entry[0] == version:
+            self._count(name, "hits")
+            return entry[1]
+
+        with loading_lock:
+            # Another session may have built it while we were waiting
+            with self._lock:
+                entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                self._count(name, "hits")
+                return entry[1]
+
+            self._count(name, "misses")
+            value = loader(*args, **kwargs)
+            with self._lock:
+                self._entries[name] = (version, value)
+            print(f"Dataset cache: loaded '{name}' ({self.stats()[name]})")
+            return value
+
+    def drop_stale_entries(self, data_version: int):
+        """
+        Drops the entries built from another data version than `data_version`, once per new data version,
+        so that the datasets no session shows anymore do not stay in memory until they are requested again.
+        """
+        with self._lock:
+            if data_version == self._data_version:
+                return
+            self._data_version = data_version
+            stale_names = [name for name, (version, _) in self._entries.items() if version[0] != data_version]
+            for name in stale_names:
+                del self._entries[name]
+        if len(stale_names):
+            print(f"Dataset cache: dropped {len(stale_names)} entries older than data version {data_version}")
+
+    def clear(self, name: Optional[str] = None):
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: dict(name_stats) for name, name_stats in self._stats.items()}
+
+
+def _get_value_nbytes(value: Any) -> int:
+    """
+    Returns an estimate of the memory held by a cached value, DataFrames being measured with their object columns.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_get_value_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_get_value_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _SharedBoundedDatasetCache:
+    """
+    Process-wide LRU cache of parsed datasets with a memory budget, shared by every Streamlit session.
+
+    Unlike `_SharedDatasetCache`, it holds many entries of the same kind, e.g. one per country, tagged with the
+    (data version, file versions) they were built from. When the entries go over the budget, the least recently used
+    ones are evicted. The most recent entry is always kept, even when it is larger than the budget on its own.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Tuple[str, str], Tuple[Any, Any, int]] = OrderedDict()
+        self._n_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._data_version: Optional[int] = None
+
+    def _pop(self, key: Tuple[str, str]):
+        _, _, n_bytes = self._entries.pop(key)
+        self._n_bytes -= n_bytes
+
+    def get(self, key: Tuple[str, str], version: Any, loader: Callable, *args, **kwargs) -> Any:
+        """
+        Returns the cached value of `key` if it was built for `version`, otherwise builds it with `loader`.
+        The value is built outside of the lock, two sessions missing the same entry at once both build it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+            self._stats["misses"] += 1
+
+        value = loader(*args, **kwargs)
+        n_bytes = _get_value_nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (version, value, n_bytes)
+            self._n_bytes += n_bytes
+            while self._n_bytes > self._max_bytes and len(self._entries) > 1:
+                self._pop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+        return value
+
+    def drop_stale_entries(self, data_version: int):
+        """
+        Drops the entries built from another data version than `data_version`, once per new data version.
+        """
+        with self._lock:
+            if data_version == self._data_version:
+                return
+            self._data_version = data_version
+            stale_keys = [key for key, (version, _, _) in self._entries.items() if version[0] != data_version]
+            for key in stale_keys:
+                self._pop(key)
+        if len(stale_keys):
+            print(f"Country datasets cache: dropped {len(stale_keys)} entries older than data version {data_version}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._n_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._n_bytes}
+
+
+@st.cache_resource
+def _get_shared_dataset_cache() -> _SharedDatasetCache:
+    """
+    Returns the single dataset cache of the Streamlit process.
+    """
+    return _SharedDatasetCache()
+
+
+def _load_cached_dataset(name: str, file_paths: List[os.PathLike], loader: Callable, *args, **kwargs) -> Any:
+    """
+    Loads a dataset through the shared process cache.
+
+    Parameters:
+    name (str): Unique name of the dataset in the cache.
+    file_paths (List[os.PathLike]): Files the dataset is built from, their mtime and size make the cache version
+        along with the data version of the datasets metadata.
+    loader (Callable): Function building the dataset, called with `*args` and `**kwargs` on a cache miss.
+
+    Returns:
+    Any: The cached dataset. It is shared across sessions and must not be modified in place.
+    """
+    data_version = _get_data_version()
+    cache = _get_shared_dataset_cache()
+    cache.drop_stale_entries(data_version)
+    version = (data_version, *(_get_file_version(file_path) for file_path in file_paths))
+    return cache.get(name, version, loader, *args, **kwargs)
+
+
+@st.cache_resource
+def _get_shared_country_datasets_cache() -> _SharedBoundedDatasetCache:
+    """
+    Returns the single per-country datasets cache of the Streamlit process.
+    """
+    return _SharedBoundedDatasetCache(country_datasets_cache_max_bytes)
+
+
+def _load_country_cached_dataset(
+    name: str, selected_country: str, file_paths: List[os.PathLike], loader: Callable, *args, **kwargs
+) -> Any:
+    """
+    Loads the dataset of one country through the shared per-country datasets cache.
+
+    Parameters:
+    name (str): Name of the dataset, the cache holding one entry per dataset and country.
+    selected_country (str): Country of the dataset.
+    file_paths (List[os.PathLike]): Files the dataset is built from, their mtime and size make the cache version
+        along with the data version of the datasets metadata.
+    loader (Callable): Function building the dataset, called with `*args` and `**kwargs` on a cache miss.
+
+    Returns:
+    Any: The cached dataset. It is shared across sessions and must not be modified in place. It may be evicted
+    once other countries are loaded, so callers look it up again rather than keeping it in the session state.
+    """
+    data_version = _get_data_version()
+    cache = _get_shared_country_datasets_cache()
+    cache.drop_stale_entries(data_version)
+    version = (data_version, *(_get_file_version(file_path) for file_path in file_paths))
+    return cache.get((name, selected_country), version, loader, *args, **kwargs)
+
+
+def _get_dataset_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Returns the hit and miss counts of the shared dataset cache, per dataset name.
+    """
+    return _get_shared_dataset_cache().stats()
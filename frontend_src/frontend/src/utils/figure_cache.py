@@ -0,0 +1,239 @@
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import multiprocessing.pool
+import os
+import queue
+import sys
+import threading
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+# Maximum number of rendered figures kept in memory, the least recently shown ones are evicted first
+figure_cache_max_entries = 512
+
+# Number of processes rendering the figures of the pages displayed with `_deferred_figures_rendering`, 0 to render
+# them on the script thread
+chart_rendering_processes = int(os.getenv("CPAOR_CHART_RENDERING_PROCESSES", "0"))
+
+# Seconds waited for the next figure rendered in the pool, after which the outstanding figures are rendered on the
+# script thread: a worker killed while rendering, e.g. out of memory, never reports its figure
+chart_rendering_timeout = 60
+
+# Placeholders of the figures rendering in the pool and queue of their results, per script thread
+_deferred_figures = threading.local()
+
+
+def _hash_figure_inputs(*inputs: Any) -> str:
+    """
+    Returns a hash of the data and styling arguments a figure is built from.
+    DataFrames are hashed on their columns, dtypes and values, the other arguments on their JSON representation.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        if isinstance(value, pd.DataFrame):
+            hasher.update(json.dumps([list(map(str, value.columns)), list(map(str, value.dtypes))]).encode())
+            hasher.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+        else:
+            hasher.update(json.dumps(value, sort_keys=True, default=str).encode())
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+class _SharedFigureCache:
+    """
+    Process-wide LRU cache of rendered figures, shared by every Streamlit session.
+
+    Entries are PNG bytes keyed by the figure name and the hash of its inputs, so that the same chart
+    shown again, by the same session or another one, is not rebuilt.
+    """
+
+    def __init__(self, max_entries: int):
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Tuple[str, str], bytes] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def lookup(self, key: Tuple[str, str]) -> Optional[bytes]:
+        """
+        Returns the rendered figure of `key`, or None after counting a miss.
+        """
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return image
+
+    def store(self, key: Tuple[str, str], image: bytes):
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get(self, key: Tuple[str, str], renderer: Callable[[], bytes]) -> bytes:
+        image = self.lookup(key)
+        if image is None:
+            # Rendered outside of the lock, two sessions missing the same figure at once both render it
+            image = renderer()
+            self.store(key, image)
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": sum(len(image) for image in self._entries.values()),
+            }
+
+
+@st.cache_resource
+def _get_shared_figure_cache() -> _SharedFigureCache:
+    """
+    Returns the single figure cache of the Streamlit process.
+    """
+    return _SharedFigureCache(figure_cache_max_entries)
+
+
+@st.cache_resource
+def _get_chart_rendering_pool() -> Optional[multiprocessing.pool.Pool]:
+    """
+    Returns the process pool rendering the deferred figures, None when `chart_rendering_processes` is 0.
+
+    The workers are spawned, forking the multi-threaded Streamlit server is not safe. They are all started here,
+    with the `__main__` module hidden: Streamlit runs the app as `__main__`, which spawned workers would run again.
+    """
+    if chart_rendering_processes <= 0:
+        return None
+
+    main_module = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        return multiprocessing.get_context("spawn").Pool(processes=chart_rendering_processes)
+    finally:
+        sys.modules["__main__"] = main_module
+
+
+def _render_figure_png(builder: Callable, args: Tuple, savefig_kwargs: Dict[str, Any]) -> bytes:
+    """
+    Builds a figure, renders it to PNG bytes with the options of `st.pyplot` and closes it.
+    """
+    fig = builder(*args)
+    try:
+        image = io.BytesIO()
+        fig.savefig(image, **{"format": "png", "dpi": 200, "bbox_inches": "tight", **savefig_kwargs})
+        return image.getvalue()
+    finally:
+        # Figures created with pyplot stay referenced until they are closed
+        plt.close(fig)
+
+
+def _show_cached_figure(name: str, builder: Callable, *args: Any, savefig_kwargs: Optional[Dict[str, Any]] = None):
+    """
+    Displays a matplotlib figure, rendered once per distinct input through the shared figure cache.
+
+    Parameters:
+    name (str): Name of the chart type, part of the cache key.
+    builder (Callable): Function returning the matplotlib figure, called with `*args` on a cache miss.
+    *args: Data and styling arguments of the figure, hashed to make the cache key.
+    savefig_kwargs (Optional[Dict[str, Any]]): Options given to `savefig`, on top of the `st.pyplot` defaults.
+
+    Operation:
+    1. Hashes the arguments of the figure, the DataFrames being hashed on their content.
+    2. On a cache miss, builds the figure, renders it to PNG bytes and closes it.
+       Within `_deferred_figures_rendering`, leaves a placeholder and submits the figure to the rendering pool instead.
+    3. Displays the PNG bytes with the container width, like `st.pyplot`.
+    """
+    savefig_kwargs = savefig_kwargs or {}
+    key = (name, _hash_figure_inputs(*args, savefig_kwargs))
+    figure_cache = _get_shared_figure_cache()
+
+    image = figure_cache.lookup(key)
+    if image is None:
+        pending_figures = getattr(_deferred_figures, "pending", None)
+        if pending_figures is not None:
+            # Rendered in the pool while the rest of the page is laid out
+            figure_id = len(pending_figures)
+            pending_figures.append((st.empty(), key, builder, args, savefig_kwargs))
+            _get_chart_rendering_pool().apply_async(
+                _render_figure_png,
+                (builder, args, savefig_kwargs),
+                callback=lambda image, results=_deferred_figures.results: results.put((figure_id, image, None)),
+                error_callback=lambda error, results=_deferred_figures.results: results.put((figure_id, None, error)),
+            )
+            return
+        image = _render_figure_png(builder, args, savefig_kwargs)
+        figure_cache.store(key, image)
+    st.image(image, use_container_width=True)
+
+
+@contextlib.contextmanager
+def _deferred_figures_rendering():
+    """
+    Renders the figures shown in the block in the chart rendering pool, instead of one after the other.
+
+    Operation:
+    1. Does nothing more than running the block when the pool is disabled or a deferred block is already running.
+    2. Otherwise, the cache misses of `_show_cached_figure` in the block leave a placeholder and submit their figure.
+    3. When the block ends, fills each placeholder as soon as its figure is rendered and stores it in the cache.
+       A figure failing in the pool, e.g. because its arguments cannot be pickled, is rendered on the script thread,
+       as well as the outstanding figures when none is rendered for `chart_rendering_timeout` seconds.
+    """
+    if _get_chart_rendering_pool() is None or getattr(_deferred_figures, "pending", None) is not None:
+        yield
+        return
+
+    pending_figures: List[Tuple[Any, Tuple[str, str], Callable, Tuple, Dict[str, Any]]] = []
+    _deferred_figures.pending = pending_figures
+    _deferred_figures.results = queue.Queue()
+    try:
+        yield
+    finally:
+        # The figures of a block interrupted by an exception or a rerun are left to the pool and never shown
+        results = _deferred_figures.results
+        _deferred_figures.pending = None
+        _deferred_figures.results = None
+
+    outstanding_figure_ids = set(range(len(pending_figures)))
+    while len(outstanding_figure_ids):
+        try:
+            figure_id, image, error = results.get(timeout=chart_rendering_timeout)
+        except queue.Empty:
+            print(f"{len(outstanding_figure_ids)} figures not rendered by the pool in time, rendering them here")
+            for figure_id in sorted(outstanding_figure_ids):
+                placeholder, key, builder, args, savefig_kwargs = pending_figures[figure_id]
+                image = _render_figure_png(builder, args, savefig_kwargs)
+                _get_shared_figure_cache().store(key, image)
+                placeholder.image(image, use_container_width=True)
+            break
+
+        outstanding_figure_ids.discard(figure_id)
+        placeholder, key, builder, args, savefig_kwargs = pending_figures[figure_id]
+        if error is not None:
+            print(f"Figure rendering failed in the pool, rendering it on the script thread: {error!r}")
+            image = _render_figure_png(builder, args, savefig_kwargs)
+        _get_shared_figure_cache().store(key, image)
+        placeholder.image(image, use_container_width=True)
+
+
+def _get_figure_cache_stats() -> Dict[str, int]:
+    """
+    Returns the hit, miss and eviction counts of the shared figure cache, with its number of entries and size.
+    """
+    return _get_shared_figure_cache().stats()
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
 import fiona
 import streamlit as st
@@ -13,30 +13,41 @@ countries_mapping = {
 }
 
 
-def _convert_geometries_to_geojson(polygon, tolerance: float, return_extreme_points: bool):
+# Simplification tolerances (in degrees) of the level-of-detail pyramid of the world map, finest first.
+# It shows the coarsest level whose simplification stays under a pixel at its initial zoom.
+adm0_lod_tolerances = [0.1, 0.25, 0.5]
+# Simplification tolerance (in degrees) of the regions, the country maps being zoomable into them.
+# The processing pipeline's `prepare_adm1_polygons` simplifies the regions with the same tolerance.
+adm1_tolerance = 0.05
+
+
+def _convert_geometries_to_geojson(polygon, tolerances: List[float], return_extreme_points: bool):
     """
-    Converts a polygon geometry to GeoJSON format with optional simplification and extraction of extreme points.
+    Converts a polygon geometry to GeoJSON format at several simplification levels,
+    with optional extraction of extreme points.
 
     Parameters:
     polygon (Polygon): The polygon geometry to convert.
-    tolerance (float): The tolerance level for simplifying the polygon.
+    tolerances (List[float]): The tolerance levels for simplifying the polygon.
     return_extreme_points (bool): Whether to return the extreme points of the polygon.
 
     Returns:
-    dict: A dictionary containing the GeoJSON geometry and optionally the extreme points.
+    dict: A dictionary containing the GeoJSON geometry of each tolerance and optionally the extreme points.
 
     Operation:
     1. Converts the input polygon to a shapely shape.
-    2. Simplifies the polygon geometry based on the provided tolerance.
-    3. Converts the simplified geometry to GeoJSON format.
+    2. Simplifies the polygon geometry with each of the provided tolerances.
+    3. Converts the simplified geometries to GeoJSON format, in the order of the tolerances.
     4. If `return_extreme_points` is True, calculates the bounding box of the
        original polygon and adds the extreme points to the returned data.
-    5. Returns a dictionary with the GeoJSON geometry and optionally the extreme points.
+    5. Returns a dictionary with the GeoJSON geometries and optionally the extreme points.
     """
     preprocessed_val = shape(polygon)
 
-    processed_polygon = mapping(preprocessed_val.simplify(tolerance=tolerance, preserve_topology=True))
-    returned_data = {"geometry": processed_polygon}
+    processed_polygons = [
+        mapping(preprocessed_val.simplify(tolerance=tolerance, preserve_topology=True)) for tolerance in tolerances
+    ]
+    returned_data = {"geometries": processed_polygons}
 
     if return_extreme_points:
         # get extreme points
@@ -47,33 +58,68 @@ def _convert_geometries_to_geojson(polygon, tolerance: float, return_extreme_poi
     return returned_data
 
 
+def _build_lod_levels(
+    features: List[Tuple[Any, Dict[str, Any], List[Dict[str, Any]]]], tolerances: List[float]
+) -> List[Dict[str, Any]]:
+    """
+    Builds the level-of-detail pyramid of a layer from its (feature id, properties, geometry of each tolerance) features.
+    Each level is {"tolerance": tolerance, "geojson": feature collection}, the finest first.
+    """
+    return [
+        {
+            "tolerance": tolerance,
+            "geojson": {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": feature_id, "properties": dict(properties), "geometry": geometries[i]}
+                    for feature_id, properties, geometries in features
+                ],
+            },
+        }
+        for i, tolerance in enumerate(tolerances)
+    ]
+
+
+def _select_lod_geojson(polygons_levels: List[Dict[str, Any]], zoom: float) -> Dict[str, Any]:
+    """
+    Returns the GeoJSON of the coarsest level whose tolerance stays under the size of a pixel at the given map zoom,
+    the finest level if none does.
+    """
+    # The map is 512 pixels wide for the 360 degrees of longitude at zoom 0, twice as wide at each zoom level
+    degrees_per_pixel = 360 / (512 * 2**zoom)
+
+    selected_level = polygons_levels[0]
+    for level in polygons_levels:
+        if level["tolerance"] <= degrees_per_pixel and level["tolerance"] > selected_level["tolerance"]:
+            selected_level = level
+    return selected_level["geojson"]
+
+
 ################# LOAD ADM0 POLYGONS ####################  # noqa
 
 
 @st.cache_data
 def _load_gpkg_adm0(file_path: str):
     """
-    Loads polygons from a GeoPackage file and returns a GeoJSON object.
+    Loads polygons from a GeoPackage file and returns their level-of-detail pyramid.
 
     Parameters:
     file_path (str): The path to the GeoPackage file.
 
     Returns:
-    dict: A GeoJSON object containing the filtered features.
+    list: The GeoJSON object of the filtered features at each tolerance of `adm0_lod_tolerances`.
 
     Operation:
-    1. Initializes an empty GeoJSON object.
-    2. Opens the GeoPackage file using Fiona and iterates over the features.
-    3. Filters features based on the 'adm0_name' property to match countries stored in the Streamlit session state.
-    4. Converts the geometries of the filtered features to GeoJSON format with optional simplification.
-    5. Constructs a GeoJSON feature for each filtered feature with the necessary properties and geometry.
-    6. Adds the constructed features to the GeoJSON object.
-    7. Returns the completed GeoJSON object.
+    1. Opens the GeoPackage file using Fiona and iterates over the features.
+    2. Filters features based on the 'adm0_name' property to match countries stored in the Streamlit session state.
+    3. Converts the geometries of the filtered features to GeoJSON format at each simplification tolerance.
+    4. Builds one GeoJSON object per tolerance with the necessary properties and geometry of each feature.
+    5. Returns the levels, the finest first.
     """
 
     # Note for Admin 0 gpkg file, get it from here: https://fieldmaps.io/data/adm0
 
-    geojson_obj = {"type": "FeatureCollection", "features": []}
+    filtered_features = []
 
     # Open GeoPackage file and iterate over features to filter them
     with fiona.open(file_path, vfs="{}".format(file_path), enabled_drivers="GeoJSON") as src:
@@ -87,56 +133,56 @@ def _load_gpkg_adm0(file_path: str):
 
                 filtered_properties = {"name": adm0_name}
                 processed_data = _convert_geometries_to_geojson(
-                    feature["geometry"], tolerance=0.1, return_extreme_points=True
+                    feature["geometry"], tolerances=adm0_lod_tolerances, return_extreme_points=False
                 )
 
-                filtered_feature = {
-                    "type": feature["id"],
-                    "properties": filtered_properties,
-                    "geometry": processed_data["geometry"],
-                }
+                filtered_features.append((feature["id"], filtered_properties, processed_data["geometries"]))
 
-                geojson_obj["features"].append(filtered_feature)
-    return geojson_obj
+    return _build_lod_levels(filtered_features, adm0_lod_tolerances)
 
 
-@st.cache_data
-def _load_polygons_adm0():
+def _get_adm0_polygons_file_path(geolocation_processed_data_path: os.PathLike) -> str:
+    return os.path.join(geolocation_processed_data_path, "adm0_polygons", "adm0_polygons_lod.json")
+
+
+@st.cache_data(max_entries=1)
+def _load_polygons_adm0(data_version: int):
     """
-    Loads and returns GeoJSON data for administrative level 0 polygons (countries).
+    Loads and returns the level-of-detail pyramid of the administrative level 0 polygons (countries).
+
+    Parameters:
+    data_version (int): Data version of the datasets metadata, the polygons being filtered on the report countries.
+        Only the levels of the current version are kept in the cache.
 
     Returns:
-    dict: GeoJSON data for administrative level 0 polygons.
+    list: The {"tolerance", "geojson"} levels of the administrative level 0 polygons, the finest first.
 
     Operation:
     1. Constructs paths for processed and loaded data files.
-    2. Checks if the GeoJSON file for administrative level 0 polygons exists
+    2. Checks if the GeoJSON levels file for administrative level 0 polygons exists
        in the processed data directory.
     3. If the file does not exist, loads polygons from a GeoPackage file,
-       converts them to GeoJSON, and saves the GeoJSON file.
-    4. If the file exists, loads the GeoJSON data from the file.
-    5. Returns the loaded GeoJSON data.
+       converts them to GeoJSON at each tolerance, and saves the levels file.
+    4. If the file exists, loads the GeoJSON levels from the file.
+    5. Returns the loaded GeoJSON levels.
     """
 
-    adm0_processed_data = os.path.join(st.session_state["geolocation_processed_data_path"], "adm0_polygons")
-    # os.makedirs(adm0_processed_data, exist_ok=True)
-
-    loaded_data_path = os.path.join(adm0_processed_data, "adm0_polygons.geojson")
+    loaded_data_path = _get_adm0_polygons_file_path(st.session_state["geolocation_processed_data_path"])
 
     if not os.path.exists(loaded_data_path):
-        geojson_countries_file = _load_gpkg_adm0(
+        geojson_countries_levels = _load_gpkg_adm0(
             os.path.join(st.session_state["original_polygons_data_path"], "adm0_polygons.gpkg")
         )
         # save geojson
         with open(loaded_data_path, "w") as f:
-            json.dump(geojson_countries_file, f)
+            json.dump(geojson_countries_levels, f)
 
     else:
         # load geojson file
         with open(loaded_data_path, "r") as f:
-            geojson_countries_file = json.load(f)
+            geojson_countries_levels = json.load(f)
 
-    return geojson_countries_file
+    return geojson_countries_levels
 
 
 ################# LOAD ADM1 POLYGONS ####################  # noqa
@@ -169,6 +215,52 @@ def _update_min_max(extreme_points: Dict[str, float], new_extreme_points: Dict[s
     return extreme_points
 
 
+def _build_adm1_geojson_data(adm1_features: List[Tuple[Any, str, Any]]) -> Dict[str, Any]:
+    """
+    Simplifies the administrative level 1 polygons of a country into GeoJSON data.
+
+    Parameters:
+    adm1_features (List[Tuple[Any, str, Any]]): The (feature id, adm1 name, geometry) of each region of the country.
+
+    Returns:
+    dict: The GeoJSON simplified with `adm1_tolerance` under "geojson" and the extreme points of the country
+    under "extreme_points".
+
+    Operation:
+    1. Converts the geometry of each region to GeoJSON format with extreme points extraction.
+    2. Constructs the GeoJSON features, with the region name as property.
+    3. Updates the extreme points of the country with the ones of each region.
+    """
+    extreme_points = {"minx": None, "miny": None, "maxx": None, "maxy": None}
+
+    filtered_features = []
+    for feature_id, adm1_name, geometry in adm1_features:
+        geojson_geometry = _convert_geometries_to_geojson(geometry, tolerances=[adm1_tolerance], return_extreme_points=True)
+
+        filtered_features.append((feature_id, {"name": adm1_name}, geojson_geometry["geometries"]))
+
+        # update extreme_points
+        extreme_points = _update_min_max(extreme_points, geojson_geometry["extreme_points"])
+
+    return {
+        "geojson": _build_lod_levels(filtered_features, [adm1_tolerance])[0]["geojson"],
+        "extreme_points": extreme_points,
+    }
+
+
+def _get_adm1_polygons_file_path(geolocation_processed_data_path: os.PathLike, country: str) -> str:
+    return os.path.join(geolocation_processed_data_path, "adm1_polygons", f"{country.replace('/', '-')}.geojson")
+
+
+def _save_adm1_geojson_data(file_path: os.PathLike, geojson_data: Dict[str, Any]):
+    """
+    Saves the GeoJSON data of a country, written to a temporary file first so that readers never see a partial file.
+    """
+    with open(f"{file_path}.tmp", "w") as f:
+        json.dump(geojson_data, f)
+    os.replace(f"{file_path}.tmp", file_path)
+
+
 def _load_gpkg_adm1(file_path: str, used_countries: List[str]):  # Not mentioning 'geometry' in imported_columns
     """
     Loads administrative level 1 polygons (regions) from a GeoPackage file and returns GeoJSON data.
@@ -178,48 +270,29 @@ def _load_gpkg_adm1(file_path: str, used_countries: List[str]):  # Not mentionin
     used_countries (List[str]): List of countries to filter the regions.
 
     Returns:
-    tuple: A tuple containing filtered GeoJSON features and extreme points dictionary.
+    tuple: A tuple containing the GeoJSON object of the filtered features and extreme points dictionary.
 
     Operation:
-    1. Initializes an empty dictionary for extreme points.
-    2. Initializes an empty GeoJSON feature collection.
-    3. Opens the GeoPackage file using Fiona and iterates over features.
-    4. Filters features based on the 'adm0_name' property to match countries in 'used_countries'.
-    5. Converts the geometries of filtered features to GeoJSON format with extreme points extraction.
-    6. Constructs GeoJSON features for each filtered feature with necessary properties and geometry.
-    7. Updates extreme points based on the extracted points of each geometry.
-    8. Returns a tuple containing filtered GeoJSON features and the updated extreme points dictionary.
+    1. Opens the GeoPackage file using Fiona and iterates over features.
+    2. Filters features based on the 'adm0_name' property to match countries in 'used_countries'.
+    3. Converts the filtered features to GeoJSON with `_build_adm1_geojson_data`.
+    4. Returns a tuple containing the GeoJSON object and the extreme points dictionary.
     """
 
-    extreme_points = {"minx": None, "miny": None, "maxx": None, "maxy": None}
-
     # Open GeoPackage file and iterate over features to filter them
-    filtered_features = {"type": "FeatureCollection", "features": []}
+    adm1_features = []
     with fiona.open(file_path, vfs="{}".format(file_path), enabled_drivers="GeoJSON") as src:
         for feature in src:
             # Check if the feature satisfies the SQL filter condition for rows
-            country_official_name = feature["properties"]["adm0_name"]
-
-            if country_official_name in used_countries:
-                # Filter columns based on the SQL query
-                filtered_properties = {"name": feature["properties"]["adm1_name"]}
-
-                geojson_geometry = _convert_geometries_to_geojson(
-                    feature["geometry"], tolerance=0.05, return_extreme_points=True
-                )
+            country_name = feature["properties"]["adm0_name"]
+            country_name = countries_mapping.get(country_name, country_name)
 
-                filtered_feature = {
-                    "type": feature["id"],
-                    "properties": filtered_properties,
-                    "geometry": geojson_geometry["geometry"],
-                }
+            if country_name in used_countries:
+                adm1_features.append((feature["id"], feature["properties"]["adm1_name"], feature["geometry"]))
 
-                # update extreme_points
-                extreme_points = _update_min_max(extreme_points, geojson_geometry["extreme_points"])
+    geojson_data = _build_adm1_geojson_data(adm1_features)
 
-                filtered_features["features"].append(filtered_feature)
-
-    return filtered_features, extreme_points
+    return geojson_data["geojson"], geojson_data["extreme_points"]
 
 
 def _load_polygons_adm1(treated_country: str, geodata_countries: List[str]):
@@ -231,23 +304,24 @@ def _load_polygons_adm1(treated_country: str, geodata_countries: List[str]):
     geodata_countries (List[str]): List of countries to filter the regions.
 
     Returns:
-    tuple: A tuple containing GeoJSON data for administrative level 1 polygons and extreme points.
+    tuple: A tuple containing the GeoJSON object for administrative level 1 polygons and extreme points.
 
     Operation:
     1. Constructs paths for processed and loaded data files specific to administrative level 1 polygons.
-    2. Checks if the GeoJSON file for the specified country exists in the processed data directory.
+    2. Checks if the GeoJSON file for the specified country exists in the processed data directory,
+       where the processing pipeline's `prepare_adm1_polygons` writes the files of all the report countries.
     3. If the file does not exist, loads polygons from a GeoPackage file,
        converts them to GeoJSON, and saves the GeoJSON file.
     4. If the file exists, loads the GeoJSON data from the file.
-    5. Returns a tuple containing GeoJSON data for administrative level 1 polygons and extreme points.
+    5. Returns a tuple containing the GeoJSON object for administrative level 1 polygons and extreme points.
     """
 
-    adm1_processed_data = os.path.join(st.session_state["geolocation_processed_data_path"], "adm1_polygons")
-    os.makedirs(adm1_processed_data, exist_ok=True)
-
-    loaded_data_path = os.path.join(adm1_processed_data, f"{treated_country.replace('/', '-')}.geojson")
+    loaded_data_path = _get_adm1_polygons_file_path(st.session_state["geolocation_processed_data_path"], treated_country)
+    os.makedirs(os.path.dirname(loaded_data_path), exist_ok=True)
 
     if not os.path.exists(loaded_data_path):
+        # Normally prepared beforehand for all the countries by the processing pipeline
+        print(f"ADM1 polygons of {treated_country} not prepared, extracting them from the GeoPackage file")
         geojson_country_file, extreme_points = _load_gpkg_adm1(
             os.path.join(st.session_state["original_polygons_data_path"], "adm1_polygons.gpkg"),
             geodata_countries,
@@ -257,8 +331,7 @@ def _load_polygons_adm1(treated_country: str, geodata_countries: List[str]):
             "geojson": geojson_country_file,
             "extreme_points": extreme_points,
         }
-        with open(loaded_data_path, "w") as f:
-            json.dump(geojson_data, f)
+        _save_adm1_geojson_data(loaded_data_path, geojson_data)
 
     else:
         # load geojson file
@@ -0,0 +1,301 @@
+import json
+import os
+import resource
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from frontend.src.utils.data_cache import _get_file_version, _load_country_cached_dataset
+
+published_folder_name = "published"
+latest_snapshot_file_name = "latest.json"
+
+# Arrow types converted to pandas extension types wrapping the Arrow buffers, the strings of the store files being
+# written with 64-bit offsets. The other types are converted by pyarrow, without copies when they have no nulls.
+published_pandas_types = {pa.large_string(): pd.StringDtype("pyarrow")}
+
+# Version of the snapshot layout read by the dashboard, the snapshots of another layout are not served
+published_format_version = 2
+
+# Seconds between two checks of the latest published snapshot by the background watcher, 0 to check on each run
+published_snapshot_watch_interval = float(os.getenv("CPAOR_PUBLISHED_SNAPSHOT_WATCH_INTERVAL", "60"))
+
+# Snapshot pinned for the run of the calling thread, each Streamlit run executing in the thread of its script runner.
+# It is released with the thread, so that idle sessions do not keep old snapshots mapped.
+_published_run = threading.local()
+
+
+def _get_published_snapshot_infos_path() -> str:
+    """
+    Returns the path of the file pointing to the latest snapshot published by the processing pipeline.
+    """
+    return os.path.join(st.session_state["tabular_data_data_path"], published_folder_name, latest_snapshot_file_name)
+
+
+def _read_mapped_store_table(file_path: os.PathLike) -> pa.Table:
+    """
+    Memory-maps an Arrow IPC file of the published store, read-only. The table references the mapped pages
+    without copying them, the pages being shared by all the processes mapping the same file.
+    """
+    with pa.memory_map(str(file_path), "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _read_published_snapshot(published_path: os.PathLike, snapshot_infos: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Opens every table of a published snapshot, memory-mapping its Arrow IPC store file.
+
+    Returns:
+    Dict[str, Any]: The snapshot 'infos' of latest.json, its folder 'path' and its Arrow 'tables' by name.
+    """
+    snapshot_path = os.path.join(published_path, snapshot_infos["snapshot"])
+    tables = {
+        table_name: _read_mapped_store_table(os.path.join(snapshot_path, table_infos["store_file"]))
+        for table_name, table_infos in snapshot_infos["tables"].items()
+    }
+    return {"infos": snapshot_infos, "path": snapshot_path, "tables": tables}
+
+
+class _PublishedSnapshotWatcher:
+    """
+    Holds the published snapshot served by the Streamlit process and swaps in the new ones.
+
+    A new snapshot is opened entirely before replacing the current one, as a single reference: runs that already
+    got the previous snapshot finish on it, the next runs get the new one, and the previous snapshot is freed once
+    no run references it anymore. Its files are kept by the processing pipeline until the following publish.
+    """
+
+    def __init__(self, published_path: os.PathLike, watch_interval: float):
+        self._published_path = published_path
+        self._snapshot_infos_path = os.path.join(published_path, latest_snapshot_file_name)
+        self._refresh_lock = threading.Lock()
+        self._snapshot_infos_version = None
+        self._current: Optional[Dict[str, Any]] = None
+        self._watch_interval = watch_interval
+
+        self.refresh()
+        if watch_interval > 0:
+            threading.Thread(target=self._watch, name="published-snapshot-watcher", daemon=True).start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self._watch_interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Published snapshot: reload failed, still serving the previous snapshot: {e}")
+
+    def refresh(self):
+        """
+        Reads the new snapshot if latest.json changed, then swaps it in and reports the reload time and memory.
+        """
+        with self._refresh_lock:
+            snapshot_infos_version = _get_file_version(self._snapshot_infos_path)
+            if snapshot_infos_version == self._snapshot_infos_version:
+                return
+            if snapshot_infos_version[1] is None:
+                # Nothing published yet
+                self._snapshot_infos_version = snapshot_infos_version
+                return
+
+            with open(self._snapshot_infos_path, "r") as file:
+                snapshot_infos = json.load(file)
+            if self._current is not None and snapshot_infos["snapshot"] == self._current["infos"]["snapshot"]:
+                self._snapshot_infos_version = snapshot_infos_version
+                return
+            if snapshot_infos.get("format") != published_format_version:
+                # Published by an older processing pipeline, the raw files are read until it publishes again
+                print(f"Published snapshot: {snapshot_infos['snapshot']} has another layout, it is not served")
+                self._snapshot_infos_version = snapshot_infos_version
+                return
+
+            start_time = time.perf_counter()
+            # Peak resident memory of the process in KiB, on Linux
+            previous_peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            snapshot = _read_published_snapshot(self._published_path, snapshot_infos)
+            self._current = snapshot
+            self._snapshot_infos_version = snapshot_infos_version
+
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        mapped_nbytes = sum(table.nbytes for table in snapshot["tables"].values())
+        print(
+            f"Published snapshot: swapped in {snapshot_infos['snapshot']} ({len(snapshot['tables'])} tables, "
+            f"{mapped_nbytes} bytes memory-mapped) "
+            f"in {time.perf_counter() - start_time:.2f}s, "
+            f"peak memory {peak_memory // 1024} MiB (was {previous_peak_memory // 1024} MiB before the reload)"
+        )
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        if self._watch_interval <= 0:
+            self.refresh()
+        return self._current
+
+
+@st.cache_resource
+def _get_published_snapshot_watcher(published_path: str) -> _PublishedSnapshotWatcher:
+    """
+    Returns the single published snapshot watcher of the Streamlit process, started on the first call.
+    """
+    return _PublishedSnapshotWatcher(published_path, published_snapshot_watch_interval)
+
+
+def _get_current_published_snapshot() -> Optional[Dict[str, Any]]:
+    """
+    Returns the snapshot currently served by the process, None if nothing was published yet.
+    """
+    published_path = os.path.join(st.session_state["tabular_data_data_path"], published_folder_name)
+    return _get_published_snapshot_watcher(published_path).current()
+
+
+def _pin_published_snapshot():
+    """
+    Pins the snapshot currently served by the process for the current run, called by the app at the start of each run.
+    """
+    _published_run.snapshot = _get_current_published_snapshot()
+
+
+def _get_published_snapshot() -> Optional[Dict[str, Any]]:
+    """
+    Returns the snapshot pinned for the current run, so that all its tables come from the same snapshot
+    even when a new one is swapped in meanwhile. The current snapshot if the run did not pin one, or if the folder
+    of the pinned one was removed by the newer publishes, its files not being readable anymore.
+    """
+    snapshot = getattr(_published_run, "snapshot", None)
+    if snapshot is None or not os.path.isdir(snapshot["path"]):
+        snapshot = _get_current_published_snapshot()
+        _published_run.snapshot = snapshot
+    return snapshot
+
+
+def _get_published_snapshot_path() -> str:
+    """
+    Returns the folder of the snapshot pinned for the current run, latest.json if nothing was published yet.
+    Dataset loaders reading published tables add it to their cache file paths so that a new snapshot reloads them.
+    """
+    snapshot = _get_published_snapshot()
+    if snapshot is None:
+        return _get_published_snapshot_infos_path()
+    return snapshot["path"]
+
+
+def _load_published_snapshot_infos() -> Optional[Dict[str, Any]]:
+    """
+    Returns the description of the snapshot pinned for the current run, None if nothing was published yet.
+    """
+    snapshot = _get_published_snapshot()
+    if snapshot is None:
+        return None
+    return snapshot["infos"]
+
+
+def _read_published_table(table_name: str, filters: Optional[List[Tuple[str, str, Any]]] = None) -> Optional[pd.DataFrame]:
+    """
+    Reads a table of the snapshot pinned for the current run.
+
+    Parameters:
+    table_name (str): Name of the table in the snapshot.
+    filters (Optional[List[Tuple[str, str, Any]]]): Row filters in the pyarrow format, e.g. [("Country", "==", country)],
+    only the matching rows being converted.
+
+    Returns:
+    Optional[pd.DataFrame]: The table, or None if it is not published so that callers fall back to the raw files.
+
+    Operation:
+    1. Looks up the table in the snapshot opened by the snapshot watcher, memory-mapped from its store file.
+    2. Converts it to pandas, the renames, country mappings and date parsing being already applied. The columns
+       keep referencing the mapped buffers: the numbers and dates without missing values as read-only NumPy arrays,
+       and the strings as 'string[pyarrow]' arrays. Only the rows kept by `filters` are copied.
+    """
+    snapshot = _get_published_snapshot()
+    if snapshot is None or table_name not in snapshot["tables"]:
+        return None
+
+    table = snapshot["tables"][table_name]
+    if filters is not None:
+        table = table.filter(pq.filters_to_expression(filters))
+    return table.to_pandas(split_blocks=True, types_mapper=published_pandas_types.get)
+
+
+def _read_published_table_or_csv(table_name: str, csv_path: os.PathLike) -> pd.DataFrame:
+    """
+    Reads a published table, or the CSV file it was built from if it is not published.
+    An empty DataFrame if neither exists.
+    """
+    df = _read_published_table(table_name)
+    if df is None:
+        if not os.path.exists(csv_path):
+            print(f"Table '{table_name}' neither published nor found at {csv_path}")
+            return pd.DataFrame()
+        df = pd.read_csv(csv_path)
+    return df
+
+
+def _read_published_country_profile(selected_country: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads the profile bundle of a country from the snapshot pinned for the current run.
+
+    Returns:
+    Optional[Dict[str, Any]]: The 'frames' of the Country Profile panels, already filtered on the country,
+    and the 'scalars' shown in their titles. None if the snapshot has no bundle for the country.
+
+    Operation:
+    1. Looks up the panel files and the scalars of the country in the pinned snapshot description.
+    2. Memory-maps the Arrow IPC file of each panel, converted like the published tables.
+    """
+    snapshot_infos = _load_published_snapshot_infos()
+    if snapshot_infos is None or selected_country not in snapshot_infos.get("country_profiles", {}):
+        return None
+
+    country_profile_infos = snapshot_infos["country_profiles"][selected_country]
+    try:
+        frames = {
+            panel: _read_mapped_store_table(os.path.join(_get_published_snapshot_path(), file_name)).to_pandas(
+                split_blocks=True, types_mapper=published_pandas_types.get
+            )
+            for panel, file_name in country_profile_infos["panels"].items()
+        }
+    except FileNotFoundError:
+        # The snapshot was removed by a newer publish while reading it, the next run reads the current one
+        print(f"Published profile of '{selected_country}' not found in snapshot {snapshot_infos['snapshot']}")
+        return None
+
+    return {"frames": frames, "scalars": country_profile_infos["scalars"]}
+
+
+def _load_published_country_profile(selected_country: str) -> Optional[Dict[str, Any]]:
+    """
+    Loads the profile bundle of a country through the shared per-country datasets cache, once per snapshot.
+    """
+    return _load_country_cached_dataset(
+        "published_country_profile",
+        selected_country,
+        [_get_published_snapshot_path()],
+        _read_published_country_profile,
+        selected_country,
+    )
+
+
+def _get_published_country_profile_frame(selected_country: str, panel: str) -> Optional[pd.DataFrame]:
+    """
+    Returns the frame of a Country Profile panel from the profile bundle of the country, None if it is not published
+    so that callers fall back to filtering the whole tables. It is shared across sessions and must not be modified.
+    """
+    country_profile = _load_published_country_profile(selected_country)
+    if country_profile is None:
+        return None
+    return country_profile["frames"].get(panel)
+
+
+def _get_published_country_profile_scalar(selected_country: str, name: str) -> Optional[Any]:
+    """
+    Returns a value precomputed in the profile bundle of the country, None if it is not published.
+    """
+    country_profile = _load_published_country_profile(selected_country)
+    if country_profile is None:
+        return None
+    return country_profile["scalars"].get(name)
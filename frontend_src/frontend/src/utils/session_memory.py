@@ -0,0 +1,51 @@
+import os
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from frontend.src.utils.data_cache import _get_shared_country_datasets_cache, _get_value_nbytes
+
+# Prints the memory held by the session state after each run when set to 1
+session_memory_report_enabled = os.getenv("CPAOR_SESSION_MEMORY_REPORT", "0") == "1"
+
+
+def _get_country_of_key(key: str, countries: List[str]) -> Optional[str]:
+    """
+    Returns the country a session state key is about, e.g. 'Chad' for 'protection_df_Chad', None for shared keys.
+    """
+    for country in countries:
+        if key.endswith(f"_{country}"):
+            return country
+    return None
+
+
+def _get_session_state_memory_report() -> Dict[str, int]:
+    """
+    Returns the approximate bytes held by the session state per key prefix, the country suffix of per-country keys
+    being dropped so that e.g. all 'protection_df_<country>' keys add up under 'protection_df_'.
+
+    Values coming from the shared dataset caches are referenced, not copied, by the session state: they are counted
+    in each session referencing them, the report being an upper bound of the memory the session adds.
+    """
+    countries = list(st.session_state.get("countries", {}).keys())
+    report: Dict[str, int] = {}
+    for key in list(st.session_state.keys()):
+        key = str(key)
+        country = _get_country_of_key(key, countries)
+        prefix = key if country is None else key[: -len(country)]
+        report[prefix] = report.get(prefix, 0) + _get_value_nbytes(st.session_state[key])
+    return dict(sorted(report.items(), key=lambda item: item[1], reverse=True))
+
+
+def _report_session_memory():
+    """
+    Prints the memory held by the session state per key prefix and by the shared per-country datasets cache,
+    when `CPAOR_SESSION_MEMORY_REPORT` is set to 1.
+    """
+    if not session_memory_report_enabled:
+        return
+    report = _get_session_state_memory_report()
+    print(
+        f"Session state memory: {sum(report.values())} bytes {report}, "
+        f"shared country datasets: {_get_shared_country_datasets_cache().stats()}"
+    )
@@ -0,0 +1,207 @@
+import os
+from typing import Callable, Dict, List
+
+import pandas as pd
+import streamlit as st
+
+from frontend.src.specific_datasets_scripts.acaps_inform_severity import _load_information_severity_index_data
+from frontend.src.specific_datasets_scripts.acled import _load_acled_data
+from frontend.src.specific_datasets_scripts.idmc import _load_idmc_data
+from frontend.src.specific_datasets_scripts.ipc import _load_preprocess_ipc_data
+from frontend.src.specific_datasets_scripts.ocha_hpc import (
+    _get_country_funding_charts_data,
+    _get_country_wise_children_in_need_tables,
+    _get_country_wise_pin_tables,
+    _get_cp_beneficiaries_charts_data,
+    _get_global_funding_chart_data,
+    country_wise_children_in_need_columns,
+    country_wise_pin_columns,
+)
+from frontend.src.utils.data_cache import _load_cached_dataset
+from frontend.src.utils.published_data import _get_published_snapshot_path, _read_published_table_or_csv
+from frontend.src.utils.utils_functions import _load_json_file, _load_protection_indicators_data
+
+
+def _load_inform_severity_dataset():
+    st.session_state["inform_severity_df"] = _load_information_severity_index_data()
+
+
+def _load_ocha_hpc_pin_dataset():
+    st.session_state["all_pin_data"] = _load_cached_dataset(
+        "ocha_hpc_pin",
+        [st.session_state["pin_df_path"], _get_published_snapshot_path()],
+        _read_published_table_or_csv,
+        "ocha_hpc_pin",
+        st.session_state["pin_df_path"],
+    )
+    st.session_state["ocha_hpc_min_year"] = st.session_state["all_pin_data"]["year"].min()
+    st.session_state["ocha_hpc_max_year"] = st.session_state["all_pin_data"]["year"].max()
+
+    # The tables of every year are computed once per data version, the selected year only picks one of them
+    country_wise_pin_tables = _load_cached_dataset(
+        "country_wise_pin_tables",
+        [st.session_state["pin_df_path"], _get_published_snapshot_path()],
+        _get_country_wise_pin_tables,
+        st.session_state["all_pin_data"],
+    )
+    st.session_state["country_wise_pin_data"] = country_wise_pin_tables.get(
+        st.session_state["selected-year"], pd.DataFrame(columns=country_wise_pin_columns)
+    )
+    country_wise_children_in_need_tables = _load_cached_dataset(
+        "country_wise_children_in_need_tables",
+        [st.session_state["pin_df_path"], _get_published_snapshot_path()],
+        _get_country_wise_children_in_need_tables,
+        st.session_state["all_pin_data"],
+    )
+    st.session_state["country_wise_children_in_need_data"] = country_wise_children_in_need_tables.get(
+        st.session_state["selected-year"], pd.DataFrame(columns=country_wise_children_in_need_columns)
+    )
+    st.session_state["cp_beneficiaries_charts_data"] = _load_cached_dataset(
+        "cp_beneficiaries_charts_data",
+        [st.session_state["pin_df_path"], _get_published_snapshot_path()],
+        _get_cp_beneficiaries_charts_data,
+        st.session_state["all_pin_data"],
+    )
+
+
+def _load_ocha_hpc_global_funding_dataset():
+    if os.path.exists(st.session_state["global_funding_file_path"]):
+        st.session_state["ocha_hpc_global_funding_df"] = _load_cached_dataset(
+            "ocha_hpc_global_funding",
+            [st.session_state["global_funding_file_path"], _get_published_snapshot_path()],
+            _read_published_table_or_csv,
+            "ocha_hpc_global_funding",
+            st.session_state["global_funding_file_path"],
+        )
+    else:
+        st.session_state["ocha_hpc_global_funding_df"] = pd.DataFrame(
+            columns=["year", "funding_requested", "funding_received", "cp_beneficiaries", "total_countries"]
+        )
+    st.session_state["ocha_hpc_global_funding_chart_data"] = _load_cached_dataset(
+        "ocha_hpc_global_funding_chart_data",
+        [st.session_state["global_funding_file_path"], _get_published_snapshot_path()],
+        _get_global_funding_chart_data,
+        st.session_state["ocha_hpc_global_funding_df"],
+    )
+
+
+def _load_ocha_hpc_global_kpis_dataset():
+    # Published even when the OCHA HPC step did not write them, the publish step computing them from the PIN and funding
+    global_kpis = _load_cached_dataset(
+        "ocha_hpc_global_kpis",
+        [st.session_state["global_kpis_file_path"], _get_published_snapshot_path()],
+        _read_published_table_or_csv,
+        "ocha_hpc_global_kpis",
+        st.session_state["global_kpis_file_path"],
+    )
+    if len(global_kpis):
+        year_kpis = global_kpis[global_kpis["year"] == st.session_state["selected-year"]]
+    else:
+        # Neither published nor computed by the OCHA HPC processing step yet, the tiles show '-'
+        year_kpis = global_kpis
+    st.session_state["global_kpis"] = year_kpis.iloc[0].to_dict() if len(year_kpis) else {}
+
+
+def _load_ocha_hpc_country_funding_dataset():
+    if os.path.exists(st.session_state["ocha_hpc_country_funding_file_path"]):
+        st.session_state["ocha_hpc_country_funding_df"] = _load_cached_dataset(
+            "ocha_hpc_country_funding",
+            [st.session_state["ocha_hpc_country_funding_file_path"], _get_published_snapshot_path()],
+            _read_published_table_or_csv,
+            "ocha_hpc_country_funding",
+            st.session_state["ocha_hpc_country_funding_file_path"],
+        )
+    else:
+        st.session_state["ocha_hpc_country_funding_df"] = pd.DataFrame()
+    st.session_state["ocha_hpc_country_funding_charts_data"] = _load_cached_dataset(
+        "ocha_hpc_country_funding_charts_data",
+        [st.session_state["ocha_hpc_country_funding_file_path"], _get_published_snapshot_path()],
+        _get_country_funding_charts_data,
+        st.session_state["ocha_hpc_country_funding_df"],
+    )
+
+
+def _load_ipc_dataset():
+    st.session_state["ipc_df"] = _load_preprocess_ipc_data()
+
+
+def _load_idmc_dataset():
+    st.session_state["idmc_df"] = _load_idmc_data()
+
+
+def _load_protection_indicators_dataset():
+    st.session_state["acaps_protection_indicators_child_related_tags"] = _load_json_file(
+        "acaps_protection_indicators_tags",
+        os.path.join(
+            st.session_state["protection_data_path"],
+            "..",
+            "acaps_protection_indicators_tags.json",
+        ),
+    )
+    _load_protection_indicators_data(st.session_state["selected_country"])
+
+
+def _load_legal_framework_dataset():
+    st.session_state["legal_framework_indicators"] = _load_json_file(
+        "legal_framework_indicators",
+        os.path.join(
+            st.session_state["legal_framework_summaries_data_path"],
+            "..",
+            "grouped_legal_framework_indicators.json",
+        ),
+    )
+
+
+datasets_loaders: Dict[str, Callable[[], None]] = {
+    "inform_severity": _load_inform_severity_dataset,
+    "ocha_hpc_pin": _load_ocha_hpc_pin_dataset,
+    "ocha_hpc_global_funding": _load_ocha_hpc_global_funding_dataset,
+    "ocha_hpc_global_kpis": _load_ocha_hpc_global_kpis_dataset,
+    "ocha_hpc_country_funding": _load_ocha_hpc_country_funding_dataset,
+    "acled": _load_acled_data,
+    "ipc": _load_ipc_dataset,
+    "idmc": _load_idmc_dataset,
+    "protection_indicators": _load_protection_indicators_dataset,
+    "legal_framework": _load_legal_framework_dataset,
+}
+
+# Datasets each tab reads from the session state, the tab display functions are given as comments
+tabs_datasets: Dict[str, List[str]] = {
+    # main_page
+    "Global Overview": ["inform_severity", "ocha_hpc_pin", "ocha_hpc_global_funding", "ocha_hpc_global_kpis"],
+    # _display_all_data
+    "Country Profile": [
+        "inform_severity",
+        "ocha_hpc_pin",
+        "ocha_hpc_country_funding",
+        "acled",
+        "ipc",
+        "idmc",
+        "protection_indicators",
+        "legal_framework",
+    ],
+    # country_wise_legal_framework
+    "Legal Framework": ["legal_framework"],
+    # _display_protection_data
+    "Protection Concerns": ["protection_indicators"],
+    # _display_crisis_wise_analysis
+    "Breakdown by Crisis": ["inform_severity"],
+    # _show_methodological_details
+    "Methodology": [],
+}
+
+
+def _load_tab_datasets(tab_name: str):
+    """
+    Loads the datasets needed by a tab into the session state, right before it is displayed.
+
+    Parameters:
+    tab_name (str): Name of the selected tab, a key of `tabs_datasets`.
+
+    Operation:
+    1. Looks up the datasets of the tab in `tabs_datasets`.
+    2. Calls the loader of each of them, the parsed data coming from the shared dataset cache
+       so that going back to a tab does not parse its files again.
+    """
+    for dataset_name in tabs_datasets[tab_name]:
+        datasets_loaders[dataset_name]()
@@ -1,27 +1,41 @@
+import json
 import os
-from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 import streamlit as st
 
+from frontend.src.utils.data_cache import _load_cached_dataset, _load_country_cached_dataset
+from frontend.src.utils.published_data import (
+    _get_published_country_profile_frame,
+    _get_published_country_profile_scalar,
+    _get_published_snapshot_path,
+    _read_published_table,
+)
+
+
+def _read_countries_list(countries_list_path: os.PathLike) -> List[str]:
+    return pd.read_csv(countries_list_path, header=None, names=["country"]).country.tolist()
+
 
 def _load_countries_list():
     """
     Function to load the list of countries from the report_countries.csv file
     """
-    return pd.read_csv(
-        os.path.join(st.session_state["base_data_folder"], "report_countries.csv"),
-        header=None,
-        names=["country"],
-    ).country.tolist()
+    countries_list_path = st.session_state["countries_list_path"]
+    return _load_cached_dataset("report_countries", [countries_list_path], _read_countries_list, countries_list_path)
 
 
-def _convert_to_datetime(date_str: str):
+def _read_json_file(file_path: os.PathLike):
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_json_file(name: str, file_path: os.PathLike):
     """
-    Function to convert a string date to a datetime object
+    Function to load a JSON file through the shared dataset cache
     """
-    return datetime.strptime(date_str, "%d %b %Y") if date_str != "-" else "-"
+    return _load_cached_dataset(name, [file_path], _read_json_file, file_path)
 
 
 def _flatten_list_of_lists(list_of_lists: List[List[str]]) -> List[str]:
@@ -38,57 +52,82 @@ def _add_commas(number: int):
     return "{:,}".format(number)
 
 
-def _load_protection_indicators_data(selected_country: str):
-    """
-    Function to load the protection data
-    """
-
-    if f"protection_df_{selected_country}" not in st.session_state:
-        df_path = os.path.join(
-            st.session_state["protection_data_path"],
-            f"{selected_country}.csv",
-        )
-        if os.path.exists(df_path):
-            st.session_state[f"protection_df_{selected_country}"] = pd.read_csv(df_path)
-
-            st.session_state[f"protection_df_{selected_country}"]["Source Date"] = pd.to_datetime(
-                st.session_state[f"protection_df_{selected_country}"]["Source Date"],
-                format="mixed",
-            )
-
-            st.session_state[f"possible_breakdowns_{selected_country}"] = [
-                b
-                for b in st.session_state[f"protection_df_{selected_country}"]["Breakdown Column"].unique()
-                if b != "1 - General Summary"
-            ]
-
-            st.session_state[f"protection_df_max_date_{selected_country}"] = (
-                pd.to_datetime(
-                    st.session_state[f"protection_df_{selected_country}"]["Source Date"],
-                    format="mixed",
-                )
-                .max()
-                .strftime("%m-%Y")
-            )
-        else:
-            st.session_state[f"protection_df_{selected_country}"] = pd.DataFrame(
-                columns=[
-                    "Breakdown Column",
-                    "Value",
-                    "Generated Text",
-                    "Source Original Text",
-                    "Source Name",
-                    "Source Link",
-                    "Source Date",
-                ]
-            )
-            st.session_state[f"possible_breakdowns_{selected_country}"] = []
-            st.session_state[f"protection_df_max_date_{selected_country}"] = "-"
+protection_indicators_columns = [
+    "Breakdown Column",
+    "Value",
+    "Generated Text",
+    "Source Original Text",
+    "Source Name",
+    "Source Link",
+    "Source Date",
+]
+
+
+def _read_protection_indicators_df(selected_country: str, df_path: os.PathLike) -> Optional[pd.DataFrame]:
+    """
+    Function to read the protection data of a country from its published profile bundle, the published table
+    or its CSV file. Only the rows of the country are read from the published table.
+    Returns None if there is no data for the country.
+    """
+    country_profile_df = _get_published_country_profile_frame(selected_country, "protection")
+    if country_profile_df is not None and len(country_profile_df) > 0:
+        return country_profile_df
+
+    published_df = _read_published_table("acaps_protection_indicators", filters=[("Country", "==", selected_country)])
+    if published_df is not None and len(published_df) > 0:
+        return published_df.drop(columns="Country")
+
+    if os.path.exists(df_path):
+        df = pd.read_csv(df_path)
+        df["Source Date"] = pd.to_datetime(df["Source Date"], format="mixed")
+        return df
+
+    return None
+
+
+def _read_protection_indicators_data(selected_country: str, df_path: os.PathLike) -> Dict[str, Any]:
+    """
+    Function to build the protection data of a country: its summaries with parsed 'Source Date' values,
+    the breakdowns it can be displayed by and the month of its most recent source.
+    """
+    protection_df = _read_protection_indicators_df(selected_country, df_path)
+    if protection_df is None:
+        return {
+            "protection_df": pd.DataFrame(columns=protection_indicators_columns),
+            "possible_breakdowns": [],
+            "max_date": "-",
+        }
+
+    max_date = _get_published_country_profile_scalar(selected_country, "protection_last_update")
+    if max_date is None:
+        max_date = protection_df["Source Date"].max()
+        max_date = "-" if pd.isna(max_date) else max_date.strftime("%m-%Y")
+    return {
+        "protection_df": protection_df,
+        "possible_breakdowns": [b for b in protection_df["Breakdown Column"].unique() if b != "1 - General Summary"],
+        "max_date": max_date,
+    }
+
+
+def _load_protection_indicators_data(selected_country: str) -> Dict[str, Any]:
+    """
+    Function to load the protection data of a country through the shared per-country datasets cache.
+    The data is not kept in the session state: looking it up again is cheap, and evicted countries are read again.
+    """
+    df_path = os.path.join(st.session_state["protection_data_path"], f"{selected_country}.csv")
+    return _load_country_cached_dataset(
+        "protection_indicators",
+        selected_country,
+        [df_path, _get_published_snapshot_path()],
+        _read_protection_indicators_data,
+        selected_country,
+        df_path,
+    )
 
 
 def _country_selection_filter(filter_name: str, disabled: Optional[bool]):
     """
-    Function to display the country selection filter, save the selected country and load the protection data.
+    Function to display the country selection filter and return the selected country.
     """
     selected_country = st.selectbox(
         "Country",
@@ -98,7 +137,6 @@ def _country_selection_filter(filter_name: str, disabled: Optional[bool]):
         disabled=disabled,
     )
 
-    _load_protection_indicators_data(selected_country)
     return selected_country
 
 
@@ -4,7 +4,9 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
 
+from frontend.src.utils.figure_cache import _show_cached_figure
 from frontend.src.utils.utils_functions import _add_source
 
 
@@ -38,7 +40,13 @@ def _display_stackbar(displayed_values: dict):
     Returns:
     None
     """
+    _show_cached_figure("stackbar", _build_stackbar_figure, displayed_values)
 
+
+def _build_stackbar_figure(displayed_values: dict) -> Figure:
+    """
+    Builds the horizontal stacked bar chart figure displayed by `_display_stackbar`.
+    """
     n_segments = len(displayed_values["original_numbers"])
 
     tick_values = [displayed_values["original_numbers"][i]["value"] for i in range(n_segments)]
@@ -127,8 +135,14 @@ def _display_stackbar(displayed_values: dict):
             # fontweight='bold',
         )
 
-    # Set title
-    st.pyplot(fig)
+    return fig
+
+
+def _get_plotted_columns(df: pd.DataFrame, *columns: str) -> pd.DataFrame:
+    """
+    Returns the columns a bar plot reads, so that the other ones do not change the figure cache key.
+    """
+    return df[list(dict.fromkeys(columns))]
 
 
 def create_continuous_cmap(colors, name="custom_cmap"):
@@ -166,7 +180,33 @@ def _create_vertical_barplot(
     Returns:
     None
     """
+    _show_cached_figure(
+        "vertical_barplot",
+        _build_vertical_barplot_figure,
+        _get_plotted_columns(df, labels_col, numbers_col, text_col),
+        labels_col,
+        numbers_col,
+        text_col,
+        title,
+        x_ax_title,
+        y_ax_title,
+        color,
+    )
+
 
+def _build_vertical_barplot_figure(
+    df: pd.DataFrame,
+    labels_col: str,
+    numbers_col: str,
+    text_col: str,
+    title: str,
+    x_ax_title: str,
+    y_ax_title: str,
+    color: str,
+) -> Figure:
+    """
+    Builds the vertical bar plot figure displayed by `_create_vertical_barplot`.
+    """
     scores = df[numbers_col].values
     labels = df[labels_col].values
     texts = df[text_col].values
@@ -200,7 +240,7 @@ def _create_vertical_barplot(
 
     _add_plot_legend(ax, title=title, x_ax_title=x_ax_title, y_ax_title=y_ax_title)
 
-    st.pyplot(fig)
+    return fig
 
 
 def _customize_axes_horizontal_plot(ax, labels, max_val):
@@ -330,11 +370,56 @@ def _create_horizontal_continous_scale_barplot(
     Returns:
     None
     """
+    _show_cached_figure(
+        "horizontal_continous_scale_barplot",
+        _build_horizontal_continous_scale_barplot_figure,
+        _get_plotted_columns(df, labels_col, numbers_col, text_col),
+        labels_col,
+        numbers_col,
+        text_col,
+        max_val,
+        color1,
+        color2,
+        title,
+        x_ax_title,
+        y_ax_title,
+        figsize,
+        savefig_kwargs={"pad_inches": 0.1},
+    )
+
+    max_val = int(max_val)
+    if max_val == 5:
+        min_val = "0 (less severe)"
+        max_val = "5 (more severe)"
+    elif max_val == 100:
+        min_val = "0%"
+        max_val = "100%"
+    else:
+        min_val = "0"
+        max_val = _get_abbreviated_number(max_val)
+
+    _add_source(f"Scale: {min_val} to {max_val}", 0)
+
+
+def _build_horizontal_continous_scale_barplot_figure(
+    df: pd.DataFrame,
+    labels_col: str,
+    numbers_col: str,
+    text_col: str,
+    max_val: int,
+    color1: str,
+    color2: str,
+    title: str,
+    x_ax_title: str,
+    y_ax_title: str,
+    figsize: Tuple[int],
+) -> Figure:
+    """
+    Builds the horizontal continuous scale bar plot figure displayed by `_create_horizontal_continous_scale_barplot`.
+    """
     custom_cmap = create_continuous_cmap([color1, color2])
 
     norm = plt.Normalize(0, max_val)
-    sm = plt.cm.ScalarMappable(cmap=custom_cmap, norm=norm)
-    sm.set_array([])
 
     scores = df[numbers_col].values
     labels = df[labels_col].values
@@ -350,27 +435,9 @@ def _create_horizontal_continous_scale_barplot(
 
     _customize_axes_horizontal_plot(ax, labels, max_val)
 
-    # # Add colorbar
-    # cbar = plt.colorbar(sm, ax=ax, orientation="horizontal", fraction=0.1, pad=0.04)
-    # # cbar.set_label("Value", fontsize=10)
-    # cbar.outline.set_edgecolor("white")
-
     # Add the scores as text
     _add_scores_text_horizontal_plot(ax, scores, shown_score_values)
 
     _add_plot_legend(ax, title, x_ax_title, y_ax_title)
 
-    st.pyplot(fig, bbox_inches="tight", pad_inches=0.1)
-
-    max_val = int(max_val)
-    if max_val == 5:
-        min_val = "0 (less severe)"
-        max_val = "5 (more severe)"
-    elif max_val == 100:
-        min_val = "0%"
-        max_val = "100%"
-    else:
-        min_val = "0"
-        max_val = _get_abbreviated_number(max_val)
-
-    _add_source(f"Scale: {min_val} to {max_val}", 0)
+    return fig
@@ -1,10 +1,18 @@
-from typing import Dict, List, Literal
+import os
+from typing import Any, Dict, List, Literal
 
 import pandas as pd
 import pydeck as pdk
 import streamlit as st
 
-from frontend.src.utils.load_geodata import _load_polygons_adm1
+from frontend.src.utils.data_cache import _get_data_version, _load_cached_dataset
+from frontend.src.utils.load_geodata import (
+    _get_adm0_polygons_file_path,
+    _load_polygons_adm0,
+    _load_polygons_adm1,
+    _select_lod_geojson,
+)
+from frontend.src.utils.published_data import _get_published_snapshot_path
 
 lat_range = 180
 lon_range = 360
@@ -27,6 +35,83 @@ severity_mapping_tag_name_to_color_main_countries = {
 }
 
 
+def _build_severity_world_polygons(inform_severity_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Colours the world polygons levels by INFORM severity and adds the hover legend of each country.
+
+    Parameters:
+    inform_severity_df (pd.DataFrame): The 'INFORM Severity - country' table.
+
+    Returns:
+    List[Dict[str, Any]]: The GeoJSON levels of the countries, with their fill color and legend.
+
+    Operation:
+    1. Maps each country to its severity, drivers, trend and last update.
+    2. Loads the GeoJSON levels of the countries with `_load_polygons_adm0`.
+    3. Sets the fill color and legend of each feature of every level, countries without INFORM values being white.
+    """
+    inform_severity_values = {
+        country: {
+            "Situation Severity": severity,
+            "Drivers": drivers,
+            "Trend (last 3 months)": trend,
+            "Last updated": last_updated,
+        }
+        for country, severity, drivers, trend, last_updated in zip(
+            inform_severity_df["COUNTRY"],
+            inform_severity_df["INFORM Severity category name"],
+            inform_severity_df["DRIVERS"],
+            inform_severity_df["Trend (last 3 months)"],
+            inform_severity_df["Last updated"],
+        )
+    }
+
+    geojson_country_polygons_levels = _load_polygons_adm0(_get_data_version())
+
+    for level in geojson_country_polygons_levels:
+        for feature in level["geojson"]["features"]:
+            country_name = feature["properties"]["name"]
+            if country_name in inform_severity_values:
+                one_country_values = inform_severity_values[country_name]
+                inform_index_properties = one_country_values["Situation Severity"]
+                if inform_index_properties != "x":
+                    feature["properties"]["fill_color"] = severity_mapping_tag_name_to_color_main_countries[
+                        inform_index_properties
+                    ]
+                else:
+                    feature["properties"]["fill_color"] = default_filling_color
+                legend = f" -- {country_name} --"
+                for key, value in one_country_values.items():
+                    final_value = value if value != "x" else "UNKNOWN"
+                    legend += f"\n{key}: {final_value}"
+
+            else:
+                feature["properties"]["fill_color"] = [255, 255, 255]
+                legend = f"Country: {country_name}"
+            feature["legend"] = legend
+
+    return geojson_country_polygons_levels
+
+
+def _load_severity_world_polygons() -> List[Dict[str, Any]]:
+    """
+    Loads the world polygons levels coloured by INFORM severity through the shared dataset cache.
+    They are built once per INFORM data and polygons version and shared by all the sessions, read-only.
+    """
+    return _load_cached_dataset(
+        "severity_world_polygons",
+        [
+            st.session_state["inform_severity_data_path"],
+            st.session_state["countries_list_path"],
+            _get_published_snapshot_path(),
+            _get_adm0_polygons_file_path(st.session_state["geolocation_processed_data_path"]),
+            os.path.join(st.session_state["original_polygons_data_path"], "adm0_polygons.gpkg"),
+        ],
+        _build_severity_world_polygons,
+        st.session_state["inform_severity_df"],
+    )
+
+
 def _get_mean(data: List[float]):
     return sum(data) / len(data)
 
@@ -51,6 +136,11 @@ def _display_legend(mapping_dict: Dict[str, List[int]]):
     st.markdown(legend_html, unsafe_allow_html=True)
 
 
+def _get_initial_zoom(min_zoom: float, max_zoom: float) -> float:
+    # The maps open at zoom 1, kept within the zoom bounds of the view
+    return min(max(1, min_zoom), max_zoom)
+
+
 def adjust_view_state(view_state, min_lat, max_lat, min_lon, max_lon):
     # Ensure the latitude is within bounds
     if view_state.latitude < min_lat:
@@ -69,7 +159,7 @@ def adjust_view_state(view_state, min_lat, max_lat, min_lon, max_lon):
 
 
 def _create_polygons_map_placeholder_pdk(
-    geojson_country_polygons,
+    geojson_country_polygons_levels: List[Dict],
     latitude_range=[-90, 90],
     longitude_range=[-180, 180],
     display_type=Literal["Country", "Region"],
@@ -78,7 +168,7 @@ def _create_polygons_map_placeholder_pdk(
     Creates and displays a PyDeck map with GeoJSON polygons.
 
     Parameters:
-    geojson_country_polygons (dict): GeoJSON data for the country polygons.
+    geojson_country_polygons_levels (List[Dict]): GeoJSON levels of detail for the country polygons, the finest first.
     latitude_range (list, optional): Latitude range for the map. Defaults to [-90, 90].
     longitude_range (list, optional): Longitude range for the map. Defaults to [-180, 180].
     display_type (Literal["Country", "Region"]): Type of display, either 'Country' or 'Region'.
@@ -87,16 +177,32 @@ def _create_polygons_map_placeholder_pdk(
     None
 
     Operation:
-    1. Creates a PyDeck `GeoJsonLayer` with the provided GeoJSON data.
-    2. Sets the opacity, stroke, fill color, line color, and other properties for the layer.
-    3. Calculates the center latitude and longitude for the initial view state.
-    4. Determines the zoom factor based on the display type.
-    5. Configures the PyDeck `ViewState` for the viewport with appropriate zoom levels.
-    6. Sets the height of the displayed map based on the display type.
-    7. Renders the map using Streamlit's `st.pydeck_chart`.
-    8. Displays a legend for the map.
+    1. Calculates the center latitude and longitude for the initial view state.
+    2. Determines the zoom factor based on the display type.
+    3. Selects the coarsest GeoJSON level of detail that stays sharp at the initial zoom.
+    4. Creates a PyDeck `GeoJsonLayer` with the selected GeoJSON data.
+    5. Sets the opacity, stroke, fill color, line color, and other properties for the layer.
+    6. Configures the PyDeck `ViewState` for the viewport with appropriate zoom levels.
+    7. Sets the height of the displayed map based on the display type.
+    8. Renders the map using Streamlit's `st.pydeck_chart`.
+    9. Displays a legend for the map.
     """
     with st.spinner("Loading the map..."):
+        shown_lat = _get_mean(latitude_range)
+        shown_lon = _get_mean(longitude_range)
+
+        zoom_factor = 0.35 if display_type == "Country" else 0.5
+
+        # select zoom value only on the selected area
+        zoom = zoom_factor * min(
+            lat_range / (latitude_range[1] - latitude_range[0]),
+            lon_range / (longitude_range[1] - longitude_range[0]),
+        )
+
+        geojson_country_polygons = _select_lod_geojson(
+            geojson_country_polygons_levels, _get_initial_zoom(zoom / 2, zoom * 10)
+        )
+
         # Create a PyDeck layer
         layer = pdk.Layer(
             "GeoJsonLayer",
@@ -119,17 +225,6 @@ def _create_polygons_map_placeholder_pdk(
             # show name of the country on hover
         )
 
-        shown_lat = _get_mean(latitude_range)
-        shown_lon = _get_mean(longitude_range)
-
-        zoom_factor = 0.35 if display_type == "Country" else 0.5
-
-        # select zoom value only on the selected area
-        zoom = zoom_factor * min(
-            lat_range / (latitude_range[1] - latitude_range[0]),
-            lon_range / (longitude_range[1] - longitude_range[0]),
-        )
-
         # Set the viewport location
         view_state = pdk.ViewState(
             latitude=shown_lat,
@@ -159,7 +254,7 @@ def _create_polygons_map_placeholder_pdk(
 
 
 def _create_points_map_placeholder_pdk(
-    geojson_country_polygons,
+    geojson_country_polygons: Dict,
     displayed_df: pd.DataFrame,
     latitude_range=[-90, 90],
     longitude_range=[-180, 180],
@@ -169,7 +264,7 @@ def _create_points_map_placeholder_pdk(
     Creates and displays a PyDeck map with GeoJSON polygons and scatter plot points.
 
     Parameters:
-    geojson_country_polygons (dict): GeoJSON data for the country polygons.
+    geojson_country_polygons (Dict): GeoJSON data for the region polygons of the country.
     displayed_df (pd.DataFrame): DataFrame containing the points to be displayed.
     latitude_range (list, optional): Latitude range for the map. Defaults to [-90, 90].
     longitude_range (list, optional): Longitude range for the map. Defaults to [-180, 180].
@@ -179,16 +274,34 @@ def _create_points_map_placeholder_pdk(
     None
 
     Operation:
-    1. Creates a PyDeck `GeoJsonLayer` with the provided GeoJSON data for country borders.
-    2. Sets properties for the layer such as opacity, stroke, fill color, and border width.
-    3. Creates a PyDeck `ScatterplotLayer` with the data points from the DataFrame.
-    4. Calculates the center latitude and longitude for the initial view state.
-    5. Determines the zoom factor based on the display type.
+    1. Calculates the center latitude and longitude for the initial view state.
+    2. Determines the zoom factor based on the display type.
+    3. Creates a PyDeck `GeoJsonLayer` with the GeoJSON data for country borders.
+    4. Sets properties for the layer such as opacity, stroke, fill color, and border width.
+    5. Creates a PyDeck `ScatterplotLayer` with the data points from the DataFrame.
     6. Configures the PyDeck `ViewState` for the viewport with appropriate zoom levels.
     7. Sets the height of the displayed map based on the display type.
     8. Renders the map using Streamlit's `st.pydeck_chart`.
     """
     with st.spinner("Loading the map..."):
+        all_lat = latitude_range[1] - latitude_range[0]
+        all_lon = longitude_range[1] - longitude_range[0]
+
+        shown_lat = _get_mean(latitude_range)
+        shown_lon = _get_mean(longitude_range)
+
+        zoom_factor = 0.35 if display_type == "Country" else 0.5
+
+        # select zoom value only on the selected area
+        zoom = (
+            zoom_factor
+            * min(
+                lat_range / all_lat,
+                lon_range / all_lon,
+            )
+            * 0.5
+        )
+
         # Create a PyDeck layer
         layer0 = pdk.Layer(
             "GeoJsonLayer",
@@ -211,8 +324,6 @@ def _create_points_map_placeholder_pdk(
             # show name of the country on hover
         )
 
-        all_lat = latitude_range[1] - latitude_range[0]
-        all_lon = longitude_range[1] - longitude_range[0]
         radius = int(max(all_lat, all_lon) * 500)
 
         layer1 = pdk.Layer(
@@ -223,21 +334,6 @@ def _create_points_map_placeholder_pdk(
             get_radius=radius,
         )
 
-        shown_lat = _get_mean(latitude_range)
-        shown_lon = _get_mean(longitude_range)
-
-        zoom_factor = 0.35 if display_type == "Country" else 0.5
-
-        # select zoom value only on the selected area
-        zoom = (
-            zoom_factor
-            * min(
-                lat_range / all_lat,
-                lon_range / all_lon,
-            )
-            * 0.5
-        )
-
         # Set the viewport location
         view_state = pdk.ViewState(
             latitude=shown_lat,
@@ -269,32 +365,32 @@ def _create_points_map_placeholder_pdk(
 
 
 @st.fragment
-def _display_map_img(displayed_df: pd.DataFrame, country_name: str):
+def _display_map_img(displayed_df: pd.DataFrame, country_name: str, admin1_events_summary_df: pd.DataFrame):
     """
     Displays a map image with aggregated data for administrative regions within a country.
 
     Args:
-    - displayed_df (pd.DataFrame): DataFrame containing data to be displayed on the map,
-      typically aggregated by administrative region.
+    - displayed_df (pd.DataFrame): DataFrame containing the events displayed as points on the map.
     - country_name (str): Name of the country for which the map is being displayed.
+    - admin1_events_summary_df (pd.DataFrame): Events count ('events_count') and total fatalities ('fatalities')
+      per administrative region ('admin1'), already aggregated.
 
     Operation:
-    1. Aggregates event counts and total fatalities by administrative region (`admin1`) from `displayed_df`.
-    2. Loads geojson polygons and extreme points for the specified `country_name` using `_load_polygons_adm1`.
-    3. Iterates through each feature in `geojson_country_polygons`, updating properties with aggregated data.
+    1. Maps each administrative region (`admin1`) to its event count and total fatalities.
+    2. Loads the geojson polygons and extreme points for the specified `country_name` using `_load_polygons_adm1`.
+    3. Iterates through each feature in the geojson data, updating properties with aggregated data.
     4. Sets default colors and properties for each feature based on aggregated data.
     5. Calls `_create_points_map_placeholder_pdk` to display a map using the PolyDeck (PDK) library,
        showing administrative regions and their aggregated data.
     """
-    count_df = displayed_df.copy()
-    count_df = count_df.groupby("admin1", as_index=False).agg({"event_date": "count", "fatalities": "sum"})
-    # st.dataframe(displayed_df)
-    admin_level_data = {}
-    for _, row in count_df.iterrows():
-        admin_level_data[row["admin1"]] = {
-            "Events Count": row["event_date"],
-            "Total Fatalities": row["fatalities"],
-        }
+    admin_level_data = {
+        admin1: {"Events Count": int(events_count), "Total Fatalities": int(fatalities)}
+        for admin1, events_count, fatalities in zip(
+            admin1_events_summary_df["admin1"],
+            admin1_events_summary_df["events_count"],
+            admin1_events_summary_df["fatalities"],
+        )
+    }
 
     # if not os.path.exists(country_map_path):
     geojson_country_polygons, extreme_points = _load_polygons_adm1(country_name, [country_name])
@@ -0,0 +1,470 @@
+"""
+Renders static HTML snapshots of the Global Overview and of the Country Profile of every country, running `app.py`
+headlessly with the streamlit AppTest, so that they can be served straight from the shared volume:
+
+    python -m static_snapshots.render_static_snapshots --data_folder /data --output_folder /data/static_snapshots
+
+The pages of each published data snapshot are rendered once, the countries being split across `--processes` workers.
+The rendered snapshot is written into its own folder, then the `current` link is switched to it, so that a static
+server pointed to `<output_folder>/current` never serves a partial snapshot.
+With `--watch`, the published data snapshot is checked again every given number of seconds.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+import pandas as pd
+
+frontend_src_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+current_link_name = "current"
+snapshot_infos_file_name = "snapshot.json"
+snapshot_time_format = "%Y%m%d-%H%M%S"
+
+# Older rendered snapshots are kept so that pages being served while the link is switched are not broken
+n_kept_snapshots = 2
+
+plotly_js_url = "https://cdn.plot.ly/plotly-2.29.1.min.js"
+marked_js_url = "https://cdn.jsdelivr.net/npm/marked@12.0.2/marked.min.js"
+
+# Assets and maps referenced by a page, relative to the snapshot folder
+page_asset_pattern = re.compile(r"(?:\.\./)*((?:assets|maps)/[0-9a-f]+\.\w+)")
+
+# Images widths of `st.image` with a special behaviour, see `WidthBehavior` in streamlit
+image_column_width = -2
+
+page_template = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="{plotly_js_url}"></script>
+<script src="{marked_js_url}"></script>
+<style>
+    body {{ font-family: "Source Sans Pro", sans-serif; max-width: 1400px; margin: 0 auto; padding: 1rem 2rem; }}
+    .stack {{ display: flex; flex-direction: column; gap: 1rem; }}
+    .row {{ display: flex; flex-direction: row; flex-wrap: wrap; gap: 1rem; }}
+    .column {{ min-width: 0; }}
+    .bordered {{ border: 1px solid #e6e6e6; border-radius: 0.5rem; padding: 1rem; }}
+    .snapshot-header {{ color: #738462; font-size: 0.9rem; border-bottom: 1px solid #cecece; padding-bottom: 0.5rem; }}
+    iframe {{ width: 100%; height: 500px; border: none; }}
+</style>
+</head>
+<body>
+<div class="snapshot-header">{header}</div>
+{body}
+<script>
+    for (const element of document.querySelectorAll(".markdown")) {{
+        element.innerHTML = marked.parse(element.dataset.markdown);
+    }}
+</script>
+</body>
+</html>
+"""
+
+
+def _get_country_file_name(country: str) -> str:
+    return os.path.join("country_profiles", f"{country}.html")
+
+
+def _to_script_json(value: str) -> str:
+    """
+    Returns a JSON string that can be written inside a <script> tag.
+    """
+    return value.replace("</", "<\\/")
+
+
+class _PageRenderer:
+    """
+    Converts the element tree of one AppTest run into a static HTML page.
+
+    Images are written once into the shared 'assets' folder of the snapshot, named by their content hash,
+    and deck.gl maps into their own HTML file of the 'maps' folder, shown in an iframe.
+    """
+
+    def __init__(self, snapshot_path: os.PathLike, page_file_name: str, media_storage: Any):
+        self.snapshot_path = snapshot_path
+        self.page_file_name = page_file_name
+        self.media_storage = media_storage
+        # Relative path from the page to the snapshot folder
+        self.root_prefix = "../" * page_file_name.count(os.sep)
+        self.n_charts = 0
+
+    def _write_asset(self, folder_name: str, content: bytes, extension: str) -> str:
+        file_name = f"{hashlib.blake2b(content, digest_size=16).hexdigest()}.{extension}"
+        file_path = os.path.join(self.snapshot_path, folder_name, file_name)
+        if not os.path.exists(file_path):
+            with open(file_path, "wb") as f:
+                f.write(content)
+        return f"{self.root_prefix}{folder_name}/{file_name}"
+
+    def _render_markdown(self, proto) -> str:
+        body = proto.body if proto.allow_html else html.escape(proto.body)
+        return f'<div class="markdown" data-markdown="{html.escape(body, quote=True)}"></div>'
+
+    def _render_images(self, proto) -> str:
+        images_html = []
+        for image in proto.imgs:
+            media_file = self.media_storage.get_file(os.path.basename(image.url))
+            src = self._write_asset("assets", media_file.content, media_file.mimetype.split("/")[-1])
+            if proto.width > 0:
+                style = f"width: {proto.width}px;"
+            elif proto.width == image_column_width:
+                style = "width: 100%;"
+            else:
+                style = "max-width: 100%;"
+            images_html.append(f'<img src="{src}" style="{style}" alt="{html.escape(image.caption)}">')
+        return "".join(images_html)
+
+    def _render_plotly_chart(self, proto) -> str:
+        self.n_charts += 1
+        chart_id = f"plotly-chart-{self.n_charts}"
+        config = proto.config or "{}"
+        return (
+            f'<div id="{chart_id}"></div><script>(() => {{ const spec = {_to_script_json(proto.spec)}; '
+            f'Plotly.newPlot("{chart_id}", spec.data, spec.layout, '
+            f"Object.assign({{responsive: true}}, {_to_script_json(config)})); }})();</script>"
+        )
+
+    def _render_deck_gl_chart(self, proto) -> str:
+        import pydeck
+
+        map_html = pydeck.io.html.render_json_to_html(json_input=proto.json, tooltip=proto.tooltip or True)
+        src = self._write_asset("maps", map_html.encode(), "html")
+        return f'<iframe src="{src}" loading="lazy"></iframe>'
+
+    def render_node(self, node: Any) -> str:
+        """
+        Returns the HTML of a node of the element tree and of its children, widgets being left out.
+        """
+        node_type = type(node).__name__
+        if node_type in ("Block", "Column", "SpecialBlock", "ElementTree"):
+            children_html = "".join(self.render_node(child) for child in node.children.values())
+            if node_type == "Column":
+                return f'<div class="column" style="flex: {node.proto.weight};">{children_html}</div>'
+            if node_type == "Block" and node.proto.HasField("flex_container"):
+                flex_container = node.proto.flex_container
+                classes = "row" if flex_container.direction == flex_container.Direction.HORIZONTAL else "stack"
+                if flex_container.border:
+                    classes += " bordered"
+                return f'<div class="{classes}">{children_html}</div>'
+            return f'<div class="stack">{children_html}</div>'
+
+        element_type = getattr(node, "type", None)
+        if element_type == "markdown":
+            return self._render_markdown(node.proto)
+        if element_type == "imgs":
+            return self._render_images(node.proto)
+        if element_type == "plotly_chart":
+            return self._render_plotly_chart(node.proto)
+        if element_type == "deck_gl_json_chart":
+            return self._render_deck_gl_chart(node.proto)
+        return ""
+
+    def write_page(self, main_block: Any, title: str, header: str):
+        page_html = page_template.format(
+            title=html.escape(title),
+            header=header,
+            body=self.render_node(main_block),
+            plotly_js_url=plotly_js_url,
+            marked_js_url=marked_js_url,
+        )
+        page_path = os.path.join(self.snapshot_path, self.page_file_name)
+        with open(page_path, "w", encoding="utf-8") as f:
+            f.write(page_html)
+
+
+def _patch_media_storage(media_storages: List[Any]):
+    """
+    Keeps the media storage of each AppTest run in `media_storages`: the AppTest creates a new one per run and drops it
+    once the run is over, while the images of the element tree are only stored there.
+    """
+    from streamlit.testing.v1 import app_test
+
+    class _KeptMediaFileStorage(app_test.MemoryMediaFileStorage):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            media_storages.append(self)
+
+    app_test.MemoryMediaFileStorage = _KeptMediaFileStorage
+
+
+def _render_pages(
+    data_folder: os.PathLike, snapshot_path: os.PathLike, countries: List[str], render_global_overview: bool, header: str
+) -> Dict[str, List[str]]:
+    """
+    Renders the pages of a worker with a single app instance, the caches being reused from one country to the next.
+
+    Parameters:
+    data_folder (os.PathLike): Data folder read by the app.
+    snapshot_path (os.PathLike): Folder the pages are written to.
+    countries (List[str]): Countries whose Country Profile is rendered by the worker.
+    render_global_overview (bool): Whether the worker renders the Global Overview too.
+    header (str): HTML shown on top of every page.
+
+    Returns:
+    Dict[str, List[str]]: The exceptions raised by the app for each rendered page, pages raising one are not written.
+
+    Operation:
+    1. Points the app to the data folder and runs it with the consent already stored, like a returning user.
+    2. For each page, selects the tab and the country, runs the app and converts its main block to HTML.
+    """
+    os.environ["CPAOR_DATA_FOLDER"] = os.path.abspath(data_folder)
+    # The app reads its images with paths relative to the frontend folder
+    os.chdir(frontend_src_path)
+    media_storages: List[Any] = []
+    _patch_media_storage(media_storages)
+
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(os.path.join(frontend_src_path, "app.py"), default_timeout=600)
+    app_test.session_state["storage_init"] = {"cpaor_consent_confirm": "true"}
+    app_test.run()
+
+    pages = [("Country Profile", country, _get_country_file_name(country)) for country in countries]
+    if render_global_overview:
+        pages.insert(0, ("Global Overview", None, "global_overview.html"))
+
+    pages_exceptions = {}
+    for tab, country, page_file_name in pages:
+        app_test.radio[0].set_value(tab)
+        if country is not None:
+            app_test.selectbox(key="country-profile").set_value(country)
+        app_test.run()
+
+        exceptions = [exception.message for exception in app_test.exception]
+        pages_exceptions[page_file_name] = exceptions
+        if exceptions:
+            continue
+
+        title = tab if country is None else f"{country} Country Profile"
+        page_renderer = _PageRenderer(snapshot_path, page_file_name, media_storages[-1])
+        page_renderer.write_page(app_test.main, title, header)
+
+    return pages_exceptions
+
+
+def _write_index_page(snapshot_path: os.PathLike, pages: Dict[str, str], header: str):
+    """
+    Writes the index page linking the given pages, a {page file name: title} mapping.
+    """
+    links = [
+        f'<li><a href="{quote(page_file_name)}">{html.escape(title)}</a></li>' for page_file_name, title in pages.items()
+    ]
+    body = f"<ul>{''.join(links)}</ul>"
+    with open(os.path.join(snapshot_path, "index.html"), "w", encoding="utf-8") as f:
+        f.write(
+            page_template.format(
+                title="CPAoR", header=header, body=body, plotly_js_url=plotly_js_url, marked_js_url=marked_js_url
+            )
+        )
+
+
+def _copy_previous_pages(output_folder: os.PathLike, snapshot_path: os.PathLike, page_file_names: List[str]) -> List[str]:
+    """
+    Copies the given pages, with the assets and maps they reference, from the current rendered snapshot.
+
+    Returns:
+    List[str]: The pages copied, the ones missing from the current snapshot being left out.
+    """
+    current_snapshot_path = os.path.join(output_folder, current_link_name)
+    copied_pages = []
+    for page_file_name in page_file_names:
+        page_path = os.path.join(current_snapshot_path, page_file_name)
+        if not os.path.exists(page_path):
+            continue
+        with open(page_path, "r", encoding="utf-8") as f:
+            page_html = f.read()
+        for asset_file_name in set(page_asset_pattern.findall(page_html)):
+            asset_path = os.path.join(snapshot_path, asset_file_name)
+            if not os.path.exists(asset_path):
+                shutil.copyfile(os.path.join(current_snapshot_path, asset_file_name), asset_path)
+        shutil.copyfile(page_path, os.path.join(snapshot_path, page_file_name))
+        copied_pages.append(page_file_name)
+    return copied_pages
+
+
+def _get_published_snapshot_name(data_folder: os.PathLike) -> Optional[str]:
+    latest_snapshot_path = os.path.join(data_folder, "datasources", "published", "latest.json")
+    if not os.path.exists(latest_snapshot_path):
+        return None
+    with open(latest_snapshot_path, "r") as f:
+        return json.load(f)["snapshot"]
+
+
+def _get_current_snapshot_infos(output_folder: os.PathLike) -> Optional[Dict[str, Any]]:
+    snapshot_infos_path = os.path.join(output_folder, current_link_name, snapshot_infos_file_name)
+    if not os.path.exists(snapshot_infos_path):
+        return None
+    with open(snapshot_infos_path, "r") as f:
+        return json.load(f)
+
+
+def _switch_current_snapshot(output_folder: os.PathLike, snapshot_name: str):
+    """
+    Atomically points the `current` link to the given rendered snapshot and removes the oldest ones.
+    """
+    tmp_link_path = os.path.join(output_folder, f".{current_link_name}.tmp")
+    if os.path.lexists(tmp_link_path):
+        os.remove(tmp_link_path)
+    os.symlink(snapshot_name, tmp_link_path)
+    os.replace(tmp_link_path, os.path.join(output_folder, current_link_name))
+
+    snapshot_names = sorted(
+        name
+        for name in os.listdir(output_folder)
+        if os.path.isdir(os.path.join(output_folder, name))
+        and not os.path.islink(os.path.join(output_folder, name))
+        and not name.startswith(".")
+    )
+    for old_snapshot_name in snapshot_names[:-n_kept_snapshots]:
+        if old_snapshot_name != snapshot_name:
+            shutil.rmtree(os.path.join(output_folder, old_snapshot_name), ignore_errors=True)
+
+
+def _render_static_snapshots(
+    data_folder: os.PathLike, output_folder: os.PathLike, countries: List[str], n_processes: int, force: bool = False
+) -> Optional[str]:
+    """
+    Renders the static pages of the current data, unless they were already rendered for its published snapshot.
+
+    Parameters:
+    data_folder (os.PathLike): Data folder read by the app.
+    output_folder (os.PathLike): Folder of the rendered snapshots.
+    countries (List[str]): Countries whose Country Profile is rendered.
+    n_processes (int): Number of processes rendering the pages in parallel.
+    force (bool): Whether to render the pages even if the published snapshot did not change.
+
+    Returns:
+    Optional[str]: Name of the rendered snapshot, None if the current one is already up to date.
+
+    Operation:
+    1. Compares the published data snapshot with the one the current pages were rendered from.
+    2. Splits the countries across spawned worker processes, each rendering its pages with its own app instance.
+    3. Copies the pages that raised from the current snapshot, when it has them, so that a failing page keeps
+       its previous version.
+    4. Writes an index page linking the written pages and the description of the snapshot, then switches
+       the `current` link to it. When no page could be rendered, the current snapshot is kept.
+    """
+    published_snapshot_name = _get_published_snapshot_name(data_folder)
+    current_snapshot_infos = _get_current_snapshot_infos(output_folder)
+    if (
+        not force
+        and current_snapshot_infos is not None
+        and current_snapshot_infos["published_snapshot"] == published_snapshot_name
+    ):
+        print(f"Static snapshots are already rendered for the published snapshot {published_snapshot_name}")
+        return None
+
+    snapshot_name = datetime.now().strftime(snapshot_time_format)
+    snapshot_path = os.path.join(output_folder, snapshot_name)
+    for folder_name in ["assets", "maps", "country_profiles"]:
+        os.makedirs(os.path.join(snapshot_path, folder_name), exist_ok=True)
+    header = html.escape(
+        f"Static snapshot of the CPAoR dashboard, data snapshot {published_snapshot_name or 'unpublished'}, "
+        f"rendered on {datetime.now().strftime('%d %b %Y %H:%M')}"
+    )
+
+    n_processes = max(1, min(n_processes, len(countries)))
+    countries_chunks = [countries[i::n_processes] for i in range(n_processes)]
+    start = time.perf_counter()
+    pages_exceptions = {}
+    # Spawned processes, forking a process that imported streamlit is not safe
+    try:
+        with ProcessPoolExecutor(max_workers=n_processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [
+                executor.submit(_render_pages, data_folder, snapshot_path, countries_chunk, worker_id == 0, header)
+                for worker_id, countries_chunk in enumerate(countries_chunks)
+            ]
+            for future in futures:
+                pages_exceptions.update(future.result())
+    except Exception:
+        # The partial snapshot is never pointed to, it is removed straight away
+        shutil.rmtree(snapshot_path, ignore_errors=True)
+        raise
+
+    pages_status = {}
+    for page_file_name, exceptions in pages_exceptions.items():
+        for exception in exceptions:
+            print(f"{page_file_name} not rendered, the app raised: {exception}")
+        pages_status[page_file_name] = "failed" if exceptions else "rendered"
+
+    if "rendered" not in pages_status.values():
+        shutil.rmtree(snapshot_path, ignore_errors=True)
+        raise RuntimeError("No page could be rendered, the current snapshot is kept")
+
+    # The pages failing with the new data keep their previous version rather than disappearing from the snapshot
+    failed_pages = [page_file_name for page_file_name, status in pages_status.items() if status == "failed"]
+    for page_file_name in _copy_previous_pages(output_folder, snapshot_path, failed_pages):
+        print(f"{page_file_name} copied from the current snapshot")
+        pages_status[page_file_name] = "copied"
+
+    pages_titles = {"global_overview.html": "Global Overview"}
+    pages_titles.update({_get_country_file_name(country): f"{country} Country Profile" for country in countries})
+    written_pages = {
+        page_file_name: title
+        for page_file_name, title in pages_titles.items()
+        if pages_status.get(page_file_name) in ("rendered", "copied")
+    }
+    _write_index_page(snapshot_path, written_pages, header)
+    with open(os.path.join(snapshot_path, snapshot_infos_file_name), "w") as f:
+        json.dump(
+            {
+                "published_snapshot": published_snapshot_name,
+                "rendered_time": datetime.now().isoformat(timespec="seconds"),
+                "pages": pages_status,
+            },
+            f,
+            indent=4,
+        )
+    _switch_current_snapshot(output_folder, snapshot_name)
+
+    n_rendered_pages = len(pages_exceptions) - len(failed_pages)
+    print(f"Rendered {n_rendered_pages} pages in {time.perf_counter() - start:.1f}s into {snapshot_path}")
+    return snapshot_name
+
+
+if __name__ == "__main__":
+    args = argparse.ArgumentParser()
+    args.add_argument("--data_folder", type=str, default=os.getenv("CPAOR_DATA_FOLDER", "/data"))
+    args.add_argument("--output_folder", type=str, default=None)
+    args.add_argument("--countries", type=str, nargs="+", default=None)
+    args.add_argument("--processes", type=int, default=os.cpu_count())
+    args.add_argument("--force", action="store_true")
+    args.add_argument("--watch", type=float, default=None)
+
+    parsed_args = args.parse_args()
+
+    output_folder = parsed_args.output_folder or os.path.join(parsed_args.data_folder, "static_snapshots")
+    os.makedirs(output_folder, exist_ok=True)
+
+    while True:
+        countries = parsed_args.countries
+        if countries is None:
+            countries = pd.read_csv(os.path.join(parsed_args.data_folder, "report_countries.csv"), header=None)[0].tolist()
+
+        try:
+            _render_static_snapshots(
+                parsed_args.data_folder, output_folder, countries, parsed_args.processes, parsed_args.force
+            )
+        except Exception as e:
+            if parsed_args.watch is None:
+                raise
+            print(f"Static snapshots rendering failed: {e}", file=sys.stderr)
+
+        if parsed_args.watch is None:
+            break
+        time.sleep(parsed_args.watch)